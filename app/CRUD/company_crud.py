@@ -1,7 +1,8 @@
 from typing import Sequence
 from fastapi import HTTPException
 from pydantic import BaseModel
-from sqlalchemy import update, select, insert
+from sqlalchemy import update, select, delete
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import and_
 from app.db.models.company_model import CompanyModel
@@ -25,6 +26,18 @@ class CompanyCrud(CrudRepository):
     async def delete_by_owner(
         self, id_: int, user_id: int, db: AsyncSession
     ) -> CompanyModel:
+        # Loaded before the DELETE: afterwards ON DELETE CASCADE has already
+        # removed the members the selectin relationship would load.
+        res = await self.check_owner(id_=id_, user_id=user_id, db=db)
+        await db.execute(delete(self.model).where(self.model.id == id_))
+        await db.commit()
+        return res
+
+    async def check_owner(
+        self, id_: int, user_id: int, db: AsyncSession
+    ) -> CompanyModel:
+        """Return the company if ``user_id`` owns it; also explains why a
+        write filtered on id and owner matched no row."""
         res = await self.get_one(id_=id_, db=db)
         if res is None:
             raise HTTPException(
@@ -36,24 +49,26 @@ class CompanyCrud(CrudRepository):
                 status_code=403,
                 detail="You do not own this company",
             )
-        res = self.delete(db=db, id_=id_)
         return res
 
     async def add(self, data: BaseModel, db: AsyncSession) -> CompanyModel:
-        res = await self.get_one(id_=data.id, db=db)
-        if res:
-            raise HTTPException(
-                status_code=409, detail="Company with this ID already exists"
-            )
-        res = await self.get_one_by_filter(filters={"name": data.name}, db=db)
-        if res:
+        stmt = (
+            insert(self.model)
+            .values(**data.model_dump())
+            .on_conflict_do_nothing()
+            .returning(self.model)
+        )
+        res = await db.scalar(stmt)
+        if res is None:
+            await db.rollback()
+            if await self.get_one(id_=data.id, db=db):
+                raise HTTPException(
+                    status_code=409, detail="Company with this ID already exists"
+                )
             raise HTTPException(
                 status_code=409, detail="Company with this name already exists"
             )
-        stmt = insert(self.model).values(**data.model_dump())
-        await db.execute(stmt)
         await db.commit()
-        res = await self.get_one(id_=data.id, db=db)
         return res
 
     async def update(
@@ -65,25 +80,17 @@ class CompanyCrud(CrudRepository):
                 raise HTTPException(
                     status_code=409, detail="Company with this name already exists"
                 )
-        res = await self.get_one(db=db, id_=id_)
-        if res is None:
-            raise HTTPException(
-                status_code=404,
-                detail="Company does not exist",
-            )
-        if user_id != res.owner_id:
-            raise HTTPException(
-                status_code=403,
-                detail="You do not own this company",
-            )
         stmt = (
             update(self.model)
             .values(data.model_dump(exclude_unset=True))
-            .where(self.model.id == id_)
+            .where(and_(self.model.id == id_, self.model.owner_id == user_id))
+            .returning(self.model)
+            .execution_options(populate_existing=True)
         )
-        await db.execute(stmt)
+        res = await db.scalar(stmt)
+        if res is None:
+            await self.check_owner(id_=id_, user_id=user_id, db=db)
         await db.commit()
-        res = await self.get_one(db=db, id_=id_)
         return res
 
 
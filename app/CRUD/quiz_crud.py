@@ -1,5 +1,5 @@
-from typing import Sequence
-from sqlalchemy import select
+from typing import Optional, Sequence
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models.quiz_model import QuizModel
 from app.repositories.crud_repository import CrudRepository
@@ -12,5 +12,26 @@ class QuizCrud(CrudRepository):
         result = await db.scalars(select(self.model).limit(limit).offset(offset))
         return result.all()
 
+    async def get_one_by_name(
+        self, company_id: int, name: str, db: AsyncSession
+    ) -> Optional[QuizModel]:
+        """Served by ix_quiz_company_id_name; names are not unique, so the
+        oldest quiz wins."""
+        return await db.scalar(
+            select(self.model)
+            .where(self.model.company_id == company_id, self.model.name == name)
+            .order_by(self.model.id)
+            .limit(1)
+        )
+
+    async def increment_pass_count(self, quiz_id: int, db: AsyncSession) -> None:
+        """Row-level increment, safe under concurrent submissions; the caller
+        commits."""
+        await db.execute(
+            update(self.model)
+            .where(self.model.id == quiz_id)
+            .values(pass_count=func.coalesce(self.model.pass_count, 0) + 1)
+        )
+
 
 quiz_crud = QuizCrud(QuizModel)
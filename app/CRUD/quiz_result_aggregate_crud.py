@@ -0,0 +1,147 @@
+from sqlalchemy import delete, exists, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models.quiz_result_aggregate_model import QuizResultAggregateModel
+from app.db.models.quiz_result_model import QuizResultModel
+from app.repositories.crud_repository import CrudRepository
+
+AGGREGATE_COLUMNS = [
+    "company_id",
+    "user_id",
+    "quiz_id",
+    "attempts",
+    "score_sum",
+    "first_attempt",
+    "last_attempt",
+]
+# score_sum is a float maintained incrementally; recomputing it can differ in
+# the last bits without the row having drifted.
+SCORE_TOLERANCE = 1e-6
+
+
+class QuizResultAggregateCrud(CrudRepository):
+    """Maintains quiz_result_aggregate. None of the methods commit."""
+
+    async def record(self, result: dict, db: AsyncSession) -> None:
+        """Fold one newly inserted quiz result into its rollup row."""
+        stmt = pg_insert(self.model).values(
+            company_id=result["company_id"],
+            user_id=result["user_id"],
+            quiz_id=result["quiz_id"],
+            attempts=1,
+            score_sum=result["score"],
+            first_attempt=result["registration_date"],
+            last_attempt=result["registration_date"],
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                self.model.company_id,
+                self.model.user_id,
+                self.model.quiz_id,
+            ],
+            set_={
+                "attempts": self.model.attempts + 1,
+                "score_sum": self.model.score_sum + stmt.excluded.score_sum,
+                "first_attempt": func.least(
+                    self.model.first_attempt, stmt.excluded.first_attempt
+                ),
+                "last_attempt": func.greatest(
+                    self.model.last_attempt, stmt.excluded.last_attempt
+                ),
+            },
+        )
+        await db.execute(stmt)
+
+    @staticmethod
+    def _rollup(*filters):
+        return (
+            select(
+                QuizResultModel.company_id,
+                QuizResultModel.user_id,
+                QuizResultModel.quiz_id,
+                func.count(QuizResultModel.id),
+                func.sum(QuizResultModel.score),
+                func.min(QuizResultModel.registration_date),
+                func.max(QuizResultModel.registration_date),
+            )
+            .where(*filters)
+            .group_by(
+                QuizResultModel.company_id,
+                QuizResultModel.user_id,
+                QuizResultModel.quiz_id,
+            )
+        )
+
+    async def refresh(
+        self, company_id: int, user_id: int, quiz_id: int, db: AsyncSession
+    ) -> None:
+        """Recompute one rollup row from quiz_result, e.g. after a deletion."""
+        await db.execute(
+            delete(self.model).where(
+                self.model.company_id == company_id,
+                self.model.user_id == user_id,
+                self.model.quiz_id == quiz_id,
+            )
+        )
+        await db.execute(
+            insert(self.model).from_select(
+                AGGREGATE_COLUMNS,
+                self._rollup(
+                    QuizResultModel.company_id == company_id,
+                    QuizResultModel.user_id == user_id,
+                    QuizResultModel.quiz_id == quiz_id,
+                ),
+            )
+        )
+
+    async def reconcile(self, company_id: int, db: AsyncSession) -> int:
+        """Correct the company's rollup rows that drifted from quiz_result and
+        drop the ones left without results; returns the rows changed.
+
+        The company's rows are locked first, so pass_quiz writes already in
+        flight are committed before the rollup is read and later ones wait
+        for this transaction, which callers keep to one company.
+        """
+        await db.execute(
+            select(self.model.company_id)
+            .where(self.model.company_id == company_id)
+            .with_for_update()
+        )
+        stmt = pg_insert(self.model).from_select(
+            AGGREGATE_COLUMNS, self._rollup(QuizResultModel.company_id == company_id)
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                self.model.company_id,
+                self.model.user_id,
+                self.model.quiz_id,
+            ],
+            set_={
+                "attempts": stmt.excluded.attempts,
+                "score_sum": stmt.excluded.score_sum,
+                "first_attempt": stmt.excluded.first_attempt,
+                "last_attempt": stmt.excluded.last_attempt,
+            },
+            where=or_(
+                self.model.attempts != stmt.excluded.attempts,
+                func.abs(self.model.score_sum - stmt.excluded.score_sum)
+                > SCORE_TOLERANCE,
+                self.model.first_attempt.is_distinct_from(stmt.excluded.first_attempt),
+                self.model.last_attempt.is_distinct_from(stmt.excluded.last_attempt),
+            ),
+        )
+        upserted = (await db.execute(stmt)).rowcount
+        orphaned = await db.execute(
+            delete(self.model).where(
+                self.model.company_id == company_id,
+                ~exists().where(
+                    QuizResultModel.company_id == self.model.company_id,
+                    QuizResultModel.user_id == self.model.user_id,
+                    QuizResultModel.quiz_id == self.model.quiz_id,
+                ),
+            )
+        )
+        return upserted + orphaned.rowcount
+
+
+quiz_result_aggregate_crud = QuizResultAggregateCrud(QuizResultAggregateModel)
@@ -1,9 +1,55 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.CRUD.quiz_result_aggregate_crud import quiz_result_aggregate_crud
+from app.CRUD.quiz_crud import quiz_crud
+from app.CRUD.quiz_result_daily_crud import quiz_result_daily_crud
 from app.db.models.quiz_result_model import QuizResultModel
 from app.repositories.crud_repository import CrudRepository
 
 
 class QuizResultCrud(CrudRepository):
-    pass
+    async def add(self, data: BaseModel, db: AsyncSession) -> Optional[QuizResultModel]:
+        """Store the result, its rollups and the quiz pass count in one
+        transaction. Returns None if a result with that id already exists."""
+        values = {**data.model_dump(), "registration_date": datetime.utcnow()}
+        stmt = (
+            insert(self.model)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[self.model.id])
+            .returning(self.model)
+        )
+        res = await db.scalar(stmt)
+        if res is None:
+            await db.rollback()
+            return None
+        await quiz_result_aggregate_crud.record(result=values, db=db)
+        await quiz_result_daily_crud.record(result=values, db=db)
+        await quiz_crud.increment_pass_count(quiz_id=values["quiz_id"], db=db)
+        await db.commit()
+        return res
+
+    async def delete(self, id_: int, db: AsyncSession) -> Optional[QuizResultModel]:
+        res = await self.get_one(id_=id_, db=db)
+        if res is None:
+            return None
+        await db.execute(delete(self.model).where(self.model.id == id_))
+        await quiz_result_aggregate_crud.refresh(
+            company_id=res.company_id, user_id=res.user_id, quiz_id=res.quiz_id, db=db
+        )
+        if res.registration_date is not None:
+            await quiz_result_daily_crud.refresh(
+                company_id=res.company_id,
+                user_id=res.user_id,
+                quiz_id=res.quiz_id,
+                day=res.registration_date.date(),
+                db=db,
+            )
+        await db.commit()
+        return res
 
 
 quiz_result_crud = QuizResultCrud(QuizResultModel)
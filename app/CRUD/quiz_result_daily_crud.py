@@ -0,0 +1,133 @@
+from datetime import date
+from sqlalchemy import Date, cast, delete, exists, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.CRUD.quiz_result_aggregate_crud import SCORE_TOLERANCE
+from app.db.models.quiz_result_daily_model import QuizResultDailyModel
+from app.db.models.quiz_result_model import QuizResultModel
+from app.repositories.crud_repository import CrudRepository
+
+DAILY_COLUMNS = ["company_id", "user_id", "quiz_id", "day", "attempts", "score_sum"]
+
+
+class QuizResultDailyCrud(CrudRepository):
+    """Maintains quiz_result_daily. None of the methods commit."""
+
+    async def record(self, result: dict, db: AsyncSession) -> None:
+        """Fold one newly inserted quiz result into its daily bucket."""
+        stmt = pg_insert(self.model).values(
+            company_id=result["company_id"],
+            user_id=result["user_id"],
+            quiz_id=result["quiz_id"],
+            day=result["registration_date"].date(),
+            attempts=1,
+            score_sum=result["score"],
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                self.model.company_id,
+                self.model.user_id,
+                self.model.quiz_id,
+                self.model.day,
+            ],
+            set_={
+                "attempts": self.model.attempts + 1,
+                "score_sum": self.model.score_sum + stmt.excluded.score_sum,
+            },
+        )
+        await db.execute(stmt)
+
+    @staticmethod
+    def _rollup(*filters):
+        day = cast(QuizResultModel.registration_date, Date)
+        return (
+            select(
+                QuizResultModel.company_id,
+                QuizResultModel.user_id,
+                QuizResultModel.quiz_id,
+                day,
+                func.count(QuizResultModel.id),
+                func.sum(QuizResultModel.score),
+            )
+            .where(QuizResultModel.registration_date.is_not(None), *filters)
+            .group_by(
+                QuizResultModel.company_id,
+                QuizResultModel.user_id,
+                QuizResultModel.quiz_id,
+                day,
+            )
+        )
+
+    async def refresh(
+        self, company_id: int, user_id: int, quiz_id: int, day: date, db: AsyncSession
+    ) -> None:
+        """Recompute one daily bucket from quiz_result, e.g. after a deletion."""
+        await db.execute(
+            delete(self.model).where(
+                self.model.company_id == company_id,
+                self.model.user_id == user_id,
+                self.model.quiz_id == quiz_id,
+                self.model.day == day,
+            )
+        )
+        await db.execute(
+            insert(self.model).from_select(
+                DAILY_COLUMNS,
+                self._rollup(
+                    QuizResultModel.company_id == company_id,
+                    QuizResultModel.user_id == user_id,
+                    QuizResultModel.quiz_id == quiz_id,
+                    cast(QuizResultModel.registration_date, Date) == day,
+                ),
+            )
+        )
+
+    async def reconcile(self, company_id: int, db: AsyncSession) -> int:
+        """Correct the company's daily buckets that drifted from quiz_result
+        and drop the ones left without results; returns the rows changed.
+
+        Locks the company's buckets first, like
+        QuizResultAggregateCrud.reconcile, so concurrent pass_quiz increments
+        are not overwritten.
+        """
+        await db.execute(
+            select(self.model.company_id)
+            .where(self.model.company_id == company_id)
+            .with_for_update()
+        )
+        stmt = pg_insert(self.model).from_select(
+            DAILY_COLUMNS, self._rollup(QuizResultModel.company_id == company_id)
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                self.model.company_id,
+                self.model.user_id,
+                self.model.quiz_id,
+                self.model.day,
+            ],
+            set_={
+                "attempts": stmt.excluded.attempts,
+                "score_sum": stmt.excluded.score_sum,
+            },
+            where=or_(
+                self.model.attempts != stmt.excluded.attempts,
+                func.abs(self.model.score_sum - stmt.excluded.score_sum)
+                > SCORE_TOLERANCE,
+            ),
+        )
+        upserted = (await db.execute(stmt)).rowcount
+        orphaned = await db.execute(
+            delete(self.model).where(
+                self.model.company_id == company_id,
+                ~exists().where(
+                    QuizResultModel.company_id == self.model.company_id,
+                    QuizResultModel.user_id == self.model.user_id,
+                    QuizResultModel.quiz_id == self.model.quiz_id,
+                    cast(QuizResultModel.registration_date, Date) == self.model.day,
+                ),
+            )
+        )
+        return upserted + orphaned.rowcount
+
+
+quiz_result_daily_crud = QuizResultDailyCrud(QuizResultDailyModel)
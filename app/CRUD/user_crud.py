@@ -1,45 +1,31 @@
 import logging
-from typing import Sequence
+from typing import Optional
 from fastapi import HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select, update
+from sqlalchemy import update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models.user_model import UserModel
 from app.repositories.crud_repository import CrudRepository
 from app.schemas.schemas import UserCreateSchema
-from app.utils.deps import pwd_context
+from app.services.password_hasher import password_hasher
+from app.services.user_identity_cache import user_identity_cache
 
 logger = logging.getLogger(__name__)
 
 
 class UserCrud(CrudRepository):
-    async def get_all(
-        self, db: AsyncSession, skip: int = 0, limit: int = 10
-    ) -> Sequence:
-        query = select(self.model).offset(skip).limit(limit)
-        res = await db.scalars(query)
-        users = res.all()
-        if not users:
-            logger.info("No users found with the given parameters.")
-            raise HTTPException(status_code=404, detail="No users found")
-        logger.info(f"Retrieved {len(users)} users.")
-        return users
-
     async def add(self, data: UserCreateSchema, db: AsyncSession) -> UserModel:
         data = data.model_dump()
-        hashed_password = pwd_context.hash(data.pop("password"))
+        hashed_password = await password_hasher.hash(data.pop("password"))
         data["hashed_password"] = hashed_password
-        stmt = insert(self.model).values(**data)
+        stmt = insert(self.model).values(**data).returning(self.model)
 
         try:
-            await db.execute(stmt)
+            res = await db.scalar(stmt)
             await db.commit()
-            res = await self.get_one(id_=data["id"], db=db)
             if res is None:
-                logger.error(
-                    "Failed to add user: User retrieval after insertion failed."
-                )
+                logger.error("Failed to add user: INSERT returned no row.")
                 raise HTTPException(
                     status_code=500, detail="Something went wrong when adding a user"
                 )
@@ -55,17 +41,21 @@ class UserCrud(CrudRepository):
         res = await self.get_one(id_=id_, db=db)
         if res is None:
             raise HTTPException(status_code=404, detail="User was not found")
+        email = res.email
+        data = data.model_dump(exclude_none=True)
+        if "password" in data:
+            data["hashed_password"] = await password_hasher.hash(data.pop("password"))
         try:
-            data = data.model_dump(exclude_none=True)
-            if "password" in data:
-                data["hashed_password"] = pwd_context.hash(data.pop("password"))
-            stmt = update(self.model).values(**data).where(self.model.id == id_)
-            await db.execute(stmt)
-            if "id" in data:
-                res = await self.get_one(id_=data["id"], db=db)
-            else:
-                res = await self.get_one(id_=id_, db=db)
+            stmt = (
+                update(self.model)
+                .values(**data)
+                .where(self.model.id == id_)
+                .returning(self.model)
+                .execution_options(populate_existing=True)
+            )
+            res = await db.scalar(stmt)
             await db.commit()
+            await user_identity_cache.invalidate(user_id=id_, email=email)
             return res
         except Exception as e:
             logger.error(f"Error updating user: {e}")
@@ -73,5 +63,11 @@ class UserCrud(CrudRepository):
                 status_code=500, detail="Something went wrong while updating the user"
             )
 
+    async def delete(self, id_: int, db: AsyncSession) -> Optional[UserModel]:
+        res = await super().delete(id_=id_, db=db)
+        if res is not None:
+            await user_identity_cache.invalidate(user_id=id_, email=res.email)
+        return res
+
 
 user_crud = UserCrud(UserModel)
@@ -9,6 +9,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.db.models.user_model import UserModel
+from app.services.password_hasher import password_hasher
 from app.utils.deps import get_db
 
 bearer = HTTPBearer()
@@ -43,7 +44,7 @@ async def authenticate_user(password: str, username: str, db: AsyncSession):
     user = res.scalar()
     if not user:
         return False
-    if not pwd_context.verify(password, user.hashed_password):
+    if not await password_hasher.verify(password, user.hashed_password):
         return False
     return user
 
@@ -86,7 +87,7 @@ async def get_auth0_user(
     if user is None:
         new_user = UserModel(
             username="empty",
-            hashed_password=pwd_context.hash("empty"),
+            hashed_password=await password_hasher.hash("empty"),
             email=email,
             registration_date=datetime.utcnow(),
         )
@@ -1,8 +1,13 @@
 from celery import Celery
 from app.core.config import settings
 from celery.schedules import crontab
+from celery.signals import worker_process_init
+from sqlalchemy import select
+from app.CRUD.quiz_result_aggregate_crud import quiz_result_aggregate_crud
+from app.CRUD.quiz_result_daily_crud import quiz_result_daily_crud
+from app.db.models.company_model import CompanyModel
 from app.services.notification_service import notification_service
-from app.db.base import session
+from app.db.base import engine, session
 import asyncio
 
 app = Celery(
@@ -14,11 +19,16 @@ app = Celery(
 app.conf.timezone = "Europe/Kiev"
 app.conf.enable_utc = False
 app.conf.broker_connection_retry_on_startup = True
+app.conf.task_routes = {"app.celery_app.import_quiz_task": {"queue": "quiz_imports"}}
 app.conf.beat_schedule = {
     "task-at-midnight": {
         "task": "app.celery_app.pass_check_task",
         "schedule": crontab(minute=0, hour=0),
-    }
+    },
+    "reconcile-quiz-result-aggregates": {
+        "task": "app.celery_app.reconcile_quiz_result_aggregates_task",
+        "schedule": crontab(minute=0, hour=3),
+    },
 }
 
 
@@ -36,3 +46,65 @@ async def execute_pass_check():
         text = "Pass a new quiz please"
         result = await notification_service.pass_check(db=async_session, text=text)
         return result
+
+
+@app.task
+def reconcile_quiz_result_aggregates_task():
+    """Backfill or repair the quiz result rollups from the quiz_result history.
+
+    Run on demand with:
+        celery -A app.celery_app call app.celery_app.reconcile_quiz_result_aggregates_task
+    """
+    loop = asyncio.get_event_loop()
+    if loop.is_running():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(execute_reconcile_quiz_result_aggregates())
+
+
+async def execute_reconcile_quiz_result_aggregates():
+    # One short transaction per company, so pass_quiz writes to the rollups
+    # wait at most for the reconciliation of their own company.
+    async with session() as async_session:
+        company_ids = (await async_session.scalars(select(CompanyModel.id))).all()
+        rows = {"quiz_result_aggregate": 0, "quiz_result_daily": 0}
+        for company_id in company_ids:
+            rows["quiz_result_aggregate"] += await quiz_result_aggregate_crud.reconcile(
+                company_id=company_id, db=async_session
+            )
+            await async_session.commit()
+            rows["quiz_result_daily"] += await quiz_result_daily_crud.reconcile(
+                company_id=company_id, db=async_session
+            )
+            await async_session.commit()
+        return rows
+
+
+@worker_process_init.connect
+def reset_connection_pools(**kwargs):
+    # Forked pool workers must not reuse connections inherited from the parent.
+    engine.sync_engine.dispose(close=False)
+
+
+@app.task
+def import_quiz_task(job_id: str):
+    """Parse and upsert an uploaded quiz workbook.
+
+    Routed to the quiz_imports queue so imports run on their own workers,
+    in parallel, without delaying the scheduled tasks.
+    """
+    loop = asyncio.get_event_loop()
+    if loop.is_running():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(execute_quiz_import(job_id))
+
+
+async def execute_quiz_import(job_id: str):
+    # Imported here: the job service enqueues this task, so it imports this
+    # module.
+    from app.services.quiz_import_job_service import quiz_import_job_service
+
+    async with session() as async_session:
+        job = await quiz_import_job_service.run(job_id=job_id, db=async_session)
+        return job.status if job is not None else None
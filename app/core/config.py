@@ -1,3 +1,4 @@
+from typing import Literal
 import dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -5,6 +6,8 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     uvicorn_host: str
     uvicorn_port: int
+    web_concurrency: int = 0
+    graceful_shutdown_timeout: int = 30
 
     postgres_host: str
     postgres_port: int
@@ -12,9 +15,46 @@ class Settings(BaseSettings):
     postgres_password: str
     postgres_user: str
 
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_pgbouncer: bool = False
+    query_budget: int = 20
+
     redis_host: str
     redis_port: int
     redis_password: str
+    redis_max_connections: int = 50
+    redis_pool_timeout: float = 5.0
+    redis_socket_timeout: float = 5.0
+    redis_socket_connect_timeout: float = 2.0
+    redis_health_check_interval: int = 30
+
+    answer_key_cache_size: int = 1024
+    answer_key_cache_ttl: int = 86400
+
+    quiz_import_max_bytes: int = 10 * 1024 * 1024
+    quiz_import_max_rows: int = 50000
+    quiz_import_job_ttl: int = 86400
+
+    user_cache_size: int = 10000
+    user_cache_ttl: int = 30
+    user_cache_redis: bool = False
+
+    password_hash_workers: int = 4
+    password_hash_queue_limit: int = 64
+
+    log_level: str = "INFO"
+    log_levels: dict[str, str] = {"sqlalchemy.engine": "WARNING"}
+    log_sample_rates: dict[str, float] = {}
+    log_json: bool = True
+    log_file: str = "app.log"
+    log_rotation: Literal["size", "time"] = "size"
+    log_max_bytes: int = 10 * 1024 * 1024
+    log_rotation_when: str = "midnight"
+    log_backup_count: int = 5
 
     algorithm: str
     secret: str
@@ -8,3 +8,5 @@ from app.db.models.invitation_model import InvitationModel
 from app.db.models.option_model import OptionModel
 from app.db.models.question_model import QuestionModel
 from app.db.models.quiz_model import QuizModel
+from app.db.models.quiz_result_aggregate_model import QuizResultAggregateModel
+from app.db.models.quiz_result_daily_model import QuizResultDailyModel
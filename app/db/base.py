@@ -1,20 +1,62 @@
 import redis.asyncio as redis
-import logging
+from uuid import uuid4
 from sqlalchemy import MetaData
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
+from app.db.pool import TimedAsyncQueuePool
 
 
-logger = logging.getLogger("sqlalchemy.engine")
-logger.setLevel(logging.INFO)
-
 metadata = MetaData()
 Base = declarative_base(metadata=metadata)
-engine = create_async_engine(settings.postgres_url)
+
+
+def engine_options() -> dict:
+    options = {
+        "poolclass": TimedAsyncQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    if settings.db_pgbouncer:
+        # PgBouncer in transaction mode hands each transaction a different
+        # server connection, so asyncpg must not rely on named prepared
+        # statements surviving between them.
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return options
+
+
+engine = create_async_engine(settings.postgres_url, **engine_options())
 session = async_sessionmaker(engine, expire_on_commit=False)
 
 
-def redis_connect():
-    redis_conn = redis.Redis(host=settings.redis_host, port=settings.redis_port)
-    return redis_conn
+# Connections are opened lazily on first use, so the pool can be shared by
+# the service singletons built at import time; main.lifespan closes it.
+redis_pool = redis.BlockingConnectionPool(
+    host=settings.redis_host,
+    port=settings.redis_port,
+    max_connections=settings.redis_max_connections,
+    timeout=settings.redis_pool_timeout,
+    socket_timeout=settings.redis_socket_timeout,
+    socket_connect_timeout=settings.redis_socket_connect_timeout,
+    health_check_interval=settings.redis_health_check_interval,
+)
+
+
+def redis_connect() -> redis.Redis:
+    return redis.Redis(connection_pool=redis_pool)
+
+
+def redis_pool_stats() -> dict:
+    return {
+        "max_connections": redis_pool.max_connections,
+        "in_use": len(redis_pool._in_use_connections),
+        "idle": len(redis_pool._available_connections),
+        "timeout": redis_pool.timeout,
+    }
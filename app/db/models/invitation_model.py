@@ -10,11 +10,13 @@ class InvitationModel(Base):
         Integer,
         ForeignKey("company.id", onupdate="CASCADE", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     recipient_id = Column(
         Integer,
         ForeignKey("user.id", onupdate="CASCADE", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     invitation_text = Column(String)
     registration_date = Column(DateTime, default=datetime.utcnow)
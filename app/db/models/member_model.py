@@ -14,6 +14,7 @@ class MemberModel(Base):
         Integer,
         ForeignKey("company.id", onupdate="CASCADE", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     role = Column(String, nullable=False, default="member")
     registration_date = Column(DateTime, default=datetime.utcnow)
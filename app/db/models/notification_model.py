@@ -1,11 +1,12 @@
 from datetime import datetime
 from app.db.base import Base
-from sqlalchemy import Column, Integer, ForeignKey, Boolean, String, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, Boolean, String, DateTime, Index
 from sqlalchemy.orm import relationship
 
 
 class NotificationModel(Base):
     __tablename__ = "notification"
+    __table_args__ = (Index("ix_notification_user_id_id", "user_id", "id"),)
     id = Column(Integer, primary_key=True)
     user_id = Column(
         Integer,
@@ -12,5 +12,6 @@ class OptionModel(Base):
         Integer,
         ForeignKey("question.id", onupdate="CASCADE", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     question = relationship("QuestionModel", back_populates="options", lazy="selectin")
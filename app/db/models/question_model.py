@@ -11,11 +11,13 @@ class QuestionModel(Base):
         Integer,
         ForeignKey("quiz.id", onupdate="CASCADE", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     options = relationship(
         "OptionModel",
         back_populates="question",
         cascade="all, delete-orphan",
         lazy="selectin",
+        order_by="OptionModel.id",
     )
     quizzes = relationship("QuizModel", back_populates="questions")
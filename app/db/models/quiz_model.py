@@ -1,11 +1,12 @@
 from datetime import datetime
 from app.db.base import Base
-from sqlalchemy import Column, Integer, ForeignKey, String, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, Index
 from sqlalchemy.orm import relationship
 
 
 class QuizModel(Base):
     __tablename__ = "quiz"
+    __table_args__ = (Index("ix_quiz_company_id_name", "company_id", "name"),)
     id = Column(Integer, primary_key=True)
     company_id = Column(
         Integer, ForeignKey("company.id", onupdate="CASCADE", ondelete="CASCADE")
@@ -17,6 +18,7 @@ class QuizModel(Base):
         back_populates="quizzes",
         cascade="all, delete-orphan",
         lazy="selectin",
+        order_by="QuestionModel.id",
     )
     pass_count = Column(Integer, default=0)
     registration_date = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,28 @@
+from app.db.base import Base
+from sqlalchemy import Column, Integer, ForeignKey, Float, DateTime, Index
+
+
+class QuizResultAggregateModel(Base):
+    """Per (company, user, quiz) rollup of quiz_result, see QuizResultCrud."""
+
+    __tablename__ = "quiz_result_aggregate"
+    __table_args__ = (Index("ix_quiz_result_aggregate_user_id", "user_id"),)
+    company_id = Column(
+        Integer,
+        ForeignKey("company.id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_id = Column(
+        Integer,
+        ForeignKey("user.id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    quiz_id = Column(
+        Integer,
+        ForeignKey("quiz.id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    attempts = Column(Integer, nullable=False)
+    score_sum = Column(Float, nullable=False)
+    first_attempt = Column(DateTime)
+    last_attempt = Column(DateTime)
@@ -0,0 +1,30 @@
+from app.db.base import Base
+from sqlalchemy import Column, Integer, ForeignKey, Float, Date, Index
+
+
+class QuizResultDailyModel(Base):
+    """Per (company, user, quiz, day) rollup of quiz_result, see QuizResultCrud."""
+
+    __tablename__ = "quiz_result_daily"
+    __table_args__ = (
+        Index("ix_quiz_result_daily_company_id_day", "company_id", "day"),
+        Index("ix_quiz_result_daily_user_id_day", "user_id", "day"),
+    )
+    company_id = Column(
+        Integer,
+        ForeignKey("company.id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_id = Column(
+        Integer,
+        ForeignKey("user.id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    quiz_id = Column(
+        Integer,
+        ForeignKey("quiz.id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day = Column(Date, primary_key=True)
+    attempts = Column(Integer, nullable=False)
+    score_sum = Column(Float, nullable=False)
@@ -1,11 +1,25 @@
 from datetime import datetime
 from app.db.base import Base
-from sqlalchemy import Column, Integer, ForeignKey, Float, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, Float, DateTime, Index, text
 from sqlalchemy.orm import relationship
 
 
 class QuizResultModel(Base):
     __tablename__ = "quiz_result"
+    __table_args__ = (
+        Index(
+            "ix_quiz_result_company_id_registration_date",
+            "company_id",
+            "registration_date",
+        ),
+        Index(
+            "ix_quiz_result_user_id_quiz_id_registration_date",
+            "user_id",
+            "quiz_id",
+            text("registration_date DESC"),
+        ),
+        Index("ix_quiz_result_quiz_id", "quiz_id"),
+    )
     id = Column(Integer, primary_key=True)
     user_id = Column(
         Integer,
@@ -10,11 +10,13 @@ class RequestModel(Base):
         Integer,
         ForeignKey("company.id", onupdate="CASCADE", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     sender_id = Column(
         Integer,
         ForeignKey("user.id", onupdate="CASCADE", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     request_text = Column(String)
     registration_date = Column(DateTime, default=datetime.utcnow)
@@ -1,7 +1,9 @@
 import logging
+from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI
 from app.core.config import settings
+from app.db.base import engine, redis_pool
 from app.routers.company_router import company_router
 from app.routers.invitation_router import invitation_router
 from app.routers.member_router import member_router
@@ -15,11 +17,25 @@ from app.routers.token_router import token_router
 from app.routers.user_router import user_router
 from app.routers.health_check_router import health_check_router
 from app.routers.db_check_router import db_check_router
-from logging_config import LOGGING_CONFIG
+from app.routers.metrics_router import metrics_router
+from app.utils.metrics import MetricsMiddleware
+from app.utils.query_counter import QueryCountMiddleware
+from logging_config import setup_logging
 
-logging.config.dictConfig(LOGGING_CONFIG)
+setup_logging()
 logger = logging.getLogger(__name__)
-app = FastAPI()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await redis_pool.aclose()
+    await engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(QueryCountMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(db_check_router)
 app.include_router(health_check_router)
@@ -34,6 +50,7 @@ app.include_router(option_router)
 app.include_router(quiz_result_router)
 app.include_router(redis_router)
 app.include_router(notification_router)
+app.include_router(metrics_router)
 
 
 if __name__ == "__main__":
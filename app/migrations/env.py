@@ -6,9 +6,9 @@ from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from app.core.config import settings
 from app.db.base import metadata
-from logging_config import LOGGING_CONFIG
+from logging_config import setup_logging
 
-logging.config.dictConfig(LOGGING_CONFIG)
+setup_logging()
 logger = logging.getLogger("alembic.runtime.migration")
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,63 @@
+"""add secondary indexes
+
+Revision ID: 7c3e91d4a2b6
+Revises: 5f425248f5c0
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3e91d4a2b6"
+down_revision: Union[str, None] = "5f425248f5c0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    (
+        "ix_quiz_result_company_id_registration_date",
+        "quiz_result",
+        ["company_id", "registration_date"],
+    ),
+    (
+        "ix_quiz_result_user_id_quiz_id_registration_date",
+        "quiz_result",
+        ["user_id", "quiz_id", sa.text("registration_date DESC")],
+    ),
+    ("ix_quiz_result_quiz_id", "quiz_result", ["quiz_id"]),
+    ("ix_notification_user_id_id", "notification", ["user_id", "id"]),
+    ("ix_member_company_id", "member", ["company_id"]),
+    ("ix_question_quiz_id", "question", ["quiz_id"]),
+    ("ix_option_question_id", "option", ["question_id"]),
+    ("ix_request_company_id", "request", ["company_id"]),
+    ("ix_request_sender_id", "request", ["sender_id"]),
+    ("ix_invitation_company_id", "invitation", ["company_id"]),
+    ("ix_invitation_recipient_id", "invitation", ["recipient_id"]),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable while the indexes are built,
+    # but it cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
@@ -0,0 +1,63 @@
+"""add quiz_result_aggregate
+
+Revision ID: a4d8c2e71f05
+Revises: 7c3e91d4a2b6
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d8c2e71f05"
+down_revision: Union[str, None] = "7c3e91d4a2b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "quiz_result_aggregate",
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("quiz_id", sa.Integer(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.Float(), nullable=False),
+        sa.Column("first_attempt", sa.DateTime(), nullable=True),
+        sa.Column("last_attempt", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["company_id"], ["company.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["quiz_id"], ["quiz.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["user.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("company_id", "user_id", "quiz_id"),
+    )
+    op.create_index(
+        "ix_quiz_result_aggregate_user_id", "quiz_result_aggregate", ["user_id"]
+    )
+    op.execute(
+        """
+        INSERT INTO quiz_result_aggregate
+            (company_id, user_id, quiz_id, attempts, score_sum,
+             first_attempt, last_attempt)
+        SELECT company_id, user_id, quiz_id, count(id), sum(score),
+               min(registration_date), max(registration_date)
+        FROM quiz_result
+        GROUP BY company_id, user_id, quiz_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_quiz_result_aggregate_user_id", table_name="quiz_result_aggregate"
+    )
+    op.drop_table("quiz_result_aggregate")
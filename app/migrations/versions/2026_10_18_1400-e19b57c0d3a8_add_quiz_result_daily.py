@@ -0,0 +1,66 @@
+"""add quiz_result_daily
+
+Revision ID: e19b57c0d3a8
+Revises: a4d8c2e71f05
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e19b57c0d3a8"
+down_revision: Union[str, None] = "a4d8c2e71f05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "quiz_result_daily",
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("quiz_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["company_id"], ["company.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["quiz_id"], ["quiz.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["user.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("company_id", "user_id", "quiz_id", "day"),
+    )
+    op.create_index(
+        "ix_quiz_result_daily_company_id_day",
+        "quiz_result_daily",
+        ["company_id", "day"],
+    )
+    op.create_index(
+        "ix_quiz_result_daily_user_id_day", "quiz_result_daily", ["user_id", "day"]
+    )
+    op.execute(
+        """
+        INSERT INTO quiz_result_daily
+            (company_id, user_id, quiz_id, day, attempts, score_sum)
+        SELECT company_id, user_id, quiz_id, registration_date::date,
+               count(id), sum(score)
+        FROM quiz_result
+        WHERE registration_date IS NOT NULL
+        GROUP BY company_id, user_id, quiz_id, registration_date::date
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_quiz_result_daily_user_id_day", table_name="quiz_result_daily")
+    op.drop_index("ix_quiz_result_daily_company_id_day", table_name="quiz_result_daily")
+    op.drop_table("quiz_result_daily")
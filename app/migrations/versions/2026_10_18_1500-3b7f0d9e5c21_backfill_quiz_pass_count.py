@@ -0,0 +1,34 @@
+"""backfill quiz pass_count
+
+Revision ID: 3b7f0d9e5c21
+Revises: e19b57c0d3a8
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7f0d9e5c21"
+down_revision: Union[str, None] = "e19b57c0d3a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pass_count was never maintained before; start it from the stored results.
+    op.execute(
+        """
+        UPDATE quiz
+        SET pass_count = (
+            SELECT count(*) FROM quiz_result WHERE quiz_result.quiz_id = quiz.id
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,41 @@
+"""add quiz company_id name index
+
+Revision ID: 5d2a8f61c4e7
+Revises: 3b7f0d9e5c21
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2a8f61c4e7"
+down_revision: Union[str, None] = "3b7f0d9e5c21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently, like the other secondary indexes, so quizzes stay
+    # writable; this cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_quiz_company_id_name",
+            "quiz",
+            ["company_id", "name"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_quiz_company_id_name",
+            table_name="quiz",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -1,11 +1,19 @@
 import logging
-from typing import Sequence, Optional
-from sqlalchemy import select, update, delete, insert
+from typing import AsyncIterator, Iterator, Optional, Sequence
+from sqlalchemy import column, inspect, select, update, delete, insert, values
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# asyncpg refuses statements with more than 32767 bind parameters.
+MAX_BIND_PARAMS = 32000
+
+
+def chunked(items: Sequence, size: int) -> Iterator[Sequence]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
 
 class CrudRepository:
     def __init__(self, model):
@@ -20,30 +28,133 @@ class CrudRepository:
         return res
 
     async def add(self, data: BaseModel, db: AsyncSession) -> Optional:
-        stmt = insert(self.model).values(**data.model_dump())
-        await db.execute(stmt)
+        stmt = insert(self.model).values(**data.model_dump()).returning(self.model)
+        res = await db.scalar(stmt)
         await db.commit()
-        return await self.get_one(id_=data.id, db=db)
+        return res
+
+    async def add_many(
+        self, data: Sequence[BaseModel], db: AsyncSession, commit: bool = True
+    ) -> Sequence:
+        """Insert all rows with multi-row INSERT ... RETURNING; the models come
+        back in the order of ``data``."""
+        if not data:
+            return []
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        res = await db.scalars(stmt, [item.model_dump() for item in data])
+        items = res.all()
+        if commit:
+            await db.commit()
+        return items
+
+    async def insert_many(
+        self, rows: Sequence[dict], db: AsyncSession, return_ids: bool = False
+    ) -> list[int]:
+        """Insert plain column dicts without going through the unit of work.
+
+        With ``return_ids`` the rows go out as multi-row INSERT ... RETURNING id
+        and the new ids come back in the order of ``rows``; otherwise a single
+        executemany is used and nothing is returned. Never commits.
+        """
+        if not rows:
+            return []
+        table = self.model.__table__
+        stmt = insert(table)
+        if not return_ids:
+            await db.execute(stmt, rows)
+            return []
+        stmt = stmt.returning(table.c.id, sort_by_parameter_order=True)
+        res = await db.execute(stmt, rows)
+        return list(res.scalars().all())
 
     async def update(self, id_: int, data: BaseModel, db: AsyncSession) -> Optional:
         stmt = (
-            update(self.model).values(**data.model_dump()).where(self.model.id == id_)
+            update(self.model)
+            .values(**data.model_dump())
+            .where(self.model.id == id_)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
         )
-        result = await db.execute(stmt)
-        if result.rowcount == 0:
+        res = await db.scalar(stmt)
+        if res is None:
             return None
         await db.commit()
-        return await self.get_one(id_=id_, db=db)
+        return res
+
+    async def update_many(
+        self, data: Sequence[BaseModel], db: AsyncSession, commit: bool = True
+    ) -> Sequence:
+        """Update rows by id with one UPDATE ... FROM (VALUES ...) RETURNING.
+
+        Every item must dump the same fields, ``id`` included. Rows whose id
+        does not exist are skipped; the rest come back in no particular order.
+        """
+        if not data:
+            return []
+        rows = [item.model_dump() for item in data]
+        keys = list(rows[0])
+        table = self.model.__table__
+        items = []
+        for chunk in chunked(rows, MAX_BIND_PARAMS // len(keys)):
+            source = values(
+                *[column(key, table.c[key].type) for key in keys], name="source"
+            ).data([tuple(row[key] for key in keys) for row in chunk])
+            stmt = (
+                update(self.model)
+                .where(self.model.id == source.c.id)
+                .values({key: source.c[key] for key in keys if key != "id"})
+                .returning(self.model)
+                .execution_options(synchronize_session="fetch", populate_existing=True)
+            )
+            res = await db.scalars(stmt)
+            items.extend(res.all())
+        if commit:
+            await db.commit()
+        return items
+
+    def has_eager_relationships(self) -> bool:
+        return any(
+            rel.lazy in ("selectin", "joined", "subquery")
+            for rel in inspect(self.model).relationships
+        )
 
     async def delete(self, id_: int, db: AsyncSession) -> Optional:
-        res = await self.get_one(id_=id_, db=db)
-        if res is None:
-            return None
-        stmt = delete(self.model).where(self.model.id == id_)
-        await db.execute(stmt)
+        """Delete the row and return it as it was.
+
+        Eager relationships of a RETURNING row are loaded after the DELETE,
+        when ON DELETE CASCADE has already removed the children, so models
+        that have them are loaded with their children first.
+        """
+        if self.has_eager_relationships():
+            res = await self.get_one(id_=id_, db=db)
+            if res is None:
+                return None
+            await db.execute(delete(self.model).where(self.model.id == id_))
+        else:
+            stmt = delete(self.model).where(self.model.id == id_).returning(self.model)
+            res = await db.scalar(stmt)
+            if res is None:
+                return None
         await db.commit()
         return res
 
+    async def delete_many(
+        self, ids: Sequence[int], db: AsyncSession, commit: bool = True
+    ) -> int:
+        deleted = 0
+        for chunk in chunked(ids, MAX_BIND_PARAMS):
+            res = await db.execute(delete(self.model).where(self.model.id.in_(chunk)))
+            deleted += res.rowcount
+        if commit and deleted:
+            await db.commit()
+        return deleted
+
+    async def get_all_by_ids(self, ids: Sequence[int], db: AsyncSession) -> Sequence:
+        if not ids:
+            return []
+        res = await db.scalars(select(self.model).where(self.model.id.in_(ids)))
+        return res.all()
+
     async def get_one_by_filter(self, db: AsyncSession, filters: dict) -> Optional:
         query = select(self.model).filter_by(**filters)
         result = await db.scalar(query)
@@ -54,9 +165,39 @@ class CrudRepository:
         result = await db.scalars(stmt)
         return result.all()
 
+    async def get_page(
+        self,
+        db: AsyncSession,
+        limit: int,
+        after_id: Optional[int] = None,
+        filters: Optional[dict] = None,
+    ) -> tuple[Sequence, Optional[int]]:
+        """Return up to ``limit`` rows ordered by id and the id to resume after."""
+        stmt = select(self.model).filter_by(**(filters or {}))
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id)
+        res = await db.scalars(stmt.order_by(self.model.id).limit(limit + 1))
+        items = res.all()
+        if len(items) > limit:
+            return items[:limit], items[limit - 1].id
+        return items, None
+
+    async def stream_all(
+        self, db: AsyncSession, filters: Optional[dict] = None, chunk_size: int = 1000
+    ) -> AsyncIterator:
+        stmt = (
+            select(self.model)
+            .filter_by(**(filters or {}))
+            .order_by(self.model.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await db.stream_scalars(stmt)
+        async for item in result:
+            yield item
+
     async def delete_all_by_filters(self, db: AsyncSession, filters: dict) -> Sequence:
-        res = await self.get_all_by_filter(filters=filters, db=db)
-        stmt = delete(self.model).filter_by(**filters)
-        await db.execute(stmt)
+        stmt = delete(self.model).filter_by(**filters).returning(self.model)
+        res = await db.scalars(stmt)
+        items = res.all()
         await db.commit()
-        return res
+        return items
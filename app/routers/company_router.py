@@ -9,13 +9,18 @@ from app.schemas.schemas import (
     CompanyUpdateVisibility,
 )
 from app.utils.deps import get_db, get_current_user
+from app.utils.pagination import PageParams, paginate
 
 company_router = APIRouter(prefix="/company", tags=["Company"])
 
 
 @company_router.get("/visible")
-async def get_all_visible_companies(db: AsyncSession = Depends(get_db)):
-    return await company_crud.get_all_visible(db=db)
+async def get_all_visible_companies(
+    page: PageParams = Depends(), db: AsyncSession = Depends(get_db)
+):
+    return await paginate(
+        crud=company_crud, db=db, page=page, filters={"visible": True}
+    )
 
 
 @company_router.get("/visible/{id_}")
@@ -1,8 +1,12 @@
 import logging
+import os
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
-from app.db.base import redis_connect
+from sqlalchemy import text
+from app.db.base import redis_connect, redis_pool_stats
 from app.db.base import engine
+from app.services.password_hasher import password_hasher
+from app.services.user_identity_cache import user_identity_cache
 
 db_check_router = APIRouter(tags=["db_check"], prefix="/db_check")
 
@@ -10,7 +14,7 @@ db_check_router = APIRouter(tags=["db_check"], prefix="/db_check")
 @db_check_router.get("/redis_check")
 async def redis_check():
     try:
-        redis = await redis_connect()
+        redis = redis_connect()
         await redis.ping()
         return JSONResponse(
             content={"status": "Redis is up - Restart"}, status_code=200
@@ -25,7 +29,8 @@ async def redis_check():
 @db_check_router.get("/postgres_check")
 async def postgres_check():
     try:
-        await engine.connect()
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
         logging.info("Connection opened successfully.")
         return JSONResponse(content={"status": "Postgres is up"}, status_code=200)
     except Exception as e:
@@ -34,3 +39,23 @@ async def postgres_check():
             content={"status": "Postgres check failed", "error": str(e)},
             status_code=500,
         )
+
+
+@db_check_router.get("/pool")
+async def pool_stats():
+    return {"pid": os.getpid(), **engine.pool.stats()}
+
+
+@db_check_router.get("/redis_pool")
+async def redis_pool_check():
+    return {"pid": os.getpid(), **redis_pool_stats()}
+
+
+@db_check_router.get("/user_cache")
+async def user_cache_stats():
+    return user_identity_cache.stats()
+
+
+@db_check_router.get("/password_hasher")
+async def password_hasher_stats():
+    return password_hasher.stats()
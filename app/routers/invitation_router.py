@@ -5,27 +5,34 @@ from app.CRUD.invitation_crud import invitation_crud
 from app.schemas.schemas import InvitationCreateSchema
 from app.services.invitation_service import invitation_service
 from app.utils.deps import get_db, get_current_user
+from app.utils.pagination import PageParams, paginate
 
 invitation_router = APIRouter(prefix="/invitation", tags=["Invitation"])
 
 
 @invitation_router.get("/sent")
 async def get_user_sent_invitations(
-    db: AsyncSession = Depends(get_db), current_user=Depends(get_current_user)
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
 ):
-    return await invitation_crud.get_all_by_filter(
-        filters={"recipient_id": current_user.id}, db=db
+    return await paginate(
+        crud=invitation_crud,
+        db=db,
+        page=page,
+        filters={"recipient_id": current_user.id},
     )
 
 
 @invitation_router.get("/company/{company_id}/sent")
 async def get_owner_sent_invitations(
     company_id: int,
+    page: PageParams = Depends(),
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     return await invitation_service.owner_get_all_invitations(
-        user_id=current_user.id, company_id=company_id, db=db
+        user_id=current_user.id, company_id=company_id, page=page, db=db
     )
 
 
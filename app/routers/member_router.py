@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.CRUD.member_crud import member_crud
 from app.services.member_service import member_service
 from app.utils.deps import get_db, get_current_user
+from app.utils.pagination import PageParams, paginate
 
 member_router = APIRouter(tags=["Member"], prefix="/members")
 
@@ -26,18 +27,19 @@ async def get_users_in_company(
 
 
 @member_router.get("/")
-async def get_all(db: AsyncSession = Depends(get_db)):
-    return await member_crud.get_all(db=db)
+async def get_all(page: PageParams = Depends(), db: AsyncSession = Depends(get_db)):
+    return await paginate(crud=member_crud, db=db, page=page)
 
 
 @member_router.get("/company/{company_id}/admins")
 async def get_all_admins_in_company(
     company_id: int,
+    page: PageParams = Depends(),
     current_user=Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     return await member_service.get_all_admins_in_company(
-        db=db, user_id=current_user.id, company_id=company_id
+        db=db, user_id=current_user.id, company_id=company_id, page=page
     )
 
 
@@ -4,30 +4,36 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.CRUD.notification_crud import notification_crud
 from app.services.notification_service import notification_service
 from app.utils.deps import get_db, get_current_user
+from app.utils.pagination import PageParams, paginate
 
 notification_router = APIRouter(tags=["Notification"], prefix="/notifications")
 
 
 @notification_router.get("/user/all")
 async def get_user_all(
+    page: PageParams = Depends(),
     current_user=Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """ "Get notifications for current user"""
-    return await notification_crud.get_all_by_filter(
-        filters={"user_id": current_user.id}, db=db
+    return await paginate(
+        crud=notification_crud, db=db, page=page, filters={"user_id": current_user.id}
     )
 
 
 @notification_router.get("/")
-async def get_all_notifications(db: AsyncSession = Depends(get_db)):
-    return await notification_crud.get_all(db=db)
+async def get_all_notifications(
+    page: PageParams = Depends(), db: AsyncSession = Depends(get_db)
+):
+    return await paginate(crud=notification_crud, db=db, page=page)
 
 
 @notification_router.get("/user/{user_id}")
-async def get_user_notifications(user_id: int, db: AsyncSession = Depends(get_db)):
-    return await notification_crud.get_all_by_filter(
-        filters={"user_id": user_id}, db=db
+async def get_user_notifications(
+    user_id: int, page: PageParams = Depends(), db: AsyncSession = Depends(get_db)
+):
+    return await paginate(
+        crud=notification_crud, db=db, page=page, filters={"user_id": user_id}
     )
 
 
@@ -3,13 +3,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.CRUD.option_crud import option_crud
 from app.utils.deps import get_db
+from app.utils.pagination import PageParams, paginate
 
 option_router = APIRouter(tags=["Option"], prefix="/option")
 
 
 @option_router.get("/get_all")
-async def get_all(db: AsyncSession = Depends(get_db)):
-    return await option_crud.get_all(db=db)
+async def get_all(page: PageParams = Depends(), db: AsyncSession = Depends(get_db)):
+    return await paginate(crud=option_crud, db=db, page=page)
 
 
 @option_router.delete("/")
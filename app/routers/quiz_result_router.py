@@ -1,17 +1,27 @@
+from datetime import date
+from typing import Literal, Optional
 from fastapi import APIRouter
-from fastapi import Depends
+from fastapi import Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.CRUD.quiz_result_crud import quiz_result_crud
 from app.schemas.schemas import QuizResultCreateInSchema
 from app.services.quiz_result_service import quiz_result_service
 from app.utils.deps import get_db, get_current_user
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    PageParams,
+    paginate,
+)
 
 quiz_result_router = APIRouter(prefix="/quiz_result_router", tags=["Quiz_Result"])
 
 
 @quiz_result_router.get("/")
-async def get_all_quiz_results(db: AsyncSession = Depends(get_db)):
-    return await quiz_result_crud.get_all(db=db)
+async def get_all_quiz_results(
+    page: PageParams = Depends(), db: AsyncSession = Depends(get_db)
+):
+    return await paginate(crud=quiz_result_crud, db=db, page=page)
 
 
 @quiz_result_router.delete("/{id_}")
@@ -23,22 +33,24 @@ async def delete_quiz_result(id_: int, db: AsyncSession = Depends(get_db)):
 async def get_user_results_for_company(
     user_id: int,
     company_id: int,
+    page: PageParams = Depends(),
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     return await quiz_result_service.get_results_for_user(
-        id_=user_id, company_id=company_id, user_id=current_user.id, db=db
+        id_=user_id, company_id=company_id, user_id=current_user.id, page=page, db=db
     )
 
 
 @quiz_result_router.get("/company/{company_id}/results")
 async def get_all_company_results(
     company_id: int,
+    page: PageParams = Depends(),
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     return await quiz_result_service.get_all_company_results(
-        company_id=company_id, user_id=current_user.id, db=db
+        company_id=company_id, user_id=current_user.id, page=page, db=db
     )
 
 
@@ -102,11 +114,40 @@ async def get_quizzes_with_last_completion(
 @quiz_result_router.get("/company/{company_id}/results/last-week")
 async def get_company_results_last_week(
     company_id: int,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     return await quiz_result_service.get_company_results_last_week(
-        user_id=current_user.id, company_id=company_id, db=db
+        user_id=current_user.id,
+        company_id=company_id,
+        limit=limit,
+        cursor=cursor,
+        db=db,
+    )
+
+
+@quiz_result_router.get("/company/{company_id}/analytics")
+async def get_company_analytics(
+    company_id: int,
+    from_: date = Query(alias="from"),
+    to: date = Query(),
+    bucket: Literal["day", "week"] = "day",
+    user_id: Optional[int] = None,
+    quiz_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    return await quiz_result_service.get_company_analytics(
+        user_id=current_user.id,
+        company_id=company_id,
+        from_=from_,
+        to=to,
+        bucket=bucket,
+        id_=user_id,
+        quiz_id=quiz_id,
+        db=db,
     )
 
 
@@ -125,11 +166,17 @@ async def get_user_quiz_averages_last_week(
 @quiz_result_router.get("/company/{company_id}/users/last-attempt")
 async def get_all_company_users_last_attempt(
     company_id: int,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     return await quiz_result_service.get_all_company_users_last_attempt(
-        user_id=current_user.id, company_id=company_id, db=db
+        user_id=current_user.id,
+        company_id=company_id,
+        limit=limit,
+        cursor=cursor,
+        db=db,
     )
 
 
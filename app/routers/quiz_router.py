@@ -1,11 +1,13 @@
+import os
 from fastapi import APIRouter, Depends, UploadFile
-from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.CRUD.quiz_crud import quiz_crud
-from app.schemas.schemas import QuizCreateSchema
+from app.schemas.schemas import QuizCreateSchema, QuizImportJobSchema
+from app.services.quiz_import_job_service import quiz_import_job_service
 from app.services.quiz_service import quiz_service
 from app.utils.deps import get_db, get_current_user
 from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
 
 quiz_router = APIRouter(prefix="/quizzes", tags=["Quiz"])
 
@@ -34,7 +36,7 @@ async def delete_quiz(
     quiz_id: int,
     db: AsyncSession = Depends(get_db),
 ):
-    return await quiz_crud.delete(db=db, id_=quiz_id)
+    return await quiz_service.delete(db=db, id_=quiz_id)
 
 
 @quiz_router.post("/")
@@ -60,18 +62,26 @@ async def get_quiz(quiz_id: int, db: AsyncSession = Depends(get_db)):
     return quiz
 
 
-@quiz_router.post("/import_excel_quiz")
+@quiz_router.post("/import_excel_quiz", status_code=202)
 async def import_excel_quiz(
     file: UploadFile,
     company_id: int,
     user=Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-):
-    result = await quiz_service.parse_and_create_or_update_quiz_from_upload(
+) -> QuizImportJobSchema:
+    return await quiz_import_job_service.submit(
         file=file, db=db, company_id=company_id, user_id=user.id
     )
-    encoded_result = jsonable_encoder(result)
-    return encoded_result
+
+
+@quiz_router.get("/import_jobs/{job_id}")
+async def get_import_job(
+    job_id: str, user=Depends(get_current_user)
+) -> QuizImportJobSchema:
+    return await quiz_import_job_service.get(job_id=job_id, user_id=user.id)
+
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
 
 @quiz_router.post("/{id_}/export")
@@ -79,6 +89,24 @@ async def export_single_quiz_to_excel(id_: int, db: AsyncSession = Depends(get_d
     file_path = await quiz_service.export_single_quiz_to_excel(id_=id_, db=db)
     return FileResponse(
         file_path,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        filename="quiz_export.xlsx"
-    )
\ No newline at end of file
+        media_type=XLSX_MEDIA_TYPE,
+        filename=f"quiz_{id_}_export.xlsx",
+        background=BackgroundTask(os.unlink, file_path),
+    )
+
+
+@quiz_router.post("/company/{company_id}/export")
+async def export_company_quizzes_to_excel(
+    company_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    file_path = await quiz_service.export_company_quizzes_to_excel(
+        company_id=company_id, user_id=current_user.id, db=db
+    )
+    return FileResponse(
+        file_path,
+        media_type=XLSX_MEDIA_TYPE,
+        filename=f"company_{company_id}_quizzes.xlsx",
+        background=BackgroundTask(os.unlink, file_path),
+    )
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.redis_service import redis_service
 from app.utils.deps import get_current_user, get_db
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 redis_router = APIRouter(prefix="/redis", tags=["Redis"])
 
@@ -15,12 +17,13 @@ async def get_user_results_cache(current_user=Depends(get_current_user)):
 @redis_router.get("/admin/results/company")
 async def admin_get_all_cache_by_company_name(
     company_name: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     current_user=Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Admin get all cached results for a company by company name."""
+    """Admin get the latest cached results for a company by company name."""
     return await redis_service.admin_get_all_cache_by_company_id(
-        user_id=current_user.id, db=db, company_name=company_name
+        user_id=current_user.id, db=db, company_name=company_name, limit=limit
     )
 
 
@@ -28,12 +31,17 @@ async def admin_get_all_cache_by_company_name(
 async def admin_get_all_results_by_quiz_id(
     quiz_id: int,
     company_name: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     current_user=Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Admin get all cached results for a specific quiz by quiz ID and company name."""
+    """Admin get the latest cached results for a quiz by quiz ID and company name."""
     return await redis_service.admin_get_all_results_by_quiz_id(
-        user_id=current_user.id, quiz_id=quiz_id, company_name=company_name, db=db
+        user_id=current_user.id,
+        quiz_id=quiz_id,
+        company_name=company_name,
+        limit=limit,
+        db=db,
     )
 
 
@@ -46,13 +54,20 @@ async def export_user_results_to_csv(
     db: AsyncSession = Depends(get_db),
 ):
     """Export cached results for a specific user to CSV."""
-    return await redis_service.export_cached_results_for_one_user_to_csv(
+    rows = await redis_service.export_cached_results_for_one_user_to_csv(
         user_id=current_user.id,
         quiz_id=quiz_id,
         id_=id_,
         company_name=company_name,
         db=db,
     )
+    return StreamingResponse(
+        rows,
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f'attachment; filename="quiz_{quiz_id}_user_{id_}_results.csv"'
+        },
+    )
 
 
 @redis_router.get("/export/all/results/csv")
@@ -63,6 +78,13 @@ async def export_all_results_to_csv(
     db: AsyncSession = Depends(get_db),
 ):
     """Export all cached results for a specific quiz to CSV."""
-    return await redis_service.export_all_cached_results_to_csv(
+    rows = await redis_service.export_all_cached_results_to_csv(
         user_id=current_user.id, quiz_id=quiz_id, company_name=company_name, db=db
     )
+    return StreamingResponse(
+        rows,
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f'attachment; filename="quiz_{quiz_id}_results.csv"'
+        },
+    )
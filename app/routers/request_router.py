@@ -4,29 +4,33 @@ from app.CRUD.request_crud import request_crud
 from app.schemas.schemas import RequestCreateInSchema
 from app.services.request_service import request_service
 from app.utils.deps import get_db, get_current_user
+from app.utils.pagination import PageParams, paginate
 
 request_router = APIRouter(tags=["Request"], prefix="/request")
 
 
 @request_router.get("/sent")
 async def get_all_sent_requests(
-    db: AsyncSession = Depends(get_db), current_user=Depends(get_current_user)
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
 ):
     """Retrieve all requests sent by the current user."""
-    return await request_crud.get_all_by_filter(
-        db=db, filters={"sender_id": current_user.id}
+    return await paginate(
+        crud=request_crud, db=db, page=page, filters={"sender_id": current_user.id}
     )
 
 
 @request_router.get("/owner/requests")
 async def get_all_owner_requests(
     company_id: int,
+    page: PageParams = Depends(),
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Retrieve all requests sent within a company."""
     return await request_service.owner_get_all_requests(
-        user_id=current_user.id, company_id=company_id, db=db
+        user_id=current_user.id, company_id=company_id, page=page, db=db
     )
 
 
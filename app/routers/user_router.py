@@ -6,6 +6,7 @@ from app.CRUD.user_crud import user_crud
 from app.schemas.schemas import UserCreateSchema, UserUpdateInSchema
 from app.services.user_service import user_service
 from app.utils.deps import get_db, get_current_user
+from app.utils.pagination import PageParams, paginate
 
 user_router = APIRouter(prefix="/user", tags=["User"])
 
@@ -27,11 +28,9 @@ async def self_delete(
 
 
 @user_router.get("/")
-async def list_users(
-    db: AsyncSession = Depends(get_db), skip: int = 0, limit: int = 10
-):
+async def list_users(page: PageParams = Depends(), db: AsyncSession = Depends(get_db)):
     """Retrieve a paginated list of users."""
-    return await user_crud.get_all(db=db, skip=skip, limit=limit)
+    return await paginate(crud=user_crud, db=db, page=page)
 
 
 @user_router.get("/{user_id}")
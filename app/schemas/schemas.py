@@ -1,4 +1,5 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Literal, Optional, List, Set
 from pydantic import BaseModel, EmailStr
 
 
@@ -135,6 +136,61 @@ class QuizGetSchema(BaseModel):
         extra = "allow"
 
 
+class QuestionPatchSchema(BaseModel):
+    id: int
+    text: str
+
+
+class OptionPatchSchema(BaseModel):
+    id: int
+    text: str
+    is_correct: bool
+
+
+class QuizChangeSummarySchema(BaseModel):
+    quiz_updated: bool = False
+    questions_added: int = 0
+    questions_updated: int = 0
+    questions_deleted: int = 0
+    options_added: int = 0
+    options_updated: int = 0
+    options_deleted: int = 0
+
+
+class QuizUpdateResultSchema(BaseModel):
+    quiz: QuizGetSchema
+    changes: QuizChangeSummarySchema
+
+
+class QuizImportJobSchema(BaseModel):
+    id: str
+    status: Literal["queued", "parsing", "importing", "completed", "failed"]
+    company_id: int
+    user_id: int
+    filename: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    questions: int = 0
+    options: int = 0
+    quiz_id: Optional[int] = None
+    errors: List[str] = []
+
+
+class AnswerKeyQuestionSchema(BaseModel):
+    id: int
+    text: str
+    option_ids: Set[int]
+    correct_option_ids: Set[int]
+
+
+class QuizAnswerKeySchema(BaseModel):
+    quiz_id: int
+    company_id: int
+    name: str
+    description: str
+    questions: List[AnswerKeyQuestionSchema]
+
+
 class QuizResultCreateInSchema(BaseModel):
     id: int
     quiz_id: int
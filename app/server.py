@@ -0,0 +1,63 @@
+"""Production entry point: ``python -m app.server``.
+
+Runs ``app.main:app`` under uvicorn with one worker per available CPU, or
+WEB_CONCURRENCY workers when set. DB_POOL_SIZE, DB_MAX_OVERFLOW and
+REDIS_MAX_CONNECTIONS are read as budgets for the whole server and split
+between the workers, so adding workers does not multiply the number of
+connections Postgres and Redis have to accept.
+
+With more than one worker every process logs to its own ``app.<pid>.log``;
+rotate those files with logrotate rather than from inside the workers.
+
+On SIGTERM uvicorn stops accepting connections, waits up to
+GRACEFUL_SHUTDOWN_TIMEOUT seconds for in-flight requests and then runs the
+lifespan shutdown, which closes the engine and the Redis pool.
+"""
+
+import os
+import tempfile
+import uvicorn
+from app.core.config import settings
+
+
+def worker_count() -> int:
+    if settings.web_concurrency > 0:
+        return settings.web_concurrency
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def per_worker_env(workers: int) -> dict[str, str]:
+    return {
+        "DB_POOL_SIZE": str(max(1, settings.db_pool_size // workers)),
+        "DB_MAX_OVERFLOW": str(settings.db_max_overflow // workers),
+        "REDIS_MAX_CONNECTIONS": str(max(1, settings.redis_max_connections // workers)),
+    }
+
+
+def main() -> None:
+    workers = worker_count()
+    # Workers are spawned as new processes and build their own Settings from
+    # the environment, which takes precedence over the .env file.
+    os.environ.update(per_worker_env(workers))
+    # Tells the workers they are not alone, e.g. to log to per-process files.
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    if workers > 1:
+        # Let /metrics aggregate the samples of every worker.
+        os.environ.setdefault(
+            "PROMETHEUS_MULTIPROC_DIR", tempfile.mkdtemp(prefix="prometheus-")
+        )
+    uvicorn.run(
+        "app.main:app",
+        host=settings.uvicorn_host,
+        port=settings.uvicorn_port,
+        workers=workers,
+        timeout_graceful_shutdown=settings.graceful_shutdown_timeout,
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
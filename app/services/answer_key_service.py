@@ -0,0 +1,115 @@
+from typing import Optional, Sequence
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.db.base import redis_connect
+from app.db.models.option_model import OptionModel
+from app.db.models.question_model import QuestionModel
+from app.db.models.quiz_model import QuizModel
+from app.schemas.schemas import AnswerKeyQuestionSchema, QuizAnswerKeySchema
+from app.utils.lru_cache import LRUCache
+
+
+class AnswerKeyService:
+    """Versioned answer-key cache: in-process LRU backed by Redis.
+
+    Every quiz has a version counter in Redis that is bumped on each write to
+    the quiz. Cached keys are stored per version, so a stale copy held by the
+    LRU of another worker is never used once the counter has moved on.
+    """
+
+    def __init__(self):
+        self.redis = redis_connect()
+        self.local = LRUCache(maxsize=settings.answer_key_cache_size)
+
+    @staticmethod
+    def _version_key(quiz_id: int) -> str:
+        return f"answer_key_version:{quiz_id}"
+
+    @staticmethod
+    def _payload_key(quiz_id: int, version: int) -> str:
+        return f"answer_key:{quiz_id}:{version}"
+
+    async def get(
+        self, quiz_id: int, db: AsyncSession
+    ) -> Optional[QuizAnswerKeySchema]:
+        version = int(await self.redis.get(self._version_key(quiz_id)) or 0)
+        cached = self.local.get(quiz_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        payload = await self.redis.get(self._payload_key(quiz_id, version))
+        if payload is not None:
+            answer_key = QuizAnswerKeySchema.model_validate_json(payload)
+        else:
+            answer_key = await self.load(quiz_id=quiz_id, db=db)
+            if answer_key is None:
+                return None
+            await self.redis.set(
+                self._payload_key(quiz_id, version),
+                answer_key.model_dump_json(),
+                ex=settings.answer_key_cache_ttl,
+            )
+        self.local.set(quiz_id, (version, answer_key))
+        return answer_key
+
+    async def invalidate(self, quiz_id: int) -> None:
+        """Must be called after the transaction changing the quiz is committed."""
+        self.local.delete(quiz_id)
+        await self.redis.incr(self._version_key(quiz_id))
+
+    async def load(
+        self, quiz_id: int, db: AsyncSession
+    ) -> Optional[QuizAnswerKeySchema]:
+        stmt = (
+            select(
+                QuizModel.company_id,
+                QuizModel.name,
+                QuizModel.description,
+                QuestionModel.id.label("question_id"),
+                QuestionModel.text.label("question_text"),
+                OptionModel.id.label("option_id"),
+                OptionModel.is_correct,
+            )
+            .select_from(QuizModel)
+            .outerjoin(QuestionModel, QuestionModel.quiz_id == QuizModel.id)
+            .outerjoin(OptionModel, OptionModel.question_id == QuestionModel.id)
+            .where(QuizModel.id == quiz_id)
+            .order_by(QuestionModel.id, OptionModel.id)
+        )
+        rows = (await db.execute(stmt)).all()
+        if not rows:
+            return None
+        return self.from_rows(quiz_id=quiz_id, rows=rows)
+
+    @staticmethod
+    def from_rows(quiz_id: int, rows: Sequence) -> QuizAnswerKeySchema:
+        """Fold the quiz/question/option rows of ``load``, ordered by question
+        and option id, into an answer key."""
+        questions = {}
+        for row in rows:
+            if row.question_id is None:
+                continue
+            question = questions.get(row.question_id)
+            if question is None:
+                question = questions[row.question_id] = AnswerKeyQuestionSchema(
+                    id=row.question_id,
+                    text=row.question_text,
+                    option_ids=set(),
+                    correct_option_ids=set(),
+                )
+            if row.option_id is not None:
+                question.option_ids.add(row.option_id)
+                if row.is_correct:
+                    question.correct_option_ids.add(row.option_id)
+
+        return QuizAnswerKeySchema(
+            quiz_id=quiz_id,
+            company_id=rows[0].company_id,
+            name=rows[0].name,
+            description=rows[0].description,
+            questions=list(questions.values()),
+        )
+
+
+answer_key_service = AnswerKeyService()
@@ -0,0 +1,61 @@
+from typing import Sequence
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.CRUD.option_crud import option_crud
+from app.schemas.schemas import QuizAnswerKeySchema
+
+
+class GradingService:
+    async def grade(
+        self,
+        answer_key: QuizAnswerKeySchema,
+        options_ids: Sequence[int],
+        db: AsyncSession,
+    ) -> tuple[float, dict, dict]:
+        """Grade the provided options against the answer key.
+
+        Membership and correctness are checked in memory. The database is
+        only queried, once for all offending ids, to tell a missing option
+        apart from an option that belongs to another question.
+        """
+        if len(answer_key.questions) != len(options_ids):
+            raise HTTPException(
+                status_code=403, detail="Invalid number of options provided"
+            )
+        unknown_ids = [
+            provided_option
+            for question, provided_option in zip(answer_key.questions, options_ids)
+            if provided_option not in question.option_ids
+        ]
+        if unknown_ids:
+            options = await option_crud.get_all_by_ids(ids=unknown_ids, db=db)
+            existing_ids = {option.id for option in options}
+            for question, provided_option in zip(answer_key.questions, options_ids):
+                if provided_option in question.option_ids:
+                    continue
+                if provided_option not in existing_ids:
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"There is no such an option with id {provided_option}",
+                    )
+                raise HTTPException(
+                    status_code=403,
+                    detail="Option provided do not comply with the question",
+                )
+
+        right_answers = 0
+        user_answers = {}
+        questions_info = {}
+        for question, provided_option in zip(answer_key.questions, options_ids):
+            is_correct = provided_option in question.correct_option_ids
+            if is_correct:
+                right_answers += 1
+            user_answers[f"provided_option_{question.id}"] = provided_option
+            user_answers[f"is_correct_{question.id}"] = is_correct
+            questions_info[f"question_text_{question.id}"] = question.text
+
+        score = round(right_answers / len(answer_key.questions), 2)
+        return score, user_answers, questions_info
+
+
+grading_service = GradingService()
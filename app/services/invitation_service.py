@@ -1,4 +1,3 @@
-from typing import Sequence
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.CRUD.company_crud import company_crud
@@ -6,12 +5,13 @@ from app.CRUD.invitation_crud import invitation_crud
 from app.CRUD.member_crud import member_crud
 from app.CRUD.user_crud import user_crud
 from app.schemas.schemas import InvitationCreateSchema, MemberCreateSchema
+from app.utils.pagination import PageParams, paginate
 
 
 class InvitationService:
     async def owner_get_all_invitations(
-        self, user_id: int, company_id: int, db: AsyncSession
-    ) -> Sequence:
+        self, user_id: int, company_id: int, page: PageParams, db: AsyncSession
+    ):
         company = await company_crud.get_one(id_=company_id, db=db)
         if company is None:
             raise HTTPException(status_code=404, detail="Such a company does not exist")
@@ -20,10 +20,9 @@ class InvitationService:
                 status_code=403,
                 detail="You do not own the company to get the invitations",
             )
-        invitations = await invitation_crud.get_all_by_filter(
-            filters={"company_id": company_id}, db=db
+        return await paginate(
+            crud=invitation_crud, db=db, page=page, filters={"company_id": company_id}
         )
-        return invitations
 
     async def send_invitation(
         self, user_id: int, data: InvitationCreateSchema, db: AsyncSession
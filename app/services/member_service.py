@@ -4,21 +4,24 @@ from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.CRUD.company_crud import company_crud
 from app.CRUD.member_crud import member_crud
+from app.utils.pagination import PageParams, paginate
 
 
 class MemberService:
     async def get_all_admins_in_company(
-        self, user_id: int, company_id: int, db: AsyncSession
-    ) -> Sequence:
+        self, user_id: int, company_id: int, page: PageParams, db: AsyncSession
+    ):
         company = await company_crud.get_one(id_=company_id, db=db)
         if company is None:
             raise HTTPException(status_code=404, detail="There is no such a company")
         if company.owner_id != user_id:
             raise HTTPException(status_code=403, detail="You do not own such a company")
-        admins = await member_crud.get_all_by_filter(filters={"role": "admin"}, db=db)
-        if not admins:
-            raise HTTPException(status_code=404, detail="There are no admins")
-        return admins
+        return await paginate(
+            crud=member_crud,
+            db=db,
+            page=page,
+            filters={"company_id": company_id, "role": "admin"},
+        )
 
     async def promote_member_to_admin(
         self, user_id: int, member_id: int, company_id: int, db: AsyncSession
@@ -1,31 +1,47 @@
 import datetime
+import logging
+import time
 from app.db.models.notification_model import NotificationModel
 from fastapi import HTTPException
+from sqlalchemy import and_, false, func, insert, literal, or_, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.CRUD.company_crud import company_crud
-from app.CRUD.member_crud import member_crud
 from app.CRUD.notification_crud import notification_crud
 from app.CRUD.quiz_crud import quiz_crud
-from app.CRUD.quiz_result_crud import quiz_result_crud
-from app.schemas.schemas import NotificationCreateSchema
+from app.db.models.member_model import MemberModel
+from app.db.models.quiz_model import QuizModel
+from app.db.models.quiz_result_model import QuizResultModel
+
+logger = logging.getLogger(__name__)
 
 
 class NotificationService:
     async def notify_users(
         self, quiz_id: int, company_id: int, notification_text: str, db: AsyncSession
-    ) -> None:
+    ) -> int:
+        """Fan a notification about the quiz out to every company member.
+
+        The rows are written by one INSERT ... SELECT in the caller's
+        transaction; committing it is up to the caller.
+        """
         company = await company_crud.get_one(id_=company_id, db=db)
         quiz = await quiz_crud.get_one(id_=quiz_id, db=db)
         if quiz is None:
             raise HTTPException(status_code=404, detail="Such a quiz does not exist")
         if company is None:
             raise HTTPException(status_code=404, detail="Such a company does not exist")
-        for member in company.members:
-            if member.company_id == company.id:
-                notification = NotificationCreateSchema(
-                    user_id=member.id, quiz_id=quiz_id, text=notification_text
-                )
-                await notification_crud.add(data=notification, db=db)
+        members = select(
+            MemberModel.id,
+            literal(quiz_id),
+            literal(notification_text),
+            false(),
+            literal(datetime.datetime.utcnow()),
+        ).where(MemberModel.company_id == company.id)
+        stmt = insert(NotificationModel).from_select(
+            ["user_id", "quiz_id", "text", "is_read", "registration_date"], members
+        )
+        result = await db.execute(stmt)
+        return result.rowcount
 
     async def mark_as_read(
         self, id_: int, user_id: int, db: AsyncSession
@@ -42,35 +58,63 @@ class NotificationService:
         await db.refresh(notification)
         return notification
 
-    async def pass_check(self, text: str, db: AsyncSession) -> list:
-        members = await member_crud.get_all(db=db)
-        quizzes = await quiz_crud.get_all(db=db)
-        time_difference = datetime.timedelta()
-        notifications = list()
-        for quiz in quizzes:
-            for member in members:
-                passed_quizzes = await quiz_result_crud.get_all_by_filter(
-                    filters={"quiz_id": quiz.id, "user_id": member.id}, db=db
-                )
-                if passed_quizzes:
-                    latest = passed_quizzes[0]
-                    for passed_quiz in passed_quizzes:
-                        if latest.registration_date < passed_quiz.registration_date:
-                            latest = passed_quiz
-
-                    time_difference = (
-                        datetime.datetime.utcnow() - latest.registration_date
-                    )
-
-                if time_difference > datetime.timedelta(hours=24) or not passed_quizzes:
-                    notification = NotificationCreateSchema(
-                        quiz_id=quiz.id, user_id=member.id, text=text
-                    )
-                    await notification_crud.add(data=notification, db=db)
-                    await db.commit()
-                    notifications.append(notification.model_dump())
+    async def pass_check(self, text: str, db: AsyncSession) -> dict:
+        """Notify every member about each quiz not passed in the last 24 hours.
 
-        return notifications
+        The pending (member, quiz) pairs are found and inserted by a single
+        INSERT ... SELECT, so the job costs one statement however many
+        members and quizzes there are.
+        """
+        started = time.perf_counter()
+        now = datetime.datetime.utcnow()
+        latest = (
+            select(
+                QuizResultModel.user_id,
+                QuizResultModel.quiz_id,
+                func.max(QuizResultModel.registration_date).label("last_passed"),
+            )
+            .group_by(QuizResultModel.user_id, QuizResultModel.quiz_id)
+            .subquery()
+        )
+        pending = (
+            select(
+                MemberModel.id,
+                QuizModel.id,
+                literal(text),
+                false(),
+                literal(now),
+            )
+            .select_from(MemberModel)
+            .join(QuizModel, true())
+            .outerjoin(
+                latest,
+                and_(
+                    latest.c.user_id == MemberModel.id,
+                    latest.c.quiz_id == QuizModel.id,
+                ),
+            )
+            .where(
+                or_(
+                    latest.c.last_passed.is_(None),
+                    latest.c.last_passed < now - datetime.timedelta(hours=24),
+                )
+            )
+        )
+        stmt = insert(NotificationModel).from_select(
+            ["user_id", "quiz_id", "text", "is_read", "registration_date"], pending
+        )
+        result = await db.execute(stmt)
+        await db.commit()
+        summary = {
+            "notifications_created": result.rowcount,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+        logger.info(
+            "pass_check created %s notifications in %s ms",
+            summary["notifications_created"],
+            summary["elapsed_ms"],
+        )
+        return summary
 
 
 notification_service = NotificationService()
@@ -0,0 +1,85 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from fastapi import HTTPException
+from app.core.config import settings
+from app.utils.deps import pwd_context
+
+
+class PasswordHasher:
+    """Runs bcrypt hashing and verification on a dedicated thread pool.
+
+    A bcrypt round takes a few hundred milliseconds of CPU, which would stall
+    the event loop if run inline. The pool keeps that work off the loop and
+    caps how much of it can pile up: once ``workers + queue_limit`` operations
+    are in flight, new ones are rejected with 429 instead of queueing
+    unboundedly behind a login burst.
+    """
+
+    def __init__(self, workers: int, queue_limit: int, samples: int = 1024):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hasher"
+        )
+        self.in_flight = 0
+        self.rejected = 0
+        self.completed = 0
+        self.latencies: deque = deque(maxlen=samples)
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self.in_flight - self.workers)
+
+    async def _run(self, func: Callable, *args):
+        if self.in_flight >= self.workers + self.queue_limit:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=429,
+                detail="Too many password operations, try again later",
+                headers={"Retry-After": "1"},
+            )
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self.latencies.append((time.perf_counter() - started) * 1000)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(pwd_context.verify, password, hashed_password)
+
+    def stats(self) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(pct: int):
+            if not latencies:
+                return None
+            return round(
+                latencies[min(len(latencies) - 1, len(latencies) * pct // 100)], 2
+            )
+
+        return {
+            "workers": self.workers,
+            "queue_limit": self.queue_limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "latency_ms_p50": percentile(50),
+            "latency_ms_p99": percentile(99),
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    queue_limit=settings.password_hash_queue_limit,
+)
@@ -0,0 +1,138 @@
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Sequence, TypeVar
+from app.db.models.quiz_model import QuizModel
+from app.schemas.schemas import (
+    OptionPatchSchema,
+    QuestionCreateSchema,
+    QuestionPatchSchema,
+    QuizChangeSummarySchema,
+    QuizCreateSchema,
+)
+
+Stored = TypeVar("Stored")
+Incoming = TypeVar("Incoming")
+
+
+@dataclass
+class QuizDiff:
+    quiz_fields: dict = field(default_factory=dict)
+    question_inserts: list[QuestionCreateSchema] = field(default_factory=list)
+    question_updates: list[QuestionPatchSchema] = field(default_factory=list)
+    question_deletes: list[int] = field(default_factory=list)
+    option_inserts: list[dict] = field(default_factory=list)
+    option_updates: list[OptionPatchSchema] = field(default_factory=list)
+    option_deletes: list[int] = field(default_factory=list)
+
+    def summary(self) -> QuizChangeSummarySchema:
+        return QuizChangeSummarySchema(
+            quiz_updated=bool(self.quiz_fields),
+            questions_added=len(self.question_inserts),
+            questions_updated=len(self.question_updates),
+            questions_deleted=len(self.question_deletes),
+            options_added=len(self.option_inserts)
+            + sum(len(question.options) for question in self.question_inserts),
+            options_updated=len(self.option_updates),
+            options_deleted=len(self.option_deletes),
+        )
+
+
+def pair(
+    stored: Sequence[Stored],
+    incoming: Sequence[Incoming],
+    stored_key: Callable[[Stored], str],
+    incoming_key: Callable[[Incoming], str],
+    pair_leftovers: bool = True,
+) -> tuple[list[tuple[Stored, Incoming]], list[Stored], list[Incoming]]:
+    """Pair stored rows with incoming items.
+
+    Items with the same text are paired first. Unless ``pair_leftovers`` is
+    off, the remaining ones are paired in order, which turns an edited text
+    into an update rather than a delete and an insert. Returns the pairs and
+    whatever is left on either side.
+    """
+    by_key = defaultdict(deque)
+    for row in stored:
+        by_key[stored_key(row)].append(row)
+    pairs, left, matched = [], [], set()
+    for item in incoming:
+        candidates = by_key.get(incoming_key(item))
+        if candidates:
+            match = candidates.popleft()
+            matched.add(id(match))
+            pairs.append((match, item))
+        else:
+            left.append(item)
+    unmatched = [row for row in stored if id(row) not in matched]
+    edited = min(len(unmatched), len(left)) if pair_leftovers else 0
+    pairs.extend(zip(unmatched[:edited], left[:edited]))
+    return pairs, unmatched[edited:], left[edited:]
+
+
+class QuizDiffService:
+    """Computes the writes that turn a stored quiz into the submitted one.
+
+    The submitted tree carries no question or option ids, so rows are matched
+    by text (see ``pair``). Matched rows keep their ids and are only written
+    when something actually changed.
+    """
+
+    def diff(
+        self, quiz: QuizModel, data: QuizCreateSchema, keep_missing: bool = False
+    ) -> QuizDiff:
+        """With ``keep_missing`` the submitted questions are merged into the
+        quiz: stored questions that were not submitted are left alone instead
+        of being deleted or reused for new ones."""
+        result = QuizDiff()
+        for name in ("name", "description"):
+            if getattr(quiz, name) != getattr(data, name):
+                result.quiz_fields[name] = getattr(data, name)
+        if data.id is not None and data.id != quiz.id:
+            result.quiz_fields["id"] = data.id
+
+        questions, deleted, added = pair(
+            quiz.questions,
+            data.questions,
+            stored_key=lambda question: question.text,
+            incoming_key=lambda question: question.text,
+            pair_leftovers=not keep_missing,
+        )
+        if not keep_missing:
+            result.question_deletes = [question.id for question in deleted]
+        result.question_inserts = added
+        for question, question_data in questions:
+            if question.text != question_data.text:
+                result.question_updates.append(
+                    QuestionPatchSchema(id=question.id, text=question_data.text)
+                )
+            self.diff_options(question, question_data, result)
+        return result
+
+    @staticmethod
+    def diff_options(question, question_data: QuestionCreateSchema, result: QuizDiff):
+        options, deleted, added = pair(
+            question.options,
+            question_data.options,
+            stored_key=lambda option: option.text,
+            incoming_key=lambda option: option.text,
+        )
+        result.option_deletes.extend(option.id for option in deleted)
+        result.option_inserts.extend(
+            {
+                "text": option.text,
+                "is_correct": option.is_correct,
+                "question_id": question.id,
+            }
+            for option in added
+        )
+        result.option_updates.extend(
+            OptionPatchSchema(
+                id=option.id, text=option_data.text, is_correct=option_data.is_correct
+            )
+            for option, option_data in options
+            if (option.text, option.is_correct)
+            != (option_data.text, option_data.is_correct)
+        )
+
+
+quiz_diff_service = QuizDiffService()
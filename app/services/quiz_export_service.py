@@ -0,0 +1,181 @@
+import asyncio
+import contextlib
+import os
+import tempfile
+from typing import Optional, Sequence
+import xlsxwriter
+from fastapi import HTTPException
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models.option_model import OptionModel
+from app.db.models.question_model import QuestionModel
+from app.db.models.quiz_model import QuizModel
+
+# The columns match what QuizImportService reads, so an export can be
+# uploaded again as is.
+SHEETS = {
+    "Quiz": [
+        "quiz_id",
+        "company_id",
+        "name",
+        "description",
+        "pass_count",
+        "registration_date",
+    ],
+    "Questions": ["question_id", "quiz_id", "question_text"],
+    "Options": [
+        "option_id",
+        "question_id",
+        "question_text",
+        "option_text",
+        "is_correct",
+    ],
+}
+MAX_ROWS = 1_048_576
+
+
+class QuizWorkbookWriter:
+    """Writes quiz rows, ordered by quiz, question and option id, into the
+    Quiz, Questions and Options sheets of an xlsxwriter workbook.
+
+    The workbook is opened in constant-memory mode: every sheet row is
+    flushed to disk as soon as the next one starts, so memory does not grow
+    with the export.
+    """
+
+    def __init__(self, path: str):
+        self.workbook = xlsxwriter.Workbook(
+            path,
+            {
+                "constant_memory": True,
+                "default_date_format": "yyyy-mm-dd hh:mm:ss",
+            },
+        )
+        self.sheets = {}
+        self.rows = {}
+        for name, columns in SHEETS.items():
+            self.sheets[name] = self.workbook.add_worksheet(name)
+            self.sheets[name].write_row(0, 0, columns)
+            self.rows[name] = 1
+        self.quiz_id = None
+        self.question_id = None
+        self.closed = False
+
+    @property
+    def quizzes(self) -> int:
+        return self.rows["Quiz"] - 1
+
+    def write(self, sheet: str, values: list) -> None:
+        row = self.rows[sheet]
+        if row >= MAX_ROWS:
+            raise HTTPException(
+                status_code=413,
+                detail=f"The {sheet} sheet would exceed {MAX_ROWS} rows",
+            )
+        self.sheets[sheet].write_row(row, 0, values)
+        self.rows[sheet] = row + 1
+
+    def write_rows(self, rows: Sequence[Row]) -> None:
+        for row in rows:
+            if row.quiz_id != self.quiz_id:
+                self.quiz_id = row.quiz_id
+                self.write(
+                    "Quiz",
+                    [
+                        row.quiz_id,
+                        row.company_id,
+                        row.name,
+                        row.description,
+                        row.pass_count,
+                        row.registration_date,
+                    ],
+                )
+            if row.question_id is not None and row.question_id != self.question_id:
+                self.question_id = row.question_id
+                self.write(
+                    "Questions", [row.question_id, row.quiz_id, row.question_text]
+                )
+            if row.option_id is not None:
+                self.write(
+                    "Options",
+                    [
+                        row.option_id,
+                        row.question_id,
+                        row.question_text,
+                        row.option_text,
+                        row.is_correct,
+                    ],
+                )
+
+    def close(self) -> None:
+        self.closed = True
+        self.workbook.close()
+
+
+class QuizExportService:
+    def __init__(self, chunk_size: int = 1000):
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def rows_statement(quiz_id: Optional[int], company_id: Optional[int]):
+        stmt = (
+            select(
+                QuizModel.id.label("quiz_id"),
+                QuizModel.company_id,
+                QuizModel.name,
+                QuizModel.description,
+                QuizModel.pass_count,
+                QuizModel.registration_date,
+                QuestionModel.id.label("question_id"),
+                QuestionModel.text.label("question_text"),
+                OptionModel.id.label("option_id"),
+                OptionModel.text.label("option_text"),
+                OptionModel.is_correct,
+            )
+            .select_from(QuizModel)
+            .outerjoin(QuestionModel, QuestionModel.quiz_id == QuizModel.id)
+            .outerjoin(OptionModel, OptionModel.question_id == QuestionModel.id)
+            .order_by(QuizModel.id, QuestionModel.id, OptionModel.id)
+        )
+        if quiz_id is not None:
+            stmt = stmt.where(QuizModel.id == quiz_id)
+        if company_id is not None:
+            stmt = stmt.where(QuizModel.company_id == company_id)
+        return stmt
+
+    async def export(
+        self,
+        db: AsyncSession,
+        quiz_id: Optional[int] = None,
+        company_id: Optional[int] = None,
+    ) -> str:
+        """Write the matching quizzes to a temporary .xlsx file and return its
+        path; the caller deletes the file once it has been sent.
+
+        Rows are streamed from the database in chunks and every chunk is
+        written in a worker thread, so neither the result set nor the
+        workbook is held in memory and the event loop is not blocked.
+        """
+        fd, path = tempfile.mkstemp(prefix="quiz_export_", suffix=".xlsx")
+        os.close(fd)
+        writer = None
+        try:
+            writer = QuizWorkbookWriter(path)
+            stmt = self.rows_statement(quiz_id=quiz_id, company_id=company_id)
+            result = await db.stream(stmt.execution_options(yield_per=self.chunk_size))
+            async for rows in result.partitions():
+                await asyncio.to_thread(writer.write_rows, rows)
+            await asyncio.to_thread(writer.close)
+            if quiz_id is not None and writer.quizzes == 0:
+                raise HTTPException(status_code=404, detail="Not Found")
+        except BaseException:
+            # Closing removes the per-sheet temp files of constant-memory mode.
+            if writer is not None and not writer.closed:
+                with contextlib.suppress(Exception):
+                    await asyncio.to_thread(writer.close)
+            os.unlink(path)
+            raise
+        return path
+
+
+quiz_export_service = QuizExportService()
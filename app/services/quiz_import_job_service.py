@@ -0,0 +1,132 @@
+import io
+import logging
+import uuid
+from datetime import datetime
+from fastapi import HTTPException, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.celery_app import import_quiz_task
+from app.core.config import settings
+from app.CRUD.company_crud import company_crud
+from app.CRUD.member_crud import member_crud
+from app.db.base import redis_connect
+from app.exceptions.custom_exceptions import check_user_permissions
+from app.schemas.schemas import QuizImportJobSchema
+from app.services.quiz_import_service import QuizImportError, quiz_import_service
+from app.services.quiz_service import quiz_service
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class QuizImportJobService:
+    """Runs Excel quiz imports as Celery jobs tracked in Redis.
+
+    The HTTP worker only stores the upload and the job state in Redis and
+    enqueues the job; parsing and writing happen in a Celery worker, which
+    reports its progress back into the job state.
+    """
+
+    def __init__(self):
+        self.redis = redis_connect()
+
+    @staticmethod
+    def job_key(job_id: str) -> str:
+        return f"quiz_import_job:{job_id}"
+
+    @staticmethod
+    def file_key(job_id: str) -> str:
+        return f"quiz_import_job:{job_id}:file"
+
+    @staticmethod
+    async def read_upload(file: UploadFile) -> bytes:
+        content = bytearray()
+        while chunk := await file.read(READ_CHUNK_SIZE):
+            content.extend(chunk)
+            if len(content) > settings.quiz_import_max_bytes:
+                raise HTTPException(status_code=413, detail="The file is too large")
+        return bytes(content)
+
+    async def submit(
+        self, company_id: int, file: UploadFile, db: AsyncSession, user_id: int
+    ) -> QuizImportJobSchema:
+        company = await company_crud.get_one(id_=company_id, db=db)
+        member = await member_crud.get_one(id_=user_id, db=db)
+        check_user_permissions(user_id=user_id, company=company, member=member)
+        content = await self.read_upload(file)
+
+        now = datetime.utcnow()
+        job = QuizImportJobSchema(
+            id=uuid.uuid4().hex,
+            status="queued",
+            company_id=company_id,
+            user_id=user_id,
+            filename=file.filename,
+            created_at=now,
+            updated_at=now,
+        )
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.set(self.file_key(job.id), content, ex=settings.quiz_import_job_ttl)
+        pipe.set(
+            self.job_key(job.id), job.model_dump_json(), ex=settings.quiz_import_job_ttl
+        )
+        await pipe.execute()
+        import_quiz_task.delay(job.id)
+        return job
+
+    async def get(self, job_id: str, user_id: int) -> QuizImportJobSchema:
+        payload = await self.redis.get(self.job_key(job_id))
+        if payload is None:
+            raise HTTPException(status_code=404, detail="Import job was not found")
+        job = QuizImportJobSchema.model_validate_json(payload)
+        if job.user_id != user_id:
+            raise HTTPException(status_code=403, detail="This is not your import job")
+        return job
+
+    async def save(self, job: QuizImportJobSchema, **changes) -> QuizImportJobSchema:
+        job = job.model_copy(update={**changes, "updated_at": datetime.utcnow()})
+        await self.redis.set(
+            self.job_key(job.id),
+            job.model_dump_json(),
+            ex=settings.quiz_import_job_ttl,
+        )
+        return job
+
+    async def run(self, job_id: str, db: AsyncSession) -> QuizImportJobSchema | None:
+        """Parse and upsert the uploaded quiz; called from the Celery worker."""
+        payload = await self.redis.get(self.job_key(job_id))
+        if payload is None:
+            logger.warning("Quiz import job %s expired before it ran", job_id)
+            return None
+        job = QuizImportJobSchema.model_validate_json(payload)
+        content = await self.redis.get(self.file_key(job_id))
+        if content is None:
+            return await self.save(
+                job, status="failed", errors=["The uploaded file has expired"]
+            )
+
+        job = await self.save(job, status="parsing")
+        try:
+            data = quiz_import_service.parse(io.BytesIO(content))
+            job = await self.save(
+                job,
+                status="importing",
+                questions=len(data.questions),
+                options=sum(len(question.options) for question in data.questions),
+            )
+            quiz = await quiz_service.upsert(
+                company_id=job.company_id, data=data, db=db
+            )
+        except QuizImportError as e:
+            return await self.save(job, status="failed", errors=[str(e)])
+        except Exception:
+            logger.exception("Quiz import job %s failed", job_id)
+            return await self.save(
+                job, status="failed", errors=["The import failed unexpectedly"]
+            )
+        finally:
+            await self.redis.delete(self.file_key(job_id))
+        return await self.save(job, status="completed", quiz_id=quiz.id)
+
+
+quiz_import_job_service = QuizImportJobService()
@@ -0,0 +1,96 @@
+from typing import BinaryIO
+from zipfile import BadZipFile
+import pandas as pd
+from app.core.config import settings
+from app.schemas.schemas import (
+    OptionCreateSchema,
+    QuestionCreateSchema,
+    QuizCreateSchema,
+)
+
+SHEETS = {
+    "Quiz": ["name", "description"],
+    "Questions": ["question_text"],
+    "Options": ["question_text", "option_text", "is_correct"],
+}
+
+
+class QuizImportError(ValueError):
+    pass
+
+
+class QuizImportService:
+    """Turns an uploaded workbook into a QuizCreateSchema.
+
+    Parsing is CPU-bound and blocking, so callers run ``parse`` off the event
+    loop. Only the columns the import needs are read, and no sheet may have
+    more than ``max_rows`` rows, which keeps memory bounded by the limit
+    rather than by the upload.
+    """
+
+    def __init__(self, max_rows: int = settings.quiz_import_max_rows):
+        self.max_rows = max_rows
+
+    def read_sheets(self, source: BinaryIO) -> dict[str, pd.DataFrame]:
+        frames = {}
+        try:
+            book = pd.ExcelFile(source, engine="openpyxl")
+        except (BadZipFile, OSError, ValueError) as e:
+            raise QuizImportError("The file is not an Excel workbook") from e
+        with book:
+            for sheet, columns in SHEETS.items():
+                if sheet not in book.sheet_names:
+                    raise QuizImportError(f"The workbook has no {sheet} sheet")
+                try:
+                    frame = book.parse(sheet, usecols=columns, nrows=self.max_rows + 1)
+                except ValueError as e:
+                    raise QuizImportError(f"{sheet} sheet: {e}") from e
+                if len(frame) > self.max_rows:
+                    raise QuizImportError(
+                        f"The {sheet} sheet has more than {self.max_rows} rows"
+                    )
+                frames[sheet] = frame
+        return frames
+
+    def parse(self, source: BinaryIO) -> QuizCreateSchema:
+        frames = self.read_sheets(source)
+        quiz_df = frames["Quiz"]
+        if quiz_df.empty:
+            raise QuizImportError("The Quiz sheet is empty")
+
+        question_texts = (
+            frames["Questions"]["question_text"].dropna().astype(str).drop_duplicates()
+        )
+        options_df = frames["Options"].dropna(subset=["question_text", "option_text"])
+        options_df = options_df.assign(
+            question_text=options_df["question_text"].astype(str),
+            option_text=options_df["option_text"].astype(str),
+            is_correct=options_df["is_correct"].fillna(False).astype(bool),
+        )
+        options = {
+            text: [
+                OptionCreateSchema(text=option_text, is_correct=is_correct)
+                for option_text, is_correct in zip(
+                    group["option_text"].tolist(), group["is_correct"].tolist()
+                )
+            ]
+            for text, group in options_df.groupby("question_text", sort=False)
+        }
+
+        questions = [
+            QuestionCreateSchema(text=text, options=options.get(text, []))
+            for text in question_texts.tolist()
+        ]
+        invalid = [q.text for q in questions if len(q.options) < 2]
+        if invalid:
+            raise QuizImportError(
+                f"Each question must have at least two options: {invalid[:5]}"
+            )
+        return QuizCreateSchema(
+            name=str(quiz_df.at[0, "name"]),
+            description=str(quiz_df.at[0, "description"]),
+            questions=questions,
+        )
+
+
+quiz_import_service = QuizImportService()
@@ -1,15 +1,16 @@
-from datetime import datetime, timedelta
-from typing import Sequence
+from datetime import date, datetime, timedelta
+from typing import Literal, Optional
 from fastapi import HTTPException
-from sqlalchemy import select, func
+from sqlalchemy import Date, cast, literal, select, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.operators import and_
 from app.CRUD.company_crud import company_crud
 from app.CRUD.member_crud import member_crud
-from app.CRUD.option_crud import option_crud
-from app.CRUD.quiz_crud import quiz_crud
 from app.CRUD.quiz_result_crud import quiz_result_crud
-from app.CRUD.user_crud import user_crud
+from app.db.models.company_model import CompanyModel
+from app.db.models.member_model import MemberModel
+from app.db.models.quiz_result_aggregate_model import QuizResultAggregateModel
+from app.db.models.quiz_result_daily_model import QuizResultDailyModel
 from app.db.models.quiz_result_model import QuizResultModel
 from app.db.models.quiz_model import QuizModel
 from app.db.models.user_model import UserModel
@@ -18,122 +19,104 @@ from app.schemas.schemas import (
     QuizResultCreateInSchema,
     QuizResultCreateSchema,
 )
+from app.services.answer_key_service import answer_key_service
+from app.services.grading_service import grading_service
 from app.services.redis_service import redis_service
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PageParams,
+    decode_cursor,
+    decode_cursor_values,
+    encode_cursor,
+    paginate,
+)
 
 
-class QuizResultService:
-    async def user_get_its_result(self, user_id: int, db: AsyncSession) -> Sequence:
-        results = await quiz_result_crud.get_all_by_filter(
-            db=db, filters={"user_id": user_id}
-        )
-        if results is None:
-            raise HTTPException(status_code=404, detail="There are no such results")
-        return results
+def daily_average_score():
+    return func.sum(QuizResultDailyModel.score_sum) / func.sum(
+        QuizResultDailyModel.attempts
+    )
+
+
+def average_score():
+    """Mean score over every attempt covered by the selected rollup rows."""
+    return func.sum(QuizResultAggregateModel.score_sum) / func.sum(
+        QuizResultAggregateModel.attempts
+    )
 
+
+class QuizResultService:
     async def get_all_company_results(
-        self, user_id: int, company_id: int, db: AsyncSession
-    ) -> Sequence:
+        self, user_id: int, company_id: int, page: PageParams, db: AsyncSession
+    ):
         member = await member_crud.get_one(id_=user_id, db=db)
         company = await company_crud.get_one(id_=company_id, db=db)
         check_user_permissions(member=member, company=company, user_id=user_id)
-        results = await quiz_result_crud.get_all_by_filter(
-            db=db, filters={"company_id": company_id}
+        return await paginate(
+            crud=quiz_result_crud, db=db, page=page, filters={"company_id": company_id}
         )
-        return results
 
     async def get_results_for_user(
-        self, user_id: int, id_: int, company_id: int, db: AsyncSession
-    ) -> Sequence:
+        self,
+        user_id: int,
+        id_: int,
+        company_id: int,
+        page: PageParams,
+        db: AsyncSession,
+    ):
         member = await member_crud.get_one(id_=user_id, db=db)
         company = await company_crud.get_one(id_=company_id, db=db)
         check_user_permissions(member=member, company=company, user_id=user_id)
-        results = await quiz_result_crud.get_all_by_filter(
-            db=db, filters={"user_id": id_}
+        return await paginate(
+            crud=quiz_result_crud, db=db, page=page, filters={"user_id": id_}
         )
-        return results
 
     async def pass_quiz(
         self, data: QuizResultCreateInSchema, user_id: int, db: AsyncSession
     ) -> QuizResultModel:
-        user = await user_crud.get_one(id_=user_id, db=db)
-        quiz_result = await quiz_result_crud.get_one(id_=data.id, db=db)
-        if quiz_result is not None:
-            raise HTTPException(
-                status_code=403, detail="Result with such an id already exists"
-            )
-        quiz = await quiz_crud.get_one(id_=data.quiz_id, db=db)
-        if quiz is None:
+        answer_key = await answer_key_service.get(quiz_id=data.quiz_id, db=db)
+        if answer_key is None:
             raise HTTPException(status_code=404, detail="There is no such a quiz")
-        company = await company_crud.get_one(id_=quiz.company_id, db=db)
-        member = await member_crud.get_one(id_=user_id, db=db)
-        if (member and member.company_id != company.id) or (
-            member is None and user_id != company.owner_id
-        ):
+        submitter = await self.get_submitter(
+            user_id=user_id, company_id=answer_key.company_id, db=db
+        )
+        if submitter is None:
+            raise HTTPException(status_code=404, detail="User was not found")
+        if submitter.company_id is None:
+            raise HTTPException(status_code=404, detail="There is no such a company")
+        if (
+            submitter.member_company_id is not None
+            and submitter.member_company_id != submitter.company_id
+        ) or (submitter.member_company_id is None and user_id != submitter.owner_id):
             raise HTTPException(
                 status_code=403, detail="You are not a member of that company"
             )
-        if len(quiz.questions) != len(data.options_ids):
-            raise HTTPException(
-                status_code=403, detail="Invalid number of options provided"
-            )
-        right_answers = 0
-        user_answers = {}
-        questions_info = {}
-        for question, provided_option in zip(quiz.questions, data.options_ids):
-            option = await option_crud.get_one(id_=provided_option, db=db)
-            if option is None:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"There is no such an option with id {provided_option}",
-                )
-            if option.question_id != question.id:
-                raise HTTPException(
-                    status_code=403,
-                    detail="Option provided do not comply with the question",
-                )
-
-            if option.is_correct is True:
-                right_answers += 1
-
-            user_answers[question.id] = {
-                f"provided_option_{question.id}": provided_option,
-                f"is_correct_{question.id}": option.is_correct,
-            }
-
-            questions_info[question.id] = {
-                f"question_text_{question.id}": question.text
-            }
-
-        score = round(right_answers / len(quiz.questions), 2)
+        score, user_answers, questions_info = await grading_service.grade(
+            answer_key=answer_key, options_ids=data.options_ids, db=db
+        )
         res = await quiz_result_crud.add(
             data=QuizResultCreateSchema(
                 id=data.id,
-                quiz_id=quiz.id,
-                company_id=company.id,
+                quiz_id=answer_key.quiz_id,
+                company_id=submitter.company_id,
                 score=score,
                 user_id=user_id,
             ),
             db=db,
         )
-        user_answers = {
-            key: value
-            for answer in user_answers.values()
-            for key, value in answer.items()
-        }
-        questions_info = {
-            key: value
-            for answer in questions_info.values()
-            for key, value in answer.items()
-        }
+        if res is None:
+            raise HTTPException(
+                status_code=403, detail="Result with such an id already exists"
+            )
         result_data = {
-            "quiz_id": quiz.id,
-            "quiz_name": quiz.name,
-            "quiz_description": quiz.description,
-            "company_id": company.id,
-            "company_name": company.name,
-            "company_description": company.description,
-            "user_id": user.id,
-            "user_email": user.email,
+            "quiz_id": answer_key.quiz_id,
+            "quiz_name": answer_key.name,
+            "quiz_description": answer_key.description,
+            "company_id": submitter.company_id,
+            "company_name": submitter.company_name,
+            "company_description": submitter.company_description,
+            "user_id": user_id,
+            "user_email": submitter.email,
             **questions_info,
             "score": score,
             **user_answers,
@@ -142,24 +125,43 @@ class QuizResultService:
 
         return res
 
+    @staticmethod
+    async def get_submitter(user_id: int, company_id: int, db: AsyncSession):
+        """The user, the quiz's company and the user's membership in one row."""
+        stmt = (
+            select(
+                UserModel.email,
+                CompanyModel.id.label("company_id"),
+                CompanyModel.name.label("company_name"),
+                CompanyModel.description.label("company_description"),
+                CompanyModel.owner_id,
+                MemberModel.company_id.label("member_company_id"),
+            )
+            .select_from(UserModel)
+            .outerjoin(CompanyModel, CompanyModel.id == company_id)
+            .outerjoin(MemberModel, MemberModel.id == UserModel.id)
+            .where(UserModel.id == user_id)
+        )
+        return (await db.execute(stmt)).first()
+
     async def get_average_score_for_company(self, db: AsyncSession, company_id: int):
         company = await company_crud.get_one(id_=company_id, db=db)
         if company is None:
             raise HTTPException(status_code=404, detail="Such a company does not exist")
         stmt = (
             select(
-                QuizResultModel.user_id,
-                func.avg(QuizResultModel.score).label("average_score"),
-            ).where(QuizResultModel.company_id == company_id)
-        ).group_by(QuizResultModel.user_id)
+                QuizResultAggregateModel.user_id,
+                average_score().label("average_score"),
+            )
+            .where(QuizResultAggregateModel.company_id == company_id)
+            .group_by(QuizResultAggregateModel.user_id)
+        )
         result = await db.execute(stmt)
         return result.iterator
 
     async def get_user_average_score(self, user_id: int, db: AsyncSession):
         result = await db.execute(
-            select(func.avg(QuizResultModel.score)).where(
-                QuizResultModel.user_id == user_id
-            )
+            select(average_score()).where(QuizResultAggregateModel.user_id == user_id)
         )
         avg_score = result.scalar()
         if avg_score is None:
@@ -169,11 +171,11 @@ class QuizResultService:
     async def get_average_score_for_all(self, db: AsyncSession, company_id: int):
         stmt = (
             select(
-                QuizResultModel.user_id,
-                func.avg(QuizResultModel.score).label("average_score"),
+                QuizResultAggregateModel.user_id,
+                average_score().label("average_score"),
             )
-            .where(QuizResultModel.company_id == company_id)
-            .group_by(QuizResultModel.user_id)
+            .where(QuizResultAggregateModel.company_id == company_id)
+            .group_by(QuizResultAggregateModel.user_id)
         )
         result = await db.execute(stmt)
         return result.iterator
@@ -186,21 +188,23 @@ class QuizResultService:
         check_user_permissions(member=member, company=company, user_id=user_id)
         stmt = (
             select(
-                QuizResultModel.user_id,
-                QuizResultModel.quiz_id,
+                QuizResultAggregateModel.user_id,
+                QuizResultAggregateModel.quiz_id,
                 QuizModel.name.label("quiz_name"),
-                func.avg(QuizResultModel.score).label("average_score"),
-                func.min(QuizResultModel.registration_date).label("start_time"),
-                func.max(QuizResultModel.registration_date).label("end_time"),
+                (
+                    QuizResultAggregateModel.score_sum
+                    / QuizResultAggregateModel.attempts
+                ).label("average_score"),
+                QuizResultAggregateModel.first_attempt.label("start_time"),
+                QuizResultAggregateModel.last_attempt.label("end_time"),
             )
-            .join(QuizModel, QuizResultModel.quiz_id == QuizModel.id)
+            .join(QuizModel, QuizResultAggregateModel.quiz_id == QuizModel.id)
             .where(
                 and_(
-                    QuizResultModel.user_id == id_,
-                    QuizResultModel.company_id == company_id,
+                    QuizResultAggregateModel.user_id == id_,
+                    QuizResultAggregateModel.company_id == company_id,
                 )
             )
-            .group_by(QuizResultModel.user_id, QuizResultModel.quiz_id, QuizModel.name)
         )
         result = await db.execute(stmt)
         quiz_averages_with_time_ranges = result.fetchall()
@@ -222,19 +226,18 @@ class QuizResultService:
         check_user_permissions(member=member, company=company, user_id=user_id)
         stmt = (
             select(
-                QuizResultModel.user_id,
-                QuizResultModel.quiz_id,
+                QuizResultAggregateModel.user_id,
+                QuizResultAggregateModel.quiz_id,
                 QuizModel.name.label("quiz_name"),
-                func.max(QuizResultModel.registration_date).label("last_completion"),
+                QuizResultAggregateModel.last_attempt.label("last_completion"),
             )
-            .join(QuizModel, QuizResultModel.quiz_id == QuizModel.id)
+            .join(QuizModel, QuizResultAggregateModel.quiz_id == QuizModel.id)
             .where(
                 and_(
-                    QuizResultModel.user_id == id_,
-                    QuizResultModel.company_id == company_id,
+                    QuizResultAggregateModel.user_id == id_,
+                    QuizResultAggregateModel.company_id == company_id,
                 )
             )
-            .group_by(QuizResultModel.user_id, QuizResultModel.quiz_id, QuizModel.name)
         )
 
         result = await db.execute(stmt)
@@ -249,40 +252,66 @@ class QuizResultService:
         return result_list
 
     async def get_company_results_last_week(
-        self, user_id: int, company_id: int, db: AsyncSession
-    ):
+        self,
+        user_id: int,
+        company_id: int,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> dict:
         member = await member_crud.get_one(id_=user_id, db=db)
         company = await company_crud.get_one(id_=company_id, db=db)
         check_user_permissions(member=member, company=company, user_id=user_id)
 
-        one_week_ago = datetime.now() - timedelta(days=7)
+        one_week_ago = datetime.utcnow() - timedelta(days=7)
 
-        stmt = (
-            select(
-                QuizResultModel.user_id,
-                QuizResultModel.quiz_id,
-                QuizResultModel.score,
-                QuizResultModel.registration_date,
-            )
-            .where(
-                and_(
-                    QuizResultModel.company_id == company_id,
-                    QuizResultModel.registration_date >= one_week_ago,
-                )
+        stmt = select(
+            QuizResultModel.id,
+            QuizResultModel.user_id,
+            QuizResultModel.quiz_id,
+            QuizResultModel.score,
+            QuizResultModel.registration_date,
+        ).where(
+            and_(
+                QuizResultModel.company_id == company_id,
+                QuizResultModel.registration_date >= one_week_ago,
             )
-            .order_by(QuizResultModel.registration_date)
         )
+        if cursor is not None:
+            after = decode_cursor_values(cursor)
+            try:
+                after_date = datetime.fromisoformat(after["registration_date"])
+                after_id = int(after["id"])
+            except (KeyError, TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            stmt = stmt.where(
+                tuple_(QuizResultModel.registration_date, QuizResultModel.id)
+                > tuple_(after_date, after_id)
+            )
+        stmt = stmt.order_by(
+            QuizResultModel.registration_date, QuizResultModel.id
+        ).limit(limit + 1)
 
         result = await db.execute(stmt)
         results_last_week = result.fetchall()
 
-        if not results_last_week:
+        if not results_last_week and cursor is None:
             raise HTTPException(
                 status_code=404, detail="No quiz results found for the last week."
             )
 
-        result_list = [row._asdict() for row in results_last_week]
-        return result_list
+        next_cursor = None
+        if len(results_last_week) > limit:
+            results_last_week = results_last_week[:limit]
+            last = results_last_week[-1]
+            next_cursor = encode_cursor(
+                last.id, registration_date=last.registration_date.isoformat()
+            )
+
+        return {
+            "items": [row._asdict() for row in results_last_week],
+            "next_cursor": next_cursor,
+        }
 
     async def get_user_quiz_averages_last_week(
         self, user_id: int, id_: int, company_id: int, db: AsyncSession
@@ -291,23 +320,27 @@ class QuizResultService:
         company = await company_crud.get_one(id_=company_id, db=db)
         check_user_permissions(member=member, company=company, user_id=user_id)
 
-        one_week_ago = datetime.now() - timedelta(days=7)
+        since = (datetime.utcnow() - timedelta(days=7)).date()
 
         stmt = (
             select(
-                QuizResultModel.user_id,
-                QuizResultModel.quiz_id,
+                QuizResultDailyModel.user_id,
+                QuizResultDailyModel.quiz_id,
                 QuizModel.name.label("quiz_name"),
-                func.avg(QuizResultModel.score).label("average_score"),
+                daily_average_score().label("average_score"),
             )
-            .join(QuizModel, QuizResultModel.quiz_id == QuizModel.id)
+            .join(QuizModel, QuizResultDailyModel.quiz_id == QuizModel.id)
             .where(
-                QuizResultModel.user_id == id_,
-                QuizResultModel.company_id == company_id,
-                QuizResultModel.registration_date >= one_week_ago,
+                QuizResultDailyModel.user_id == id_,
+                QuizResultDailyModel.company_id == company_id,
+                QuizResultDailyModel.day >= since,
+            )
+            .group_by(
+                QuizResultDailyModel.user_id,
+                QuizResultDailyModel.quiz_id,
+                QuizModel.name,
             )
-            .group_by(QuizResultModel.user_id, QuizResultModel.quiz_id, QuizModel.name)
-            .order_by(QuizResultModel.quiz_id)
+            .order_by(QuizResultDailyModel.quiz_id)
         )
 
         result = await db.execute(stmt)
@@ -322,9 +355,63 @@ class QuizResultService:
         result_list = [row._asdict() for row in quiz_averages_last_week]
         return result_list
 
+    async def get_company_analytics(
+        self,
+        user_id: int,
+        company_id: int,
+        from_: date,
+        to: date,
+        bucket: Literal["day", "week"],
+        db: AsyncSession,
+        id_: Optional[int] = None,
+        quiz_id: Optional[int] = None,
+    ) -> list:
+        """Attempts and average score per day or week, read from the daily rollup."""
+        member = await member_crud.get_one(id_=user_id, db=db)
+        company = await company_crud.get_one(id_=company_id, db=db)
+        check_user_permissions(member=member, company=company, user_id=user_id)
+        if bucket not in ("day", "week"):
+            raise HTTPException(status_code=400, detail="Unknown bucket")
+        if from_ > to:
+            raise HTTPException(
+                status_code=400, detail="'from' must not be later than 'to'"
+            )
+
+        bucket_start = cast(
+            func.date_trunc(literal(bucket), QuizResultDailyModel.day),
+            Date,
+        ).label("bucket_start")
+        filters = [
+            QuizResultDailyModel.company_id == company_id,
+            QuizResultDailyModel.day >= from_,
+            QuizResultDailyModel.day <= to,
+        ]
+        if id_ is not None:
+            filters.append(QuizResultDailyModel.user_id == id_)
+        if quiz_id is not None:
+            filters.append(QuizResultDailyModel.quiz_id == quiz_id)
+
+        stmt = (
+            select(
+                bucket_start,
+                func.sum(QuizResultDailyModel.attempts).label("attempts"),
+                daily_average_score().label("average_score"),
+            )
+            .where(*filters)
+            .group_by(bucket_start)
+            .order_by(bucket_start)
+        )
+        result = await db.execute(stmt)
+        return [row._asdict() for row in result.all()]
+
     async def get_all_company_users_last_attempt(
-        self, user_id: int, company_id: int, db: AsyncSession
-    ):
+        self,
+        user_id: int,
+        company_id: int,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> dict:
         member = await member_crud.get_one(id_=user_id, db=db)
         company = await company_crud.get_one(id_=company_id, db=db)
         check_user_permissions(member=member, company=company, user_id=user_id)
@@ -333,24 +420,39 @@ class QuizResultService:
             select(
                 UserModel.id.label("user_id"),
                 UserModel.username.label("username"),
-                func.max(QuizResultModel.registration_date).label("last_attempt"),
+                func.max(QuizResultAggregateModel.last_attempt).label("last_attempt"),
             )
-            .join(QuizResultModel, QuizResultModel.user_id == UserModel.id)
-            .where(QuizResultModel.company_id == company_id)
-            .group_by(UserModel.id, UserModel.username)
+            .join(
+                QuizResultAggregateModel,
+                QuizResultAggregateModel.user_id == UserModel.id,
+            )
+            .where(QuizResultAggregateModel.company_id == company_id)
+        )
+        if cursor is not None:
+            stmt = stmt.where(UserModel.id > decode_cursor(cursor))
+        stmt = (
+            stmt.group_by(UserModel.id, UserModel.username)
             .order_by(UserModel.id)
+            .limit(limit + 1)
         )
 
         result = await db.execute(stmt)
         users_last_attempt = result.all()
 
-        if not users_last_attempt:
+        if not users_last_attempt and cursor is None:
             raise HTTPException(
                 status_code=404, detail="No quiz attempts found for the company."
             )
 
-        result_list = [row._asdict() for row in users_last_attempt]
-        return result_list
+        next_cursor = None
+        if len(users_last_attempt) > limit:
+            users_last_attempt = users_last_attempt[:limit]
+            next_cursor = encode_cursor(users_last_attempt[-1].user_id)
+
+        return {
+            "items": [row._asdict() for row in users_last_attempt],
+            "next_cursor": next_cursor,
+        }
 
 
 quiz_result_service = QuizResultService()
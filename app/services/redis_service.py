@@ -1,135 +1,232 @@
 import csv
+import io
 import json
+import time
+from typing import AsyncIterator
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.CRUD.company_crud import company_crud
 from app.CRUD.member_crud import member_crud
 from app.db.base import redis_connect
 from app.exceptions.custom_exceptions import check_user_permissions
+from app.utils.pagination import DEFAULT_PAGE_SIZE
 
 
 class RedisService:
+    RESULT_TTL = 172800
+
     def __init__(self):
         self.redis = redis_connect()
 
+    @staticmethod
+    def user_index(user_id: int) -> str:
+        return f"quiz_result_index:user:{user_id}"
+
+    @staticmethod
+    def quiz_index(quiz_id: int) -> str:
+        return f"quiz_result_index:quiz:{quiz_id}"
+
+    @staticmethod
+    def company_index(company_id: int) -> str:
+        return f"quiz_result_index:company:{company_id}"
+
     async def cache_quiz_result(self, data: dict) -> None:
-        data_json = json.dumps(data)
-        key = f"quiz_result:{data['quiz_id']}:{data['user_id']}:{data['company_id']}"
-        await self.redis.set(key, data_json, ex=172800)
+        pipe = self.redis.pipeline(transaction=True)
+        self.queue_quiz_result(pipe=pipe, data=data, now=time.time())
+        await pipe.execute()
 
-    async def get_from_cache(
-        self, key: str, user_id: int, db: AsyncSession, company_name: str
+    def queue_quiz_result(self, pipe, data: dict, now: float) -> None:
+        """Queue the result and its per-user, per-quiz and per-company index
+        entries. Index members are scored by the moment the result expires."""
+        key = f"quiz_result:{data['quiz_id']}:{data['user_id']}:{data['company_id']}"
+        pipe.set(key, json.dumps(data), ex=self.RESULT_TTL)
+        for index in (
+            self.user_index(data["user_id"]),
+            self.quiz_index(data["quiz_id"]),
+            self.company_index(data["company_id"]),
+        ):
+            pipe.zadd(index, {key: now + self.RESULT_TTL})
+            pipe.zremrangebyscore(index, "-inf", now)
+            pipe.expire(index, self.RESULT_TTL)
+
+    async def get_indexed(
+        self, index: str, key_prefix: str | None = None, limit: int | None = None
     ) -> list:
+        """Read the live results in ``index``. With ``limit`` only the most
+        recent ones are read, still oldest first, before ``key_prefix`` applies."""
+        now = time.time()
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zremrangebyscore(index, "-inf", now)
+        if limit is None:
+            pipe.zrangebyscore(index, now, "+inf")
+        else:
+            pipe.zrevrangebyscore(index, "+inf", now, start=0, num=limit)
+        _, keys = await pipe.execute()
+        if limit is not None:
+            keys = keys[::-1]
+        if key_prefix is not None:
+            prefix = key_prefix.encode()
+            keys = [key for key in keys if key.startswith(prefix)]
+        if not keys:
+            return []
+        cache = await self.redis.mget(keys)
+        return [json.loads(value) for value in cache if value is not None]
+
+    async def check_company_permissions(
+        self, user_id: int, company_name: str, db: AsyncSession
+    ) -> None:
         member = await member_crud.get_one(id_=user_id, db=db)
         company = await company_crud.get_one_by_filter(
             filters={"name": company_name}, db=db
         )
         check_user_permissions(member=member, company=company, user_id=user_id)
-        keys = await self.redis.keys(key)
-        cache = await self.redis.mget(keys)
-        if not cache:
+
+    async def get_from_cache(
+        self,
+        index: str,
+        user_id: int,
+        db: AsyncSession,
+        company_name: str,
+        key_prefix: str | None = None,
+        limit: int | None = None,
+    ) -> list:
+        await self.check_company_permissions(
+            user_id=user_id, company_name=company_name, db=db
+        )
+        parsed_values = await self.get_indexed(
+            index=index, key_prefix=key_prefix, limit=limit
+        )
+        if not parsed_values:
             raise HTTPException(status_code=404, detail="Cache was not found")
-        parsed_values = [json.loads(value) for value in cache]
         return parsed_values
 
     async def admin_get_cache_for_user(
         self, id_: int, quiz_id: int, user_id: int, db: AsyncSession, company_name: str
     ) -> list:
-        key = f"quiz_result:{quiz_id}:{id_}:*"
         return await self.get_from_cache(
-            key=key, db=db, user_id=user_id, company_name=company_name
+            index=self.user_index(id_),
+            key_prefix=f"quiz_result:{quiz_id}:{id_}:",
+            db=db,
+            user_id=user_id,
+            company_name=company_name,
         )
 
     async def get_cached_result(
         self, quiz_id: int, user_id: int, db: AsyncSession, company_name: str
     ) -> list:
-        key = f"quiz_result:{quiz_id}:{user_id}:*"
         return await self.get_from_cache(
-            key=key, db=db, user_id=user_id, company_name=company_name
+            index=self.user_index(user_id),
+            key_prefix=f"quiz_result:{quiz_id}:{user_id}:",
+            db=db,
+            user_id=user_id,
+            company_name=company_name,
         )
 
     async def user_get_its_result(self, user_id: int) -> list:
-        key = f"quiz_result:*:{user_id}:*"
-        keys = await self.redis.keys(key)
-        cache = await self.redis.mget(keys)
-        if not cache:
+        parsed_values = await self.get_indexed(index=self.user_index(user_id))
+        if not parsed_values:
             raise HTTPException(status_code=404, detail="Cache was not found")
-        parsed_values = [json.loads(value) for value in cache]
         return parsed_values
 
     async def admin_get_all_cache_by_company_id(
-        self, user_id: int, company_name: str, db: AsyncSession
+        self,
+        user_id: int,
+        company_name: str,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
     ) -> list:
         company = await company_crud.get_one_by_filter(
             filters={"name": company_name}, db=db
         )
         if company is None:
             raise HTTPException(status_code=404, detail="There is no such a company")
-        key = f"quiz_result:*:*:{company.id}"
         return await self.get_from_cache(
-            key=key, db=db, user_id=user_id, company_name=company_name
+            index=self.company_index(company.id),
+            limit=limit,
+            db=db,
+            user_id=user_id,
+            company_name=company_name,
         )
 
     async def admin_get_all_results_by_quiz_id(
-        self, quiz_id: int, user_id: int, company_name: str, db: AsyncSession
+        self,
+        quiz_id: int,
+        user_id: int,
+        company_name: str,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
     ) -> list:
-        key = f"quiz_result:{quiz_id}:*:*"
         return await self.get_from_cache(
-            key=key, db=db, user_id=user_id, company_name=company_name
+            index=self.quiz_index(quiz_id),
+            limit=limit,
+            db=db,
+            user_id=user_id,
+            company_name=company_name,
         )
 
+    async def iter_indexed(
+        self, index: str, key_prefix: str | None = None, chunk_size: int = 500
+    ) -> AsyncIterator[list]:
+        """Walk an index with ZSCAN and yield live results chunk by chunk."""
+        match = f"{key_prefix}*" if key_prefix is not None else None
+        cursor = 0
+        while True:
+            cursor, members = await self.redis.zscan(
+                index, cursor, match=match, count=chunk_size
+            )
+            now = time.time()
+            keys = [key for key, expires_at in members if expires_at > now]
+            if keys:
+                cache = await self.redis.mget(keys)
+                chunk = [json.loads(value) for value in cache if value is not None]
+                if chunk:
+                    yield chunk
+            if cursor == 0:
+                break
+
+    async def export_to_csv(
+        self, index: str, key_prefix: str | None = None
+    ) -> AsyncIterator[str]:
+        chunks = self.iter_indexed(index=index, key_prefix=key_prefix)
+        first_chunk = await anext(chunks, None)
+        if first_chunk is None:
+            raise HTTPException(status_code=404, detail="Cache was not found")
+        return self._csv_rows(first_chunk=first_chunk, chunks=chunks)
+
+    @staticmethod
+    async def _csv_rows(
+        first_chunk: list, chunks: AsyncIterator[list]
+    ) -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        headers = list(first_chunk[0].keys())
+        writer.writerow(headers)
+        chunk = first_chunk
+        while chunk is not None:
+            for result in chunk:
+                writer.writerow([result.get(header) for header in headers])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            chunk = await anext(chunks, None)
+
     async def export_cached_results_for_one_user_to_csv(
         self, user_id: int, id_: int, quiz_id: int, company_name: str, db: AsyncSession
-    ):
-        cache = await self.admin_get_cache_for_user(
-            id_=id_, quiz_id=quiz_id, db=db, company_name=company_name, user_id=user_id
+    ) -> AsyncIterator[str]:
+        await self.check_company_permissions(
+            user_id=user_id, company_name=company_name, db=db
+        )
+        return await self.export_to_csv(
+            index=self.user_index(id_), key_prefix=f"quiz_result:{quiz_id}:{id_}:"
         )
-
-        if cache is None:
-            raise HTTPException(status_code=404, detail="Cache was not found")
-
-        headers = []
-        row = []
-
-        for key in cache[0].keys():
-            headers.append(key)
-
-        for user_cache in cache:
-            for user_data in user_cache.values():
-                row.append(user_data)
-
-        with open("cache.csv", "w", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow(headers)
-            writer.writerow(row)
-        return cache
 
     async def export_all_cached_results_to_csv(
         self, user_id: int, quiz_id: int, company_name: str, db: AsyncSession
-    ) -> list:
-        cache = await self.admin_get_all_results_by_quiz_id(
-            user_id=user_id, quiz_id=quiz_id, db=db, company_name=company_name
+    ) -> AsyncIterator[str]:
+        await self.check_company_permissions(
+            user_id=user_id, company_name=company_name, db=db
         )
-
-        if cache is None:
-            raise HTTPException(status_code=404, detail="Cache was not found")
-
-        headers = []
-        row = []
-
-        for key in cache[0].keys():
-            headers.append(key)
-
-        with open("cache.csv", "w", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow(headers)
-            for user in cache:
-                for user_data in user.values():
-                    row.append(user_data)
-                writer.writerow(row)
-                row = []
-
-        return cache
+        return await self.export_to_csv(index=self.quiz_index(quiz_id))
 
 
 redis_service = RedisService()
@@ -1,4 +1,3 @@
-from typing import Sequence
 from fastapi import Depends
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,12 +10,13 @@ from app.db.models.request_model import RequestModel
 from app.schemas.schemas import MemberCreateSchema
 from app.schemas.schemas import RequestCreateSchema, RequestCreateInSchema
 from app.utils.deps import get_db
+from app.utils.pagination import PageParams, paginate
 
 
 class RequestService:
     async def owner_get_all_requests(
-        self, user_id: int, company_id: int, db: AsyncSession
-    ) -> Sequence:
+        self, user_id: int, company_id: int, page: PageParams, db: AsyncSession
+    ):
         company = await company_crud.get_one(id_=company_id, db=db)
         if company is None:
             raise HTTPException(status_code=404, detail="Such a company does not exist")
@@ -24,10 +24,9 @@ class RequestService:
             raise HTTPException(
                 status_code=403, detail="You do not own the company to get the requests"
             )
-        requests = await request_crud.get_all_by_filter(
-            filters={"company_id": company_id}, db=db
+        return await paginate(
+            crud=request_crud, db=db, page=page, filters={"company_id": company_id}
         )
-        return requests
 
     async def send_request(
         self,
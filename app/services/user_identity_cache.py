@@ -0,0 +1,107 @@
+import json
+from datetime import datetime
+from typing import Optional
+from app.core.config import settings
+from app.db.base import redis_connect
+from app.db.models.user_model import UserModel
+from app.utils.lru_cache import LRUCache
+
+
+class UserIdentityCache:
+    """Short-lived cache of authenticated users keyed by token subject.
+
+    Entries are column snapshots rather than ORM instances, so a cached user
+    is never tied to the session that loaded it. The password hash is left
+    out of them: login and password changes read it from the database.
+    Invalidation only reaches this process and Redis; the LRU of another
+    worker keeps a stale entry until the TTL runs out, which is why the TTL
+    is kept short.
+    """
+
+    def __init__(self):
+        self.local = LRUCache(
+            maxsize=settings.user_cache_size, ttl=settings.user_cache_ttl
+        )
+        self.redis = redis_connect() if settings.user_cache_redis else None
+        self.redis_hits = 0
+        self.redis_misses = 0
+
+    @staticmethod
+    def subject(payload: dict) -> Optional[str]:
+        if payload.get("id") is not None:
+            return f"id:{payload['id']}"
+        if payload.get("email") is not None:
+            return f"email:{payload['email']}"
+        return None
+
+    @staticmethod
+    def _redis_key(subject: str) -> str:
+        return f"user_identity:{subject}"
+
+    @staticmethod
+    def _snapshot(user: UserModel) -> dict:
+        return {
+            "id": user.id,
+            "username": user.username,
+            "email": user.email,
+            "registration_date": (
+                user.registration_date.isoformat() if user.registration_date else None
+            ),
+        }
+
+    @staticmethod
+    def _build(snapshot: dict) -> UserModel:
+        data = dict(snapshot)
+        if data["registration_date"] is not None:
+            data["registration_date"] = datetime.fromisoformat(
+                data["registration_date"]
+            )
+        return UserModel(**data)
+
+    async def get(self, subject: str) -> Optional[UserModel]:
+        snapshot = self.local.get(subject)
+        if snapshot is None and self.redis is not None:
+            payload = await self.redis.get(self._redis_key(subject))
+            if payload is None:
+                self.redis_misses += 1
+                return None
+            self.redis_hits += 1
+            snapshot = json.loads(payload)
+            self.local.set(subject, snapshot)
+        if snapshot is None:
+            return None
+        return self._build(snapshot)
+
+    async def set(self, subject: str, user: UserModel) -> UserModel:
+        """Cache the user and return the same projection a later hit gets."""
+        snapshot = self._snapshot(user)
+        self.local.set(subject, snapshot)
+        if self.redis is not None:
+            await self.redis.set(
+                self._redis_key(subject),
+                json.dumps(snapshot),
+                ex=settings.user_cache_ttl,
+            )
+        return self._build(snapshot)
+
+    async def invalidate(self, user_id: int, email: Optional[str] = None) -> None:
+        """Must be called after the transaction changing the user is committed."""
+        subjects = [f"id:{user_id}"]
+        if email is not None:
+            subjects.append(f"email:{email}")
+        for subject in subjects:
+            self.local.delete(subject)
+        if self.redis is not None:
+            await self.redis.delete(*map(self._redis_key, subjects))
+
+    def stats(self) -> dict:
+        return {
+            **self.local.stats(),
+            "ttl": self.local.ttl,
+            "redis_enabled": self.redis is not None,
+            "redis_hits": self.redis_hits,
+            "redis_misses": self.redis_misses,
+        }
+
+
+user_identity_cache = UserIdentityCache()
@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.CRUD.user_crud import user_crud
 from app.db.models.user_model import UserModel
 from app.schemas.schemas import UserSelfUpdateSchema, UserUpdateInSchema
-from app.utils.deps import pwd_context
+from app.services.password_hasher import password_hasher
 
 
 class UserService:
@@ -12,7 +12,7 @@ class UserService:
     ) -> UserModel:
         data = data.model_dump(exclude={"id", "email"}, exclude_none=True)
         if "password" in data:
-            data["hashed_password"] = pwd_context.hash(data.pop("password"))
+            data["hashed_password"] = await password_hasher.hash(data.pop("password"))
         res = await user_crud.update(id_=id_, data=UserSelfUpdateSchema(**data), db=db)
         return res
 
@@ -0,0 +1,114 @@
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock
+import pytest
+from app.schemas.schemas import AnswerKeyQuestionSchema, QuizAnswerKeySchema
+from app.services.answer_key_service import AnswerKeyService
+
+
+@pytest.fixture
+def answer_key():
+    return QuizAnswerKeySchema(
+        quiz_id=1,
+        company_id=1,
+        name="Test Quiz",
+        description="Test Description",
+        questions=[
+            AnswerKeyQuestionSchema(
+                id=1, text="Question 1", option_ids={1, 2}, correct_option_ids={1}
+            ),
+            AnswerKeyQuestionSchema(
+                id=2, text="Question 2", option_ids={3, 4}, correct_option_ids={4}
+            ),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+@patch("app.services.answer_key_service.redis_connect")
+async def test_get_from_local_cache(mock_redis_connect, answer_key, get_db_fixture):
+    mock_redis = AsyncMock()
+    mock_redis_connect.return_value = mock_redis
+    mock_redis.get.return_value = b"2"
+    service = AnswerKeyService()
+    service.local.set(1, (2, answer_key))
+
+    async for db in get_db_fixture:
+        result = await service.get(quiz_id=1, db=db)
+
+        assert result is answer_key
+        mock_redis.get.assert_awaited_once_with("answer_key_version:1")
+
+
+@pytest.mark.asyncio
+@patch("app.services.answer_key_service.redis_connect")
+async def test_get_skips_stale_local_entry(
+    mock_redis_connect, answer_key, get_db_fixture
+):
+    mock_redis = AsyncMock()
+    mock_redis_connect.return_value = mock_redis
+    mock_redis.get.side_effect = [b"3", answer_key.model_dump_json()]
+    service = AnswerKeyService()
+    service.local.set(1, (2, answer_key.model_copy(update={"name": "Stale"})))
+
+    async for db in get_db_fixture:
+        result = await service.get(quiz_id=1, db=db)
+
+        assert result == answer_key
+        assert mock_redis.get.await_args_list[1].args == ("answer_key:1:3",)
+        assert service.local.get(1) == (3, answer_key)
+
+
+@pytest.mark.asyncio
+@patch("app.services.answer_key_service.AnswerKeyService.load")
+@patch("app.services.answer_key_service.redis_connect")
+async def test_get_builds_and_stores_missing_key(
+    mock_redis_connect, mock_load, answer_key, get_db_fixture
+):
+    mock_redis = AsyncMock()
+    mock_redis_connect.return_value = mock_redis
+    mock_redis.get.side_effect = [None, None]
+    mock_load.return_value = answer_key
+    service = AnswerKeyService()
+
+    async for db in get_db_fixture:
+        result = await service.get(quiz_id=1, db=db)
+
+        assert result == answer_key
+        mock_load.assert_awaited_once_with(quiz_id=1, db=db)
+        mock_redis.set.assert_awaited_once()
+        assert mock_redis.set.await_args.args[0] == "answer_key:1:0"
+
+        mock_load.return_value = None
+        mock_redis.get.side_effect = [None, None]
+        assert await service.get(quiz_id=2, db=db) is None
+
+
+@pytest.mark.asyncio
+@patch("app.services.answer_key_service.redis_connect")
+async def test_invalidate(mock_redis_connect, answer_key):
+    mock_redis = AsyncMock()
+    mock_redis_connect.return_value = mock_redis
+    service = AnswerKeyService()
+    service.local.set(1, (0, answer_key))
+
+    await service.invalidate(quiz_id=1)
+
+    assert service.local.get(1) is None
+    mock_redis.incr.assert_awaited_once_with("answer_key_version:1")
+
+
+def test_from_rows(answer_key):
+    rows = [
+        SimpleNamespace(
+            company_id=1,
+            name="Test Quiz",
+            description="Test Description",
+            question_id=question_id,
+            question_text=f"Question {question_id}",
+            option_id=option_id,
+            is_correct=option_id in (1, 4),
+        )
+        for question_id, option_id in [(1, 1), (1, 2), (2, 3), (2, 4)]
+    ]
+
+    assert AnswerKeyService.from_rows(quiz_id=1, rows=rows) == answer_key
@@ -1,7 +1,9 @@
 from unittest.mock import MagicMock, AsyncMock
 import pytest
+from fastapi import HTTPException
 from app.CRUD.company_crud import CompanyCrud
 from app.db.models.company_model import CompanyModel
+from app.schemas.schemas import CompanyCreateSchema, CompanyUpdateSchema
 
 
 @pytest.fixture
@@ -42,3 +44,65 @@ async def test_get_one_visible_success(get_db_fixture, company_crud):
         assert result.name == "Visible Company"
         assert result.visible is True
         db_session.scalar.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_add_reports_conflict(get_db_fixture, company_crud):
+    company_crud = await company_crud
+    data = CompanyCreateSchema(
+        id=1, name="Company", description="", visible=True, owner_id=1
+    )
+    async for db_session in get_db_fixture:
+        db_session.scalar.side_effect = [None, CompanyModel(id=1)]
+        with pytest.raises(HTTPException) as exc_info:
+            await company_crud.add(data=data, db=db_session)
+        assert exc_info.value.detail == "Company with this ID already exists"
+        db_session.rollback.assert_awaited_once()
+
+        db_session.scalar.side_effect = [None, None]
+        with pytest.raises(HTTPException) as exc_info:
+            await company_crud.add(data=data, db=db_session)
+        assert exc_info.value.detail == "Company with this name already exists"
+        db_session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_filters_on_owner(get_db_fixture, company_crud):
+    company_crud = await company_crud
+    data = CompanyUpdateSchema(description="New description")
+    async for db_session in get_db_fixture:
+        db_session.scalar.return_value = CompanyModel(id=1, owner_id=2)
+        result = await company_crud.update(id_=1, user_id=2, db=db_session, data=data)
+        assert result.id == 1
+        stmt = str(db_session.scalar.await_args.args[0])
+        assert "WHERE company.id = :id_1 AND company.owner_id = :owner_id_1" in stmt
+        assert "RETURNING" in stmt
+        db_session.commit.assert_awaited_once()
+
+        db_session.scalar.side_effect = [None, CompanyModel(id=1, owner_id=3)]
+        with pytest.raises(HTTPException) as exc_info:
+            await company_crud.update(id_=1, user_id=2, db=db_session, data=data)
+        assert exc_info.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_delete_by_owner(get_db_fixture, company_crud):
+    company_crud = await company_crud
+    async for db_session in get_db_fixture:
+        db_session.scalar.return_value = CompanyModel(id=1, owner_id=2)
+        result = await company_crud.delete_by_owner(id_=1, user_id=2, db=db_session)
+        assert result.id == 1
+        db_session.execute.assert_awaited_once()
+        db_session.commit.assert_awaited_once()
+
+        db_session.execute.reset_mock()
+        db_session.scalar.return_value = CompanyModel(id=1, owner_id=3)
+        with pytest.raises(HTTPException) as exc_info:
+            await company_crud.delete_by_owner(id_=1, user_id=2, db=db_session)
+        assert exc_info.value.status_code == 403
+
+        db_session.scalar.return_value = None
+        with pytest.raises(HTTPException) as exc_info:
+            await company_crud.delete_by_owner(id_=1, user_id=2, db=db_session)
+        assert exc_info.value.status_code == 404
+        db_session.execute.assert_not_awaited()
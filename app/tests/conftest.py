@@ -1,5 +1,30 @@
 from unittest.mock import AsyncMock
 import pytest
+from app.utils.query_counter import track_queries
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(n): fail the test if it runs more than n SQL statements",
+    )
+
+
+@pytest.fixture(autouse=True)
+def query_budget(request):
+    marker = request.node.get_closest_marker("query_budget")
+    if marker is None:
+        yield None
+        return
+    budget = marker.args[0]
+    with track_queries() as stats:
+        yield stats
+    if stats.count > budget:
+        pytest.fail(
+            f"{request.node.nodeid} ran {stats.count} SQL statements, "
+            f"over its budget of {budget}",
+            pytrace=False,
+        )
 
 
 @pytest.fixture
@@ -0,0 +1,100 @@
+from unittest.mock import MagicMock, patch
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.db.models.company_model import CompanyModel
+from app.repositories.crud_repository import CrudRepository
+from app.schemas.schemas import CompanyCreateSchema
+
+
+@pytest.fixture
+def company_crud():
+    return CrudRepository(CompanyModel)
+
+
+def compile_pg(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_add_many_uses_one_insert(company_crud, get_db_fixture):
+    data = [
+        CompanyCreateSchema(
+            id=n, name=f"Company {n}", description="", visible=True, owner_id=1
+        )
+        for n in (3, 1, 2)
+    ]
+    async for db in get_db_fixture:
+        db.scalars.return_value.all = MagicMock(return_value=["inserted"])
+
+        assert await company_crud.add_many(data=data, db=db) == ["inserted"]
+
+        stmt, params = db.scalars.await_args.args
+        assert compile_pg(stmt).startswith("INSERT INTO company ")
+        assert "RETURNING" in compile_pg(stmt)
+        assert [row["id"] for row in params] == [3, 1, 2]
+        db.commit.assert_awaited_once()
+
+        db.commit.reset_mock()
+        await company_crud.add_many(data=data, db=db, commit=False)
+        db.commit.assert_not_awaited()
+        assert await company_crud.add_many(data=[], db=db) == []
+
+
+@pytest.mark.asyncio
+async def test_update_many_joins_values(company_crud, get_db_fixture):
+    data = [
+        CompanyCreateSchema(
+            id=n, name=f"Company {n}", description="", visible=False, owner_id=1
+        )
+        for n in (1, 2)
+    ]
+    async for db in get_db_fixture:
+        db.scalars.return_value.all = MagicMock(return_value=["updated"])
+
+        assert await company_crud.update_many(data=data, db=db) == ["updated"]
+
+        stmt = db.scalars.await_args.args[0]
+        compiled = compile_pg(stmt)
+        assert compiled.startswith("UPDATE company SET ")
+        assert "FROM (VALUES " in compiled
+        assert "WHERE company.id = source.id RETURNING" in compiled
+        db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_insert_many_returns_ids_in_order(company_crud, get_db_fixture):
+    rows = [
+        {"name": f"Company {n}", "description": "", "visible": True, "owner_id": 1}
+        for n in range(3)
+    ]
+    async for db in get_db_fixture:
+        db.execute.return_value = MagicMock()
+        db.execute.return_value.scalars.return_value.all.return_value = [7, 8, 9]
+
+        assert await company_crud.insert_many(rows=rows, db=db, return_ids=True) == [
+            7,
+            8,
+            9,
+        ]
+        stmt, params = db.execute.await_args.args
+        assert compile_pg(stmt).endswith("RETURNING company.id")
+        assert params == rows
+
+        assert await company_crud.insert_many(rows=rows, db=db) == []
+        stmt, _ = db.execute.await_args.args
+        assert "RETURNING" not in compile_pg(stmt)
+        db.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_many_chunks_ids(company_crud, get_db_fixture):
+    async for db in get_db_fixture:
+        db.execute.return_value = MagicMock(rowcount=2)
+
+        assert await company_crud.delete_many(ids=[], db=db) == 0
+        db.commit.assert_not_awaited()
+
+        with patch("app.repositories.crud_repository.MAX_BIND_PARAMS", 2):
+            assert await company_crud.delete_many(ids=[1, 2, 3, 4], db=db) == 4
+        assert db.execute.await_count == 2
+        db.commit.assert_awaited_once()
@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+import pytest
+from fastapi import HTTPException
+from app.db.models.option_model import OptionModel
+from app.services.answer_key_service import AnswerKeyService
+from app.services.grading_service import GradingService
+
+
+@pytest.fixture
+def grading_service():
+    return GradingService()
+
+
+@pytest.fixture
+def answer_key():
+    rows = [
+        SimpleNamespace(
+            company_id=1,
+            name="Test Quiz",
+            description="Test Description",
+            question_id=question_id,
+            question_text=f"Question {question_id}",
+            option_id=option_id,
+            is_correct=option_id % 2 == 1,
+        )
+        for question_id, option_id in [(1, 1), (1, 2), (2, 3), (2, 4)]
+    ]
+    return AnswerKeyService.from_rows(quiz_id=1, rows=rows)
+
+
+@pytest.mark.asyncio
+@patch("app.CRUD.option_crud.option_crud.get_all_by_ids")
+async def test_grade_success(
+    mock_get_all_by_ids, grading_service, answer_key, get_db_fixture
+):
+    async for db in get_db_fixture:
+        score, user_answers, questions_info = await grading_service.grade(
+            answer_key=answer_key, options_ids=[1, 4], db=db
+        )
+
+        assert score == 0.5
+        assert user_answers == {
+            "provided_option_1": 1,
+            "is_correct_1": True,
+            "provided_option_2": 4,
+            "is_correct_2": False,
+        }
+        assert questions_info == {
+            "question_text_1": "Question 1",
+            "question_text_2": "Question 2",
+        }
+        mock_get_all_by_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("app.CRUD.option_crud.option_crud.get_all_by_ids")
+async def test_grade_errors(
+    mock_get_all_by_ids, grading_service, answer_key, get_db_fixture
+):
+    async for db in get_db_fixture:
+        with pytest.raises(HTTPException) as exc_info:
+            await grading_service.grade(answer_key=answer_key, options_ids=[1], db=db)
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.detail == "Invalid number of options provided"
+
+        mock_get_all_by_ids.return_value = []
+        with pytest.raises(HTTPException) as exc_info:
+            await grading_service.grade(
+                answer_key=answer_key, options_ids=[1, 99], db=db
+            )
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "There is no such an option with id 99"
+
+        mock_get_all_by_ids.return_value = [
+            OptionModel(id=2, text="Option 2", is_correct=False, question_id=1),
+            OptionModel(id=3, text="Option 3", is_correct=True, question_id=2),
+        ]
+        with pytest.raises(HTTPException) as exc_info:
+            await grading_service.grade(
+                answer_key=answer_key, options_ids=[3, 2], db=db
+            )
+        assert exc_info.value.status_code == 403
+        assert (
+            exc_info.value.detail == "Option provided do not comply with the question"
+        )
+        mock_get_all_by_ids.assert_called_with(ids=[3, 2], db=db)
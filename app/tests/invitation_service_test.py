@@ -6,6 +6,7 @@ from app.db.models.member_model import MemberModel
 from app.db.models.company_model import CompanyModel
 from app.schemas.schemas import InvitationCreateSchema, MemberCreateSchema
 from app.services.invitation_service import InvitationService
+from app.utils.pagination import PageParams
 from app.tests.conftest import get_db_fixture
 
 
@@ -16,9 +17,9 @@ async def invitation_service():
 
 @pytest.mark.asyncio
 @patch("app.CRUD.company_crud.company_crud.get_one")
-@patch("app.CRUD.invitation_crud.invitation_crud.get_all_by_filter")
+@patch("app.CRUD.invitation_crud.invitation_crud.get_page")
 async def test_owner_get_all_invitations_success(
-    mock_get_all_by_filter, mock_get_one, invitation_service, get_db_fixture
+    mock_get_page, mock_get_one, invitation_service, get_db_fixture
 ):
     invitation_service = await invitation_service
     user_id = 1
@@ -30,16 +31,19 @@ async def test_owner_get_all_invitations_success(
         InvitationModel(id=1, company_id=company_id),
         InvitationModel(id=2, company_id=company_id),
     ]
-    mock_get_all_by_filter.return_value = mock_invitations
+    mock_get_page.return_value = (mock_invitations, None)
 
     async for db_session in get_db_fixture:
         result = await invitation_service.owner_get_all_invitations(
-            user_id=user_id, company_id=company_id, db=db_session
+            user_id=user_id,
+            company_id=company_id,
+            page=PageParams(limit=10),
+            db=db_session,
         )
-        assert result == mock_invitations
+        assert result == {"items": mock_invitations, "next_cursor": None}
         mock_get_one.assert_called_once_with(id_=company_id, db=db_session)
-        mock_get_all_by_filter.assert_called_once_with(
-            filters={"company_id": company_id}, db=db_session
+        mock_get_page.assert_called_once_with(
+            db=db_session, limit=10, after_id=None, filters={"company_id": company_id}
         )
 
 
@@ -57,7 +61,10 @@ async def test_owner_get_all_invitations_errors(
     async for db_session in get_db_fixture:
         with pytest.raises(HTTPException) as exc_info:
             await invitation_service.owner_get_all_invitations(
-                user_id=user_id, company_id=company_id, db=db_session
+                user_id=user_id,
+                company_id=company_id,
+                page=PageParams(),
+                db=db_session,
             )
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == "Such a company does not exist"
@@ -66,7 +73,10 @@ async def test_owner_get_all_invitations_errors(
     async for db_session in get_db_fixture:
         with pytest.raises(HTTPException) as exc_info:
             await invitation_service.owner_get_all_invitations(
-                user_id=user_id, company_id=company_id, db=db_session
+                user_id=user_id,
+                company_id=company_id,
+                page=PageParams(),
+                db=db_session,
             )
         assert exc_info.value.status_code == 403
         assert (
@@ -0,0 +1,122 @@
+import json
+import logging
+import multiprocessing
+import os
+from collections import defaultdict
+from unittest.mock import patch
+from app.core.config import settings
+from logging_config import JsonFormatter, SamplingFilter, build_pipeline
+
+
+def make_record(name: str, level: int, msg: str = "hello %s", args=("world",)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def test_json_formatter():
+    payload = json.loads(JsonFormatter().format(make_record("app", logging.INFO)))
+
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "app"
+    assert payload["message"] == "hello world"
+
+
+def test_sampling_filter_uses_longest_prefix():
+    sampling = SamplingFilter({"sqlalchemy": 0.0, "sqlalchemy.pool": 1.0})
+
+    assert sampling.rate("sqlalchemy.engine.Engine") == 0.0
+    assert sampling.rate("sqlalchemy.pool.impl") == 1.0
+    assert sampling.rate("app") == 1.0
+    assert not sampling.filter(make_record("sqlalchemy.engine", logging.INFO))
+    assert sampling.filter(make_record("sqlalchemy.engine", logging.WARNING))
+
+
+def test_pipeline_writes_through_listener(tmp_path):
+    log_file = tmp_path / "app.log"
+    with patch.object(settings, "log_file", str(log_file)), patch.object(
+        settings, "log_sample_rates", {"noisy": 0.0}
+    ):
+        queue_handler, listener = build_pipeline(settings)
+
+    logger = logging.getLogger("logging_config_test")
+    logger.propagate = False
+    logger.addHandler(queue_handler)
+    noisy = logging.getLogger("noisy")
+    noisy.propagate = False
+    noisy.addHandler(queue_handler)
+    listener.start()
+    try:
+        logger.warning("written %d", 1)
+        noisy.info("dropped")
+    finally:
+        listener.stop()
+        logger.removeHandler(queue_handler)
+        noisy.removeHandler(queue_handler)
+
+    lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert [line["message"] for line in lines] == ["written 1"]
+
+
+def test_pipeline_keeps_exc_info_for_the_listener(tmp_path):
+    log_file = tmp_path / "app.log"
+    with patch.object(settings, "log_file", str(log_file)):
+        queue_handler, listener = build_pipeline(settings)
+
+    logger = logging.getLogger("logging_config_test.exc")
+    logger.propagate = False
+    logger.addHandler(queue_handler)
+    listener.start()
+    try:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed %s", "here")
+    finally:
+        listener.stop()
+        logger.removeHandler(queue_handler)
+
+    (line,) = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert line["message"] == "failed here"
+    assert "Traceback" in line["exc_info"]
+    assert "ValueError: boom" in line["exc_info"]
+
+
+def log_lines(log_file: str, count: int) -> None:
+    """Runs in a child process, like one uvicorn worker, and moves its log
+    file away halfway through the way logrotate would."""
+    config = settings.model_copy(update={"log_file": log_file, "web_concurrency": 2})
+    queue_handler, listener = build_pipeline(config)
+    logger = logging.getLogger("logging_config_test.worker")
+    logger.propagate = False
+    logger.addHandler(queue_handler)
+    listener.start()
+    try:
+        for i in range(count):
+            logger.warning("line %d", i)
+            if i == count // 2:
+                path = listener.handlers[1].baseFilename
+                os.rename(path, f"{path}.1")
+    finally:
+        listener.stop()
+
+
+def test_workers_do_not_lose_lines_across_rotation(tmp_path):
+    log_file = str(tmp_path / "app.log")
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=log_lines, args=(log_file, 500)) for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    lines = defaultdict(list)
+    for path in tmp_path.iterdir():
+        for line in path.read_text().splitlines():
+            record = json.loads(line)
+            lines[record["process"]].append(record["message"])
+    assert sorted(lines) == sorted(worker.pid for worker in workers)
+    for messages in lines.values():
+        assert sorted(messages) == sorted(f"line {i}" for i in range(500))
+    assert len(list(tmp_path.iterdir())) == 4
@@ -5,6 +5,7 @@ from app.db.models.member_model import MemberModel
 from app.db.models.company_model import CompanyModel
 from app.services.member_service import MemberService
 from app.tests.conftest import get_db_fixture
+from app.utils.pagination import PageParams, decode_cursor, encode_cursor
 
 
 @pytest.fixture
@@ -14,9 +15,9 @@ async def member_service():
 
 @pytest.mark.asyncio
 @patch("app.CRUD.company_crud.company_crud.get_one", new_callable=AsyncMock)
-@patch("app.CRUD.member_crud.member_crud.get_all_by_filter", new_callable=AsyncMock)
+@patch("app.CRUD.member_crud.member_crud.get_page", new_callable=AsyncMock)
 async def test_get_all_admins_in_company_errors(
-    mock_get_all_by_filter, mock_get_one, get_db_fixture, member_service
+    mock_get_page, mock_get_one, get_db_fixture, member_service
 ):
     member_service = await member_service
     user_id = 1
@@ -26,46 +27,30 @@ async def test_get_all_admins_in_company_errors(
         mock_get_one.return_value = None
         with pytest.raises(HTTPException) as exc_info:
             await member_service.get_all_admins_in_company(
-                user_id=user_id, company_id=company_id, db=db_session
+                user_id=user_id, company_id=company_id, page=PageParams(), db=db_session
             )
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == "There is no such a company"
         mock_get_one.assert_called_once_with(id_=company_id, db=db_session)
 
         mock_get_one.reset_mock()
-        mock_get_all_by_filter.reset_mock()
 
         mock_get_one.return_value = CompanyModel(id=company_id, owner_id=2)
         with pytest.raises(HTTPException) as exc_info:
             await member_service.get_all_admins_in_company(
-                user_id=user_id, company_id=company_id, db=db_session
+                user_id=user_id, company_id=company_id, page=PageParams(), db=db_session
             )
         assert exc_info.value.status_code == 403
         assert exc_info.value.detail == "You do not own such a company"
         mock_get_one.assert_called_once_with(id_=company_id, db=db_session)
-
-        mock_get_one.reset_mock()
-        mock_get_all_by_filter.reset_mock()
-
-        mock_get_one.return_value = CompanyModel(id=company_id, owner_id=user_id)
-        mock_get_all_by_filter.return_value = []  # No admins found
-        with pytest.raises(HTTPException) as exc_info:
-            await member_service.get_all_admins_in_company(
-                user_id=user_id, company_id=company_id, db=db_session
-            )
-        assert exc_info.value.status_code == 404
-        assert exc_info.value.detail == "There are no admins"
-        mock_get_one.assert_called_once_with(id_=company_id, db=db_session)
-        mock_get_all_by_filter.assert_called_once_with(
-            filters={"role": "admin"}, db=db_session
-        )
+        mock_get_page.assert_not_called()
 
 
 @pytest.mark.asyncio
 @patch("app.CRUD.company_crud.company_crud.get_one", new_callable=AsyncMock)
-@patch("app.CRUD.member_crud.member_crud.get_all_by_filter", new_callable=AsyncMock)
+@patch("app.CRUD.member_crud.member_crud.get_page", new_callable=AsyncMock)
 async def test_get_all_admins_in_company_success(
-    mock_get_all_by_filter, mock_get_one, get_db_fixture, member_service
+    mock_get_page, mock_get_one, get_db_fixture, member_service
 ):
     member_service = await member_service
     user_id = 1
@@ -74,16 +59,23 @@ async def test_get_all_admins_in_company_success(
     admins = [MemberModel(id=2, company_id=company_id, role="admin")]
 
     mock_get_one.return_value = company
-    mock_get_all_by_filter.return_value = admins
+    mock_get_page.return_value = (admins, 2)
 
     async for db_session in get_db_fixture:
         result = await member_service.get_all_admins_in_company(
-            user_id=user_id, company_id=company_id, db=db_session
+            user_id=user_id,
+            company_id=company_id,
+            page=PageParams(limit=1, cursor=encode_cursor(1)),
+            db=db_session,
         )
-        assert result == admins
+        assert result["items"] == admins
+        assert decode_cursor(result["next_cursor"]) == 2
         mock_get_one.assert_called_once_with(id_=company_id, db=db_session)
-        mock_get_all_by_filter.assert_called_once_with(
-            filters={"role": "admin"}, db=db_session
+        mock_get_page.assert_called_once_with(
+            db=db_session,
+            limit=1,
+            after_id=1,
+            filters={"company_id": company_id, "role": "admin"},
         )
 
 
@@ -0,0 +1,49 @@
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from prometheus_client import CollectorRegistry
+from app.utils.metrics import HttpMetrics, MetricsMiddleware
+
+
+@pytest.fixture
+def registry():
+    return CollectorRegistry()
+
+
+@pytest.fixture
+def client(registry):
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, metrics=HttpMetrics(registry))
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=404, detail="Item was not found")
+        return {"id": item_id}
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+@pytest.mark.asyncio
+async def test_records_by_route_template(client, registry):
+    async with client:
+        await client.get("/items/1")
+        await client.get("/items/2")
+        await client.get("/items/0")
+        await client.get("/missing")
+
+    sample = registry.get_sample_value
+    route = {"method": "GET", "route": "/items/{item_id}"}
+    assert sample("http_request_duration_seconds_count", route) == 3
+    assert sample("http_responses_total", {**route, "status": "200"}) == 2
+    assert sample("http_responses_total", {**route, "status": "404"}) == 1
+    assert (
+        sample(
+            "http_responses_total",
+            {"method": "GET", "route": "unmatched", "status": "404"},
+        )
+        == 1
+    )
+    assert sample("http_requests_in_progress", {"method": "GET"}) == 0
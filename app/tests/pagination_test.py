@@ -0,0 +1,84 @@
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from app.CRUD.option_crud import option_crud
+from app.db.models.option_model import OptionModel
+from app.utils.pagination import (
+    PageParams,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+    stream_ndjson,
+)
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(42)) == 42
+
+    for cursor in ("not-a-cursor", encode_cursor(1)[:-3], "e30="):
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor)
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Invalid cursor"
+
+
+@pytest.mark.asyncio
+async def test_get_page_returns_next_id(get_db_fixture):
+    options = [OptionModel(id=i) for i in (3, 4, 5)]
+    async for db in get_db_fixture:
+        db.scalars.return_value = MagicMock(all=MagicMock(return_value=options))
+        items, last_id = await option_crud.get_page(db=db, limit=2, after_id=2)
+
+        assert items == options[:2]
+        assert last_id == 4
+        stmt = str(db.scalars.await_args.args[0])
+        assert "option.id >" in stmt
+        assert "ORDER BY option.id" in stmt
+
+        db.scalars.return_value = MagicMock(all=MagicMock(return_value=options))
+        items, last_id = await option_crud.get_page(db=db, limit=3)
+        assert items == options
+        assert last_id is None
+
+
+@pytest.mark.asyncio
+@patch("app.CRUD.option_crud.option_crud.get_page")
+async def test_paginate(mock_get_page, get_db_fixture):
+    options = [OptionModel(id=1), OptionModel(id=2)]
+    mock_get_page.return_value = (options, 2)
+
+    async for db in get_db_fixture:
+        result = await paginate(
+            crud=option_crud,
+            db=db,
+            page=PageParams(limit=2, cursor=encode_cursor(0)),
+            filters={"question_id": 1},
+        )
+
+        assert result == {"items": options, "next_cursor": encode_cursor(2)}
+        mock_get_page.assert_awaited_once_with(
+            db=db, limit=2, after_id=0, filters={"question_id": 1}
+        )
+
+        result = await paginate(crud=option_crud, db=db, page=PageParams(stream=True))
+        assert isinstance(result, StreamingResponse)
+        assert result.media_type == "application/x-ndjson"
+
+
+@pytest.mark.asyncio
+@patch("app.utils.pagination.session")
+async def test_stream_ndjson(mock_session):
+    async def stream_all(db, filters):
+        for id_ in (1, 2):
+            yield OptionModel(id=id_, text=f"Option {id_}", is_correct=False)
+
+    mock_session.return_value.__aenter__ = AsyncMock()
+    mock_session.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    with patch.object(option_crud, "stream_all", stream_all):
+        lines = [line async for line in stream_ndjson(crud=option_crud)]
+
+    assert [json.loads(line)["id"] for line in lines] == [1, 2]
+    assert all(line.endswith("\n") for line in lines)
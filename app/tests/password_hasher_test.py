@@ -0,0 +1,42 @@
+import asyncio
+import pytest
+from fastapi import HTTPException
+from app.services.password_hasher import PasswordHasher
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify():
+    hasher = PasswordHasher(workers=2, queue_limit=2)
+
+    hashed = await hasher.hash("secret")
+
+    assert await hasher.verify("secret", hashed) is True
+    assert await hasher.verify("wrong", hashed) is False
+    stats = hasher.stats()
+    assert stats["completed"] == 3
+    assert stats["in_flight"] == 0
+    assert stats["latency_ms_p99"] >= stats["latency_ms_p50"] > 0
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_saturated():
+    hasher = PasswordHasher(workers=1, queue_limit=1)
+    release = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def blocked():
+        asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+
+    first = asyncio.create_task(hasher._run(blocked))
+    second = asyncio.create_task(hasher._run(lambda: None))
+    await asyncio.sleep(0)
+    assert hasher.queue_depth == 1
+
+    with pytest.raises(HTTPException) as exc_info:
+        await hasher.hash("secret")
+    assert exc_info.value.status_code == 429
+    assert hasher.stats()["rejected"] == 1
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert hasher.stats()["in_flight"] == 0
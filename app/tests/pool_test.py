@@ -0,0 +1,44 @@
+import sqlite3
+from unittest.mock import patch
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+from app.db.base import engine_options
+from app.db.pool import TimedAsyncQueuePool
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_track_checkouts_and_timeouts():
+    pool = TimedAsyncQueuePool(
+        lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=0, timeout=0.05
+    )
+
+    conn = await greenlet_spawn(pool.connect)
+    stats = pool.stats()
+    assert stats["checked_out"] == 1
+    assert stats["idle"] == 0
+    assert stats["checkouts"] == 1
+
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+    stats = pool.stats()
+    assert stats["timeouts"] == 1
+    assert stats["wait_ms_max"] >= 50
+
+    conn.close()
+    stats = pool.stats()
+    assert stats["checked_out"] == 0
+    assert stats["idle"] == 1
+    assert stats["overflow"] == 0
+
+
+def test_engine_options():
+    options = engine_options()
+    assert options["poolclass"] is TimedAsyncQueuePool
+    assert "connect_args" not in options
+
+    with patch("app.db.base.settings.db_pgbouncer", True):
+        connect_args = engine_options()["connect_args"]
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert connect_args["prepared_statement_name_func"]().startswith("__asyncpg_")
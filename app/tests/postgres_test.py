@@ -0,0 +1,352 @@
+"""Tests that need a real PostgreSQL database, given by EXPLAIN_POSTGRES_URL
+like the EXPLAIN checks in query_plan_test.py.
+
+Every test runs in a transaction that is rolled back afterwards: the schema
+is created from the models inside it, and the session commits to savepoints.
+The query budgets cover the optimised paths with enough rows that an N+1
+would exceed them; they include the SAVEPOINT and RELEASE statements sent in
+place of BEGIN and COMMIT, and the reload after each commit.
+"""
+
+import os
+from datetime import date, datetime
+from unittest.mock import AsyncMock, patch
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+from app.CRUD.company_crud import company_crud
+from app.CRUD.quiz_crud import quiz_crud
+from app.CRUD.quiz_result_aggregate_crud import quiz_result_aggregate_crud
+from app.CRUD.quiz_result_daily_crud import quiz_result_daily_crud
+from app.db.base import metadata
+from app.db.models.company_model import CompanyModel
+from app.db.models.member_model import MemberModel
+from app.db.models.option_model import OptionModel
+from app.db.models.question_model import QuestionModel
+from app.db.models.quiz_model import QuizModel
+from app.db.models.quiz_result_aggregate_model import QuizResultAggregateModel
+from app.db.models.quiz_result_daily_model import QuizResultDailyModel
+from app.db.models.quiz_result_model import QuizResultModel
+from app.db.models.user_model import UserModel
+from app.schemas.schemas import (
+    OptionCreateSchema,
+    QuizChangeSummarySchema,
+    QuestionCreateSchema,
+    QuizCreateSchema,
+    QuizResultCreateInSchema,
+)
+from app.services.answer_key_service import AnswerKeyService
+from app.services.quiz_result_service import QuizResultService
+from app.services.quiz_service import QuizService
+from app.utils.pagination import PageParams, decode_cursor, paginate
+from app.utils.query_counter import track_queries
+
+EXPLAIN_POSTGRES_URL = os.getenv("EXPLAIN_POSTGRES_URL")
+
+pytestmark = pytest.mark.skipif(
+    EXPLAIN_POSTGRES_URL is None, reason="EXPLAIN_POSTGRES_URL is not set"
+)
+
+
+@pytest_asyncio.fixture
+async def db():
+    engine = create_async_engine(EXPLAIN_POSTGRES_URL, poolclass=NullPool)
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            # Keep the setup out of the query budget of the test.
+            with track_queries():
+                await conn.run_sync(metadata.create_all)
+                session = AsyncSession(
+                    bind=conn,
+                    expire_on_commit=False,
+                    join_transaction_mode="create_savepoint",
+                )
+                session.add(
+                    UserModel(
+                        id=1, username="owner", hashed_password="x", email="o@x.io"
+                    )
+                )
+                await session.flush()
+                session.add(
+                    CompanyModel(id=1, owner_id=1, name="Company", description="")
+                )
+                await session.commit()
+            try:
+                yield session
+            finally:
+                await session.close()
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+def answer_keys():
+    """A fresh answer key cache in front of an empty Redis."""
+    with patch("app.services.answer_key_service.redis_connect") as mock_connect:
+        mock_connect.return_value = AsyncMock(**{"get.return_value": None})
+        service = AnswerKeyService()
+    with patch("app.services.quiz_result_service.answer_key_service", service):
+        yield service
+
+
+def make_quiz(id_: int = 1, questions: int = 2) -> QuizModel:
+    return QuizModel(
+        id=id_,
+        company_id=1,
+        name=f"Quiz {id_}",
+        description="",
+        questions=[
+            QuestionModel(
+                text=f"Question {n}",
+                options=[
+                    OptionModel(text="right", is_correct=True),
+                    OptionModel(text="wrong", is_correct=False),
+                ],
+            )
+            for n in range(questions)
+        ],
+    )
+
+
+@pytest.mark.asyncio
+@patch(
+    "app.services.quiz_service.answer_key_service.invalidate", new_callable=AsyncMock
+)
+async def test_delete_quiz_returns_its_questions(mock_invalidate, db):
+    db.add(make_quiz())
+    await db.commit()
+    db.expunge_all()
+
+    quiz = await QuizService().delete(id_=1, db=db)
+
+    schema = QuizService.to_schema(quiz)
+    assert [question.text for question in schema.questions] == [
+        "Question 0",
+        "Question 1",
+    ]
+    assert [option.text for option in schema.questions[0].options] == [
+        "right",
+        "wrong",
+    ]
+    assert await db.scalar(select(func.count()).select_from(QuestionModel)) == 0
+    assert await db.scalar(select(func.count()).select_from(OptionModel)) == 0
+    mock_invalidate.assert_awaited_once_with(quiz_id=1)
+
+
+@pytest.mark.asyncio
+async def test_delete_company_returns_its_members(db):
+    db.add(UserModel(id=2, username="member", hashed_password="x", email="m@x.io"))
+    await db.flush()
+    db.add(MemberModel(id=2, company_id=1, role="admin"))
+    await db.commit()
+    db.expunge_all()
+
+    company = await company_crud.delete_by_owner(id_=1, user_id=1, db=db)
+
+    assert [(member.id, member.role) for member in company.members] == [(2, "admin")]
+    assert await db.scalar(select(func.count()).select_from(MemberModel)) == 0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_aggregates_only_touches_drifted_rows(db):
+    at = datetime(2024, 1, 1)
+    db.add_all([make_quiz(id_=n, questions=0) for n in range(1, 5)])
+    await db.flush()
+    db.add_all(
+        [
+            QuizResultModel(
+                user_id=1,
+                company_id=1,
+                quiz_id=quiz_id,
+                score=score,
+                registration_date=at,
+            )
+            for quiz_id, score in [(1, 0.5), (1, 1.0), (2, 1.0), (4, 0.25)]
+        ]
+    )
+    db.add_all(
+        [
+            QuizResultAggregateModel(
+                company_id=1,
+                user_id=1,
+                quiz_id=quiz_id,
+                attempts=attempts,
+                score_sum=score_sum,
+                first_attempt=at,
+                last_attempt=at,
+            )
+            # Quiz 1 is right, quiz 2 drifted, quiz 3 has no results left
+            # and quiz 4 is missing.
+            for quiz_id, attempts, score_sum in [(1, 2, 1.5), (2, 5, 3.0), (3, 1, 1.0)]
+        ]
+    )
+    await db.commit()
+
+    changed = await quiz_result_aggregate_crud.reconcile(company_id=1, db=db)
+    await db.commit()
+
+    assert changed == 3
+    rows = await db.execute(
+        select(
+            QuizResultAggregateModel.quiz_id,
+            QuizResultAggregateModel.attempts,
+            QuizResultAggregateModel.score_sum,
+        ).order_by(QuizResultAggregateModel.quiz_id)
+    )
+    assert rows.all() == [(1, 2, 1.5), (2, 1, 1.0), (4, 1, 0.25)]
+    assert await quiz_result_aggregate_crud.reconcile(company_id=1, db=db) == 0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_daily_only_touches_drifted_buckets(db):
+    db.add_all([make_quiz(id_=n, questions=0) for n in range(1, 3)])
+    await db.flush()
+    db.add_all(
+        [
+            QuizResultModel(
+                user_id=1,
+                company_id=1,
+                quiz_id=quiz_id,
+                score=1.0,
+                registration_date=datetime(2024, 1, day),
+            )
+            for quiz_id, day in [(1, 1), (1, 1), (1, 2), (2, 3)]
+        ]
+    )
+    db.add_all(
+        [
+            QuizResultDailyModel(
+                company_id=1,
+                user_id=1,
+                quiz_id=1,
+                day=date(2024, 1, day),
+                attempts=attempts,
+                score_sum=float(attempts),
+            )
+            # The 1st is right, the 2nd drifted, the 5th has no results left
+            # and quiz 2's bucket on the 3rd is missing.
+            for day, attempts in [(1, 2), (2, 4), (5, 1)]
+        ]
+    )
+    await db.commit()
+
+    changed = await quiz_result_daily_crud.reconcile(company_id=1, db=db)
+    await db.commit()
+
+    assert changed == 3
+    rows = await db.execute(
+        select(
+            QuizResultDailyModel.quiz_id,
+            QuizResultDailyModel.day,
+            QuizResultDailyModel.attempts,
+        ).order_by(QuizResultDailyModel.day)
+    )
+    assert rows.all() == [
+        (1, date(2024, 1, 1), 2),
+        (1, date(2024, 1, 2), 1),
+        (2, date(2024, 1, 3), 1),
+    ]
+    assert await quiz_result_daily_crud.reconcile(company_id=1, db=db) == 0
+
+
+def quiz_data(questions: int) -> QuizCreateSchema:
+    return QuizCreateSchema(
+        name="Quiz",
+        description="",
+        questions=[
+            QuestionCreateSchema(
+                text=f"Question {n}",
+                options=[
+                    OptionCreateSchema(text="right", is_correct=True),
+                    OptionCreateSchema(text="wrong", is_correct=False),
+                ],
+            )
+            for n in range(questions)
+        ],
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(14)
+@patch(
+    "app.services.quiz_service.answer_key_service.invalidate", new_callable=AsyncMock
+)
+async def test_create_quiz_inserts_questions_in_batches(mock_invalidate, db):
+    quiz = await QuizService().create(
+        db=db,
+        user_id=1,
+        company_id=1,
+        notification_text=None,
+        quiz_data=quiz_data(questions=50),
+    )
+
+    assert len(quiz.questions) == 50
+    assert all(len(question.options) == 2 for question in quiz.questions)
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(19)
+@patch(
+    "app.services.quiz_service.answer_key_service.invalidate", new_callable=AsyncMock
+)
+async def test_update_quiz_writes_only_the_diff(mock_invalidate, db):
+    with track_queries():
+        db.add(make_quiz(questions=50))
+        await db.commit()
+        db.expunge_all()
+    data = quiz_data(questions=50)
+    data.questions[0].text = "Changed"
+    data.questions[1].options[1].text = "Changed"
+    del data.questions[2]
+
+    result = await QuizService().update(id_=1, db=db, data=data, user_id=1)
+
+    assert result.changes == QuizChangeSummarySchema(
+        quiz_updated=True, questions_updated=1, questions_deleted=1, options_updated=1
+    )
+    assert len(result.quiz.questions) == 49
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(5)
+async def test_get_page_loads_relationships_per_page(db):
+    with track_queries():
+        db.add_all([make_quiz(id_=n) for n in range(1, 8)])
+        await db.commit()
+        db.expunge_all()
+
+    page = await paginate(crud=quiz_crud, db=db, page=PageParams(limit=5))
+
+    assert [quiz.id for quiz in page["items"]] == [1, 2, 3, 4, 5]
+    assert all(len(quiz.questions) == 2 for quiz in page["items"])
+    assert decode_cursor(page["next_cursor"]) == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(8)
+@patch("app.services.quiz_result_service.redis_service.cache_quiz_result")
+async def test_pass_quiz(mock_cache_result, answer_keys, db):
+    with track_queries():
+        db.add(make_quiz(questions=20))
+        await db.commit()
+        quiz = await db.get(QuizModel, 1)
+        options_ids = [
+            option.id
+            for question in quiz.questions
+            for option in question.options
+            if option.is_correct
+        ]
+        db.expunge_all()
+
+    result = await QuizResultService().pass_quiz(
+        data=QuizResultCreateInSchema(id=1, quiz_id=1, options_ids=options_ids),
+        user_id=1,
+        db=db,
+    )
+
+    assert result.score == 1
+    mock_cache_result.assert_awaited_once()
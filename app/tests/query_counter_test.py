@@ -0,0 +1,52 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+from app.utils.query_counter import QueryCountMiddleware, track_queries
+
+
+@pytest.fixture
+def engine():
+    return create_engine("sqlite://")
+
+
+def test_track_queries(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        conn.execute(text("SELECT 3"))
+
+    assert stats.count == 2
+    assert stats.duration > 0
+
+
+@pytest.mark.query_budget(2)
+def test_query_budget_marker(engine, query_budget):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+
+    assert query_budget.count == 2
+
+
+@pytest.mark.asyncio
+async def test_middleware_reports_server_timing(engine, caplog):
+    app = FastAPI()
+    app.add_middleware(QueryCountMiddleware, budget=2)
+
+    @app.get("/items")
+    def get_items():
+        with engine.connect() as conn:
+            return [conn.execute(text(f"SELECT {n}")).scalar() for n in range(3)]
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/items")
+
+    assert response.json() == [0, 1, 2]
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert response.headers["Server-Timing"].endswith('desc="3 queries"')
+    assert "GET /items ran 3 queries (budget 2)" in caplog.text
@@ -0,0 +1,142 @@
+import pytest
+from app.db.models.option_model import OptionModel
+from app.db.models.question_model import QuestionModel
+from app.db.models.quiz_model import QuizModel
+from app.schemas.schemas import (
+    OptionCreateSchema,
+    QuestionCreateSchema,
+    QuestionPatchSchema,
+    QuizCreateSchema,
+)
+from app.services.quiz_diff_service import QuizDiffService, pair
+
+
+@pytest.fixture
+def quiz_diff_service():
+    return QuizDiffService()
+
+
+@pytest.fixture
+def quiz():
+    return QuizModel(
+        id=1,
+        company_id=1,
+        name="Test Quiz",
+        description="Test Description",
+        questions=[
+            QuestionModel(
+                id=q,
+                text=f"Question {q}",
+                options=[
+                    OptionModel(id=q * 10 + o, text=f"Option {o}", is_correct=o == 1)
+                    for o in (1, 2)
+                ],
+            )
+            for q in (1, 2, 3)
+        ],
+    )
+
+
+def submitted(quiz: QuizModel, **changes) -> QuizCreateSchema:
+    data = QuizCreateSchema(
+        id=quiz.id,
+        name=quiz.name,
+        description=quiz.description,
+        questions=[
+            QuestionCreateSchema(
+                text=question.text,
+                options=[
+                    OptionCreateSchema(text=option.text, is_correct=option.is_correct)
+                    for option in question.options
+                ],
+            )
+            for question in quiz.questions
+        ],
+    )
+    return data.model_copy(update=changes)
+
+
+def test_pair_prefers_equal_text_then_order():
+    pairs, deleted, added = pair(
+        ["a", "b", "c"],
+        ["c", "x", "a", "y", "z"],
+        stored_key=str,
+        incoming_key=str,
+    )
+    assert pairs == [("c", "c"), ("a", "a"), ("b", "x")]
+    assert deleted == []
+    assert added == ["y", "z"]
+
+
+def test_unchanged_quiz_has_empty_diff(quiz_diff_service, quiz):
+    diff = quiz_diff_service.diff(quiz=quiz, data=submitted(quiz))
+
+    assert diff.summary().model_dump() == {
+        "quiz_updated": False,
+        "questions_added": 0,
+        "questions_updated": 0,
+        "questions_deleted": 0,
+        "options_added": 0,
+        "options_updated": 0,
+        "options_deleted": 0,
+    }
+
+
+def test_diff_emits_only_changed_rows(quiz_diff_service, quiz):
+    data = submitted(quiz, id=5, name="Renamed")
+    data.questions[0].text = "Question 1 edited"
+    data.questions[1].options[1].is_correct = True
+    data.questions[1].options.append(
+        OptionCreateSchema(text="Option 3", is_correct=False)
+    )
+    del data.questions[2]
+    data.questions.append(
+        QuestionCreateSchema(
+            text="Question 4",
+            options=[OptionCreateSchema(text="Option 1", is_correct=True)] * 2,
+        )
+    )
+
+    diff = quiz_diff_service.diff(quiz=quiz, data=data)
+
+    assert diff.quiz_fields == {"name": "Renamed", "id": 5}
+    assert diff.question_updates == [
+        QuestionPatchSchema(id=1, text="Question 1 edited"),
+        QuestionPatchSchema(id=3, text="Question 4"),
+    ]
+    assert diff.question_inserts == []
+    assert diff.question_deletes == []
+    assert [option.id for option in diff.option_updates] == [22, 32]
+    assert diff.option_inserts == [
+        {"text": "Option 3", "is_correct": False, "question_id": 2}
+    ]
+    assert diff.option_deletes == []
+
+
+def test_diff_removes_and_adds_questions(quiz_diff_service, quiz):
+    data = submitted(quiz)
+    removed = data.questions.pop(1)
+
+    diff = quiz_diff_service.diff(quiz=quiz, data=data)
+    assert diff.question_deletes == [2]
+    assert diff.summary().questions_deleted == 1
+
+    data.questions.extend([removed, removed.model_copy(update={"text": "New"})])
+    diff = quiz_diff_service.diff(quiz=quiz, data=data)
+    assert diff.question_deletes == []
+    assert diff.question_inserts == [data.questions[-1]]
+    assert diff.summary().options_added == 2
+
+
+def test_keep_missing_merges_questions(quiz_diff_service, quiz):
+    data = submitted(quiz)
+    data.questions = [
+        data.questions[0],
+        QuestionCreateSchema(text="New", options=data.questions[1].options),
+    ]
+
+    diff = quiz_diff_service.diff(quiz=quiz, data=data, keep_missing=True)
+
+    assert diff.question_deletes == []
+    assert diff.question_updates == []
+    assert diff.question_inserts == [data.questions[1]]
@@ -0,0 +1,119 @@
+import os
+import tempfile
+from datetime import datetime
+from types import SimpleNamespace
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+from app.services.quiz_export_service import QuizExportService, QuizWorkbookWriter
+
+
+def row(quiz_id, question_id=None, option_id=None, is_correct=False):
+    return SimpleNamespace(
+        quiz_id=quiz_id,
+        company_id=1,
+        name=f"Quiz {quiz_id}",
+        description="Description",
+        pass_count=0,
+        registration_date=datetime(2024, 1, 1),
+        question_id=question_id,
+        question_text=f"Question {question_id}",
+        option_id=option_id,
+        option_text=f"Option {option_id}",
+        is_correct=is_correct,
+    )
+
+
+class StreamResult:
+    def __init__(self, partitions):
+        self._partitions = partitions
+
+    async def partitions(self):
+        for partition in self._partitions:
+            yield partition
+
+
+def test_writer_splits_rows_into_sheets(tmp_path):
+    path = str(tmp_path / "export.xlsx")
+    writer = QuizWorkbookWriter(path)
+    writer.write_rows([row(1, 1, 1, True), row(1, 1, 2)])
+    writer.write_rows([row(1, 2, 3), row(2)])
+    writer.close()
+
+    sheets = pd.read_excel(path, sheet_name=None)
+    assert sheets["Quiz"]["quiz_id"].tolist() == [1, 2]
+    assert sheets["Questions"]["question_id"].tolist() == [1, 2]
+    assert sheets["Options"][["option_id", "question_text", "is_correct"]].to_dict(
+        "records"
+    ) == [
+        {"option_id": 1, "question_text": "Question 1", "is_correct": True},
+        {"option_id": 2, "question_text": "Question 1", "is_correct": False},
+        {"option_id": 3, "question_text": "Question 2", "is_correct": False},
+    ]
+    assert writer.quizzes == 2
+
+
+@pytest.mark.asyncio
+async def test_export_streams_into_temp_file(get_db_fixture):
+    service = QuizExportService(chunk_size=2)
+    async for db in get_db_fixture:
+        db.stream.return_value = StreamResult([[row(1, 1, 1), row(1, 1, 2)], [row(2)]])
+
+        path = await service.export(db=db, company_id=1)
+
+        try:
+            assert pd.read_excel(path, sheet_name="Quiz").shape == (2, 6)
+        finally:
+            os.unlink(path)
+        stmt = db.stream.await_args.args[0]
+        assert stmt.get_execution_options()["yield_per"] == 2
+
+
+@pytest.mark.asyncio
+async def test_export_missing_quiz_removes_file(get_db_fixture, monkeypatch):
+    created = []
+    mkstemp = tempfile.mkstemp
+
+    def tracking_mkstemp(**kwargs):
+        fd, path = mkstemp(**kwargs)
+        created.append(path)
+        return fd, path
+
+    monkeypatch.setattr(
+        "app.services.quiz_export_service.tempfile.mkstemp", tracking_mkstemp
+    )
+    async for db in get_db_fixture:
+        db.stream.return_value = StreamResult([])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await QuizExportService().export(db=db, quiz_id=1)
+
+        assert exc_info.value.status_code == 404
+        assert not os.path.exists(created[0])
+
+
+def test_writer_rejects_full_sheet(tmp_path, monkeypatch):
+    monkeypatch.setattr("app.services.quiz_export_service.MAX_ROWS", 2)
+    writer = QuizWorkbookWriter(str(tmp_path / "export.xlsx"))
+    writer.write_rows([row(1)])
+
+    with pytest.raises(HTTPException) as exc_info:
+        writer.write_rows([row(2)])
+    assert exc_info.value.status_code == 413
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_export_too_large_removes_temp_files(
+    get_db_fixture, tmp_path, monkeypatch
+):
+    monkeypatch.setattr("app.services.quiz_export_service.MAX_ROWS", 2)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    async for db in get_db_fixture:
+        db.stream.return_value = StreamResult([[row(1, 1, 1)], [row(2, 2, 2)]])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await QuizExportService().export(db=db, company_id=1)
+
+        assert exc_info.value.status_code == 413
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,140 @@
+import io
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+import pytest
+from fastapi import HTTPException, UploadFile
+from app.db.models.company_model import CompanyModel
+from app.db.models.quiz_model import QuizModel
+from app.schemas.schemas import (
+    OptionCreateSchema,
+    QuestionCreateSchema,
+    QuizCreateSchema,
+    QuizImportJobSchema,
+)
+from app.services.quiz_import_job_service import QuizImportJobService
+from app.services.quiz_import_service import QuizImportError
+
+
+@pytest.fixture
+def redis_client():
+    with patch("app.services.quiz_import_job_service.redis_connect") as connect:
+        client = AsyncMock()
+        client.pipeline = MagicMock(return_value=MagicMock(execute=AsyncMock()))
+        connect.return_value = client
+        yield client
+
+
+@pytest.fixture
+def job():
+    return QuizImportJobSchema(
+        id="abc",
+        status="queued",
+        company_id=1,
+        user_id=1,
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
+    )
+
+
+@pytest.mark.asyncio
+@patch("app.services.quiz_import_job_service.import_quiz_task")
+@patch("app.CRUD.member_crud.member_crud.get_one")
+@patch("app.CRUD.company_crud.company_crud.get_one")
+async def test_submit_stores_upload_and_enqueues(
+    mock_company_get_one, mock_member_get_one, mock_task, redis_client, get_db_fixture
+):
+    mock_company_get_one.return_value = CompanyModel(id=1, owner_id=1)
+    mock_member_get_one.return_value = None
+    service = QuizImportJobService()
+
+    async for db in get_db_fixture:
+        job = await service.submit(
+            company_id=1,
+            file=UploadFile(io.BytesIO(b"workbook"), filename="quiz.xlsx"),
+            db=db,
+            user_id=1,
+        )
+
+    assert (job.status, job.filename) == ("queued", "quiz.xlsx")
+    pipe = redis_client.pipeline.return_value
+    assert pipe.set.call_args_list[0].args == (
+        f"quiz_import_job:{job.id}:file",
+        b"workbook",
+    )
+    pipe.execute.assert_awaited_once()
+    mock_task.delay.assert_called_once_with(job.id)
+
+
+@pytest.mark.asyncio
+@patch("app.services.quiz_import_job_service.settings.quiz_import_max_bytes", 4)
+async def test_read_upload_limits_size(redis_client):
+    with pytest.raises(HTTPException) as exc_info:
+        await QuizImportJobService.read_upload(UploadFile(io.BytesIO(b"12345")))
+    assert exc_info.value.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_get_checks_owner(redis_client, job):
+    service = QuizImportJobService()
+    redis_client.get.return_value = job.model_dump_json()
+
+    assert await service.get(job_id="abc", user_id=1) == job
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get(job_id="abc", user_id=2)
+    assert exc_info.value.status_code == 403
+
+    redis_client.get.return_value = None
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get(job_id="abc", user_id=1)
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+@patch("app.services.quiz_import_job_service.quiz_service.upsert")
+@patch("app.services.quiz_import_job_service.quiz_import_service.parse")
+async def test_run_reports_progress(
+    mock_parse, mock_upsert, redis_client, job, get_db_fixture
+):
+    service = QuizImportJobService()
+    redis_client.get.side_effect = [job.model_dump_json(), b"workbook"]
+    mock_parse.return_value = QuizCreateSchema(
+        name="Quiz",
+        description="Quiz",
+        questions=[
+            QuestionCreateSchema(
+                text=f"Q{n}",
+                options=[OptionCreateSchema(text="a", is_correct=True)] * 2,
+            )
+            for n in range(3)
+        ],
+    )
+    mock_upsert.return_value = QuizModel(id=7)
+
+    async for db in get_db_fixture:
+        result = await service.run(job_id="abc", db=db)
+
+    assert (result.status, result.quiz_id) == ("completed", 7)
+    assert (result.questions, result.options) == (3, 6)
+    statuses = [
+        QuizImportJobSchema.model_validate_json(c.args[1]).status
+        for c in redis_client.set.call_args_list
+    ]
+    assert statuses == ["parsing", "importing", "completed"]
+    redis_client.delete.assert_awaited_once_with("quiz_import_job:abc:file")
+
+
+@pytest.mark.asyncio
+@patch("app.services.quiz_import_job_service.quiz_import_service.parse")
+async def test_run_records_validation_errors(
+    mock_parse, redis_client, job, get_db_fixture
+):
+    service = QuizImportJobService()
+    redis_client.get.side_effect = [job.model_dump_json(), b"workbook"]
+    mock_parse.side_effect = QuizImportError("The Quiz sheet is empty")
+
+    async for db in get_db_fixture:
+        result = await service.run(job_id="abc", db=db)
+
+    assert result.status == "failed"
+    assert result.errors == ["The Quiz sheet is empty"]
+    redis_client.delete.assert_awaited_once_with("quiz_import_job:abc:file")
@@ -0,0 +1,63 @@
+import io
+import pandas as pd
+import pytest
+from app.services.quiz_import_service import QuizImportError, QuizImportService
+
+
+def workbook(questions: list[str], options: list[dict], quiz=None) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
+        pd.DataFrame(
+            [{"name": "Imported", "description": "Quiz"}] if quiz is None else quiz,
+            columns=["name", "description"],
+        ).to_excel(writer, sheet_name="Quiz", index=False)
+        pd.DataFrame({"question_text": questions}).to_excel(
+            writer, sheet_name="Questions", index=False
+        )
+        pd.DataFrame(
+            options, columns=["question_text", "option_text", "is_correct"]
+        ).to_excel(writer, sheet_name="Options", index=False)
+    buffer.seek(0)
+    return buffer
+
+
+def option(question: str, text, is_correct: bool = False) -> dict:
+    return {"question_text": question, "option_text": text, "is_correct": is_correct}
+
+
+def test_parse_groups_options_by_question():
+    source = workbook(
+        ["Q1", "Q2", "Q1"],
+        [
+            option("Q2", "a"),
+            option("Q1", 1, True),
+            option("Q2", "b", True),
+            option("Q1", 2),
+        ],
+    )
+
+    quiz = QuizImportService().parse(source)
+
+    assert (quiz.name, quiz.description, quiz.id) == ("Imported", "Quiz", None)
+    assert [q.text for q in quiz.questions] == ["Q1", "Q2"]
+    assert [(o.text, o.is_correct) for o in quiz.questions[0].options] == [
+        ("1", True),
+        ("2", False),
+    ]
+    assert [(o.text, o.is_correct) for o in quiz.questions[1].options] == [
+        ("a", False),
+        ("b", True),
+    ]
+
+
+def test_parse_rejects_invalid_workbooks():
+    service = QuizImportService(max_rows=3)
+
+    with pytest.raises(QuizImportError, match="not an Excel workbook"):
+        service.parse(io.BytesIO(b"not a workbook"))
+    with pytest.raises(QuizImportError, match="at least two options"):
+        service.parse(workbook(["Q1"], [option("Q1", "a")]))
+    with pytest.raises(QuizImportError, match="more than 3 rows"):
+        service.parse(workbook(["Q1"], [option("Q1", n) for n in range(4)]))
+    with pytest.raises(QuizImportError, match="Quiz sheet is empty"):
+        service.parse(workbook(["Q1"], [], quiz=[]))
@@ -0,0 +1,99 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.CRUD.quiz_result_crud import QuizResultCrud
+from app.db.models.quiz_result_model import QuizResultModel
+from app.schemas.schemas import QuizResultCreateSchema
+
+
+@pytest.fixture
+async def quiz_result_crud():
+    return QuizResultCrud(QuizResultModel)
+
+
+@pytest.mark.asyncio
+async def test_add_updates_aggregate_in_same_transaction(
+    quiz_result_crud, get_db_fixture
+):
+    quiz_result_crud = await quiz_result_crud
+    data = QuizResultCreateSchema(id=1, quiz_id=2, company_id=3, score=0.5, user_id=4)
+
+    async for db in get_db_fixture:
+        db.commit = AsyncMock()
+        db.scalar.return_value = QuizResultModel(id=1)
+        result = await quiz_result_crud.add(data=data, db=db)
+
+        assert result.id == 1
+        db.commit.assert_awaited_once()
+        insert_result = db.scalar.await_args.args[0]
+        compiled = str(insert_result.compile(dialect=postgresql.dialect()))
+        assert compiled.startswith("INSERT INTO quiz_result ")
+        assert "ON CONFLICT (id) DO NOTHING RETURNING" in compiled
+        upsert, daily_upsert, pass_count = [
+            c.args[0] for c in db.execute.await_args_list
+        ]
+
+        upsert = upsert.compile(dialect=postgresql.dialect())
+        assert str(upsert).startswith("INSERT INTO quiz_result_aggregate ")
+        assert "ON CONFLICT (company_id, user_id, quiz_id) DO UPDATE" in str(upsert)
+        assert upsert.params["score_sum"] == 0.5
+        registration_date = insert_result.compile().params["registration_date"]
+        assert upsert.params["first_attempt"] == registration_date
+
+        daily_upsert = daily_upsert.compile(dialect=postgresql.dialect())
+        assert str(daily_upsert).startswith("INSERT INTO quiz_result_daily ")
+        assert "ON CONFLICT (company_id, user_id, quiz_id, day)" in str(daily_upsert)
+        assert daily_upsert.params["day"] == registration_date.date()
+
+        pass_count = pass_count.compile(dialect=postgresql.dialect())
+        assert str(pass_count).startswith(
+            "UPDATE quiz SET pass_count=(coalesce(quiz.pass_count, "
+        )
+        assert pass_count.params["id_1"] == 2
+
+
+@pytest.mark.asyncio
+async def test_add_skips_existing_result(quiz_result_crud, get_db_fixture):
+    quiz_result_crud = await quiz_result_crud
+    data = QuizResultCreateSchema(id=1, quiz_id=2, company_id=3, score=0.5, user_id=4)
+
+    async for db in get_db_fixture:
+        db.scalar.return_value = None
+        assert await quiz_result_crud.add(data=data, db=db) is None
+        db.execute.assert_not_awaited()
+        db.rollback.assert_awaited_once()
+        db.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@patch("app.CRUD.quiz_result_crud.QuizResultCrud.get_one")
+async def test_delete_refreshes_aggregate(
+    mock_get_one, quiz_result_crud, get_db_fixture
+):
+    quiz_result_crud = await quiz_result_crud
+
+    async for db in get_db_fixture:
+        db.commit = AsyncMock()
+        mock_get_one.return_value = None
+        assert await quiz_result_crud.delete(id_=1, db=db) is None
+        db.execute.assert_not_awaited()
+
+        mock_get_one.return_value = QuizResultModel(
+            id=1,
+            quiz_id=2,
+            company_id=3,
+            user_id=4,
+            registration_date=datetime(2024, 7, 28, 12),
+        )
+        result = await quiz_result_crud.delete(id_=1, db=db)
+
+        assert result.id == 1
+        db.commit.assert_awaited_once()
+        statements = [str(c.args[0]) for c in db.execute.await_args_list]
+        assert statements[0].startswith("DELETE FROM quiz_result ")
+        assert statements[1].startswith("DELETE FROM quiz_result_aggregate ")
+        assert statements[2].startswith("INSERT INTO quiz_result_aggregate ")
+        assert "GROUP BY" in statements[2]
+        assert statements[3].startswith("DELETE FROM quiz_result_daily ")
+        assert statements[4].startswith("INSERT INTO quiz_result_daily ")
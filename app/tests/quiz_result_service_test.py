@@ -1,15 +1,16 @@
-from unittest.mock import patch
+import datetime
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
 import pytest
 from fastapi import HTTPException
 from app.db.models.quiz_result_model import QuizResultModel
 from app.db.models.option_model import OptionModel
-from app.db.models.question_model import QuestionModel
-from app.db.models.quiz_model import QuizModel
 from app.db.models.member_model import MemberModel
 from app.db.models.company_model import CompanyModel
-from app.db.models.user_model import UserModel
 from app.schemas.schemas import QuizResultCreateInSchema, QuizResultCreateSchema
+from app.services.answer_key_service import AnswerKeyService
 from app.services.quiz_result_service import QuizResultService
+from app.utils.pagination import PageParams, decode_cursor_values, encode_cursor
 
 
 @pytest.fixture
@@ -18,32 +19,7 @@ async def quiz_result_service():
 
 
 @pytest.mark.asyncio
-@patch("app.CRUD.quiz_result_crud.quiz_result_crud.get_all_by_filter")
-async def test_user_get_its_result_success(
-    mock_get_all_by_filter, quiz_result_service, get_db_fixture
-):
-    quiz_result_service = await quiz_result_service
-    user_id = 1
-
-    async for db_session in get_db_fixture:
-        mock_results = [
-            QuizResultModel(id=1, user_id=user_id, score=85),
-            QuizResultModel(id=2, user_id=user_id, score=90),
-        ]
-        mock_get_all_by_filter.return_value = mock_results
-
-        result = await quiz_result_service.user_get_its_result(
-            user_id=user_id, db=db_session
-        )
-
-        assert result == mock_results
-        mock_get_all_by_filter.assert_awaited_once_with(
-            db=db_session, filters={"user_id": user_id}
-        )
-
-
-@pytest.mark.asyncio
-@patch("app.CRUD.quiz_result_crud.quiz_result_crud.get_all_by_filter")
+@patch("app.CRUD.quiz_result_crud.quiz_result_crud.get_page")
 @patch("app.CRUD.member_crud.member_crud.get_one")
 @patch("app.CRUD.company_crud.company_crud.get_one")
 async def test_get_all_company_results_success(
@@ -58,26 +34,33 @@ async def test_get_all_company_results_success(
         id=1, owner_id=1, name="Test Company", description="Test Description"
     )
     mock_get_member.return_value = MemberModel(id=1, company_id=1, role="admin")
-    mock_get_results.return_value = [
-        QuizResultCreateSchema(id=1, quiz_id=1, company_id=1, score=0.9, user_id=1),
-        QuizResultCreateSchema(id=2, quiz_id=1, company_id=1, score=0.8, user_id=2),
-    ]
+    mock_get_results.return_value = (
+        [
+            QuizResultCreateSchema(id=1, quiz_id=1, company_id=1, score=0.9, user_id=1),
+            QuizResultCreateSchema(id=2, quiz_id=1, company_id=1, score=0.8, user_id=2),
+        ],
+        None,
+    )
 
     async for db in get_db_fixture:
         results = await quiz_result_service.get_all_company_results(
-            user_id=1, company_id=1, db=db
+            user_id=1, company_id=1, page=PageParams(), db=db
         )
+        assert results["next_cursor"] is None
+        results = results["items"]
         assert len(results) == 2
         assert results[0].id == 1
         assert results[1].id == 2
 
         mock_get_company.assert_called_once_with(id_=1, db=db)
         mock_get_member.assert_called_once_with(id_=1, db=db)
-        mock_get_results.assert_called_once_with(db=db, filters={"company_id": 1})
+        mock_get_results.assert_called_once_with(
+            db=db, limit=50, after_id=None, filters={"company_id": 1}
+        )
 
 
 @pytest.mark.asyncio
-@patch("app.CRUD.quiz_result_crud.quiz_result_crud.get_all_by_filter")
+@patch("app.CRUD.quiz_result_crud.quiz_result_crud.get_page")
 @patch("app.CRUD.member_crud.member_crud.get_one")
 @patch("app.CRUD.company_crud.company_crud.get_one")
 async def test_get_all_company_results_errors(
@@ -92,7 +75,7 @@ async def test_get_all_company_results_errors(
     async for db in get_db_fixture:
         with pytest.raises(HTTPException) as excinfo:
             await quiz_result_service.get_all_company_results(
-                user_id=1, company_id=1, db=db
+                user_id=1, company_id=1, page=PageParams(), db=db
             )
         assert excinfo.value.status_code == 404
         assert excinfo.value.detail == "There is no such a company"
@@ -105,7 +88,7 @@ async def test_get_all_company_results_errors(
     async for db in get_db_fixture:
         with pytest.raises(HTTPException) as excinfo:
             await quiz_result_service.get_all_company_results(
-                user_id=1, company_id=1, db=db
+                user_id=1, company_id=1, page=PageParams(), db=db
             )
         assert excinfo.value.status_code == 403
         assert excinfo.value.detail == "You have no right to get all users results"
@@ -119,7 +102,7 @@ async def test_get_all_company_results_errors(
     async for db in get_db_fixture:
         with pytest.raises(HTTPException) as excinfo:
             await quiz_result_service.get_all_company_results(
-                user_id=1, company_id=1, db=db
+                user_id=1, company_id=1, page=PageParams(), db=db
             )
         assert excinfo.value.status_code == 403
         assert excinfo.value.detail == "You do not have such rights"
@@ -133,7 +116,7 @@ async def test_get_all_company_results_errors(
     async for db in get_db_fixture:
         with pytest.raises(HTTPException) as excinfo:
             await quiz_result_service.get_all_company_results(
-                user_id=1, company_id=1, db=db
+                user_id=1, company_id=1, page=PageParams(), db=db
             )
         assert excinfo.value.status_code == 403
         assert excinfo.value.detail == "You are not a member of the company"
@@ -143,13 +126,13 @@ async def test_get_all_company_results_errors(
 
 
 @pytest.mark.asyncio
-@patch("app.CRUD.quiz_result_crud.quiz_result_crud.get_all_by_filter")
+@patch("app.CRUD.quiz_result_crud.quiz_result_crud.get_page")
 @patch("app.CRUD.company_crud.company_crud.get_one")
 @patch("app.CRUD.member_crud.member_crud.get_one")
 async def test_get_results_for_user_success(
     mock_get_one_member,
     mock_get_one_company,
-    mock_get_all_by_filter,
+    mock_get_page,
     get_db_fixture,
     quiz_result_service,
 ):
@@ -169,14 +152,19 @@ async def test_get_results_for_user_success(
     mock_get_one_member.return_value = MemberModel(
         id=user_id, company_id=company_id, role="admin"
     )
-    mock_get_all_by_filter.return_value = quiz_results
+    mock_get_page.return_value = (quiz_results, None)
 
     async for db in get_db_fixture:
         results = await quiz_result_service.get_results_for_user(
-            user_id=user_id, id_=result_id, company_id=company_id, db=db
+            user_id=user_id,
+            id_=result_id,
+            company_id=company_id,
+            page=PageParams(),
+            db=db,
         )
 
-        assert results == quiz_results
+        assert results == {"items": quiz_results, "next_cursor": None}
+        results = results["items"]
         assert len(results) == 1
         assert results[0].id == 1
         assert results[0].quiz_id == 1
@@ -186,19 +174,19 @@ async def test_get_results_for_user_success(
 
         mock_get_one_company.assert_called_once_with(id_=company_id, db=db)
         mock_get_one_member.assert_called_once_with(id_=user_id, db=db)
-        mock_get_all_by_filter.assert_called_once_with(
-            db=db, filters={"user_id": result_id}
+        mock_get_page.assert_called_once_with(
+            db=db, limit=50, after_id=None, filters={"user_id": result_id}
         )
 
 
 @pytest.mark.asyncio
-@patch("app.CRUD.quiz_result_crud.quiz_result_crud.get_all_by_filter")
+@patch("app.CRUD.quiz_result_crud.quiz_result_crud.get_page")
 @patch("app.CRUD.company_crud.company_crud.get_one")
 @patch("app.CRUD.member_crud.member_crud.get_one")
 async def test_get_results_for_user_error(
     mock_get_one_member,
     mock_get_one_company,
-    mock_get_all_by_filter,
+    mock_get_page,
     get_db_fixture,
     quiz_result_service,
 ):
@@ -216,7 +204,11 @@ async def test_get_results_for_user_error(
     async for db in get_db_fixture:
         with pytest.raises(HTTPException) as exc_info:
             await quiz_result_service.get_results_for_user(
-                user_id=user_id, id_=result_id, company_id=company_id, db=db
+                user_id=user_id,
+                id_=result_id,
+                company_id=company_id,
+                page=PageParams(),
+                db=db,
             )
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == "There is no such a company"
@@ -229,7 +221,11 @@ async def test_get_results_for_user_error(
     async for db in get_db_fixture:
         with pytest.raises(HTTPException) as exc_info:
             await quiz_result_service.get_results_for_user(
-                user_id=user_id, id_=result_id, company_id=company_id, db=db
+                user_id=user_id,
+                id_=result_id,
+                company_id=company_id,
+                page=PageParams(),
+                db=db,
             )
         assert exc_info.value.status_code == 403
         assert exc_info.value.detail == "You have no right to get all users results"
@@ -241,7 +237,11 @@ async def test_get_results_for_user_error(
     async for db in get_db_fixture:
         with pytest.raises(HTTPException) as exc_info:
             await quiz_result_service.get_results_for_user(
-                user_id=user_id, id_=result_id, company_id=company_id, db=db
+                user_id=user_id,
+                id_=result_id,
+                company_id=company_id,
+                page=PageParams(),
+                db=db,
             )
         assert exc_info.value.status_code == 403
         assert exc_info.value.detail == "You do not have such rights"
@@ -256,7 +256,11 @@ async def test_get_results_for_user_error(
     async for db in get_db_fixture:
         with pytest.raises(HTTPException) as exc_info:
             await quiz_result_service.get_results_for_user(
-                user_id=user_id, id_=result_id, company_id=company_id, db=db
+                user_id=user_id,
+                id_=result_id,
+                company_id=company_id,
+                page=PageParams(),
+                db=db,
             )
         assert exc_info.value.status_code == 403
         assert exc_info.value.detail == "You are not a member of the company"
@@ -265,80 +269,75 @@ async def test_get_results_for_user_error(
         id=user_id, company_id=company_id, role="admin"
     )
 
-    mock_get_all_by_filter.return_value = quiz_results
+    mock_get_page.return_value = (quiz_results, None)
     async for db in get_db_fixture:
         results = await quiz_result_service.get_results_for_user(
-            user_id=user_id, id_=result_id, company_id=company_id, db=db
+            user_id=user_id,
+            id_=result_id,
+            company_id=company_id,
+            page=PageParams(),
+            db=db,
+        )
+        assert results == {"items": quiz_results, "next_cursor": None}
+
+        mock_get_page.assert_called_once_with(
+            db=db, limit=50, after_id=None, filters={"user_id": result_id}
         )
-        assert results == quiz_results
 
-        mock_get_all_by_filter.assert_called_once_with(
-            db=db, filters={"user_id": result_id}
+
+def build_answer_key(questions):
+    rows = [
+        SimpleNamespace(
+            company_id=1,
+            name="Test Quiz",
+            description="Test Description",
+            question_id=question_id,
+            question_text=f"Question {question_id}",
+            option_id=option_id,
+            is_correct=is_correct,
         )
+        for question_id, options in questions
+        for option_id, is_correct in options or [(None, False)]
+    ]
+    return AnswerKeyService.from_rows(quiz_id=1, rows=rows)
+
+
+def submitter_row(member_company_id=1, owner_id=2, company_id=1):
+    row = MagicMock()
+    row.email = "user@example.com"
+    row.company_id = company_id
+    row.company_name = "Test Company"
+    row.company_description = "Test Description"
+    row.owner_id = owner_id
+    row.member_company_id = member_company_id
+    return row
 
 
 @pytest.mark.asyncio
-@patch("app.CRUD.quiz_result_crud.quiz_result_crud.get_one")
-@patch("app.CRUD.quiz_result_crud.quiz_result_crud.get_one_by_filter")
 @patch("app.CRUD.quiz_result_crud.quiz_result_crud.add")
-@patch("app.CRUD.quiz_crud.quiz_crud.get_one")
-@patch("app.CRUD.company_crud.company_crud.get_one")
-@patch("app.CRUD.member_crud.member_crud.get_one")
-@patch("app.CRUD.option_crud.option_crud.get_one")
+@patch("app.services.answer_key_service.answer_key_service.get")
+@patch("app.CRUD.option_crud.option_crud.get_all_by_ids")
 @patch("app.services.redis_service.redis_service.cache_quiz_result")
-@patch("app.CRUD.user_crud.user_crud.get_one")
+@patch("app.services.quiz_result_service.QuizResultService.get_submitter")
 async def test_pass_quiz_success(
-    mock_get_one_user,
+    mock_get_submitter,
     mock_cache_quiz_result,
-    mock_get_one_option,
-    mock_get_one_member,
-    mock_get_one_company,
-    mock_get_one_quiz,
+    mock_get_all_options_by_ids,
+    mock_get_answer_key,
     mock_add_quiz_result,
-    mock_get_one_quiz_result_by_filter,
     get_db_fixture,
     quiz_result_service,
 ):
-    quiz_data = QuizResultCreateInSchema(id=1, quiz_id=1, options_ids=[1, 2])
+    quiz_data = QuizResultCreateInSchema(id=1, quiz_id=1, options_ids=[1, 4])
     user_id = 1
     quiz_result_service = await quiz_result_service
 
-    mock_get_one_user.return_value = UserModel(id=1, email="user@example.com")
-    mock_get_one_quiz.return_value = QuizModel(
-        id=1,
-        company_id=1,
-        name="Test Quiz",
-        description="Test Description",
-        questions=[
-            QuestionModel(
-                id=1,
-                text="Question 1",
-                options=[
-                    OptionModel(id=1, text="Option 1", is_correct=True, question_id=1),
-                    OptionModel(id=2, text="Option 2", is_correct=False, question_id=1),
-                ],
-            ),
-            QuestionModel(
-                id=2,
-                text="Question 2",
-                options=[
-                    OptionModel(id=3, text="Option 3", is_correct=True, question_id=2),
-                    OptionModel(id=4, text="Option 4", is_correct=False, question_id=2),
-                ],
-            ),
-        ],
+    mock_get_answer_key.return_value = build_answer_key(
+        [(1, [(1, True), (2, False)]), (2, [(3, True), (4, False)])]
     )
-    mock_get_one_company.return_value = CompanyModel(
-        id=1, owner_id=1, name="Test Company", description="Test Description"
-    )
-    mock_get_one_member.return_value = MemberModel(id=1, company_id=1, role="member")
-    mock_get_one_option.side_effect = [
-        OptionModel(id=1, text="Option 1", is_correct=True, question_id=1),
-        OptionModel(id=3, text="Option 3", is_correct=True, question_id=2),
-    ]
-    mock_get_one_quiz_result_by_filter.return_value = None
+    mock_get_submitter.return_value = submitter_row()
     mock_add_quiz_result.return_value = QuizResultModel(
-        id=1, quiz_id=1, company_id=1, score=1.0, user_id=1
+        id=1, quiz_id=1, company_id=1, score=0.5, user_id=1
     )
 
     async for db in get_db_fixture:
@@ -347,172 +346,123 @@ async def test_pass_quiz_success(
         )
         assert result.quiz_id == quiz_data.quiz_id
         assert result.user_id == user_id
-        assert result.score == 1.0
-
-        mock_get_one_quiz.assert_called_once_with(id_=quiz_data.quiz_id, db=db)
-        mock_get_one_company.assert_called_once_with(id_=1, db=db)
-        mock_get_one_member.assert_called_once_with(id_=user_id, db=db)
-        assert mock_get_one_option.call_count == 2
-        mock_add_quiz_result.assert_called_once()
-
-        cached_data = {
-            "quiz": {
-                "id": 1,
-                "name": "Test Quiz",
-                "description": "Test Description",
-            },
-            "company": {
-                "id": 1,
-                "name": "Test Company",
-                "description": "Test Description",
-            },
-            "user": {"id": 1, "email": "user@example.com"},
-            "questions": {
-                1: {"question_text": "Question 1"},
-                2: {"question_text": "Question 2"},
-            },
-            "score": 1.0,
-            "user_answers": {
-                1: {
-                    "question_text": "Question 1",
-                    "provided_option_id": 1,
-                    "is_correct": True,
-                },
-                2: {
-                    "question_text": "Question 2",
-                    "provided_option_id": 2,
-                    "is_correct": False,
-                },
-            },
-        }
+        assert result.score == 0.5
 
-        mock_cache_quiz_result.assert_called_once_with(data=cached_data)
+        mock_get_answer_key.assert_called_once_with(quiz_id=quiz_data.quiz_id, db=db)
+        mock_get_submitter.assert_awaited_once_with(
+            user_id=user_id, company_id=1, db=db
+        )
+        mock_get_all_options_by_ids.assert_not_called()
+        mock_add_quiz_result.assert_awaited_once_with(
+            data=QuizResultCreateSchema(
+                id=1, quiz_id=1, company_id=1, score=0.5, user_id=user_id
+            ),
+            db=db,
+        )
+        mock_cache_quiz_result.assert_awaited_once_with(
+            data={
+                "quiz_id": 1,
+                "quiz_name": "Test Quiz",
+                "quiz_description": "Test Description",
+                "company_id": 1,
+                "company_name": "Test Company",
+                "company_description": "Test Description",
+                "user_id": user_id,
+                "user_email": "user@example.com",
+                "question_text_1": "Question 1",
+                "question_text_2": "Question 2",
+                "score": 0.5,
+                "provided_option_1": 1,
+                "is_correct_1": True,
+                "provided_option_2": 4,
+                "is_correct_2": False,
+            }
+        )
 
 
 @pytest.mark.asyncio
-@patch("app.CRUD.quiz_result_crud.quiz_result_crud.get_one")
-@patch("app.CRUD.quiz_crud.quiz_crud.get_one")
-@patch("app.CRUD.company_crud.company_crud.get_one")
-@patch("app.CRUD.member_crud.member_crud.get_one")
-@patch("app.CRUD.option_crud.option_crud.get_one")
+@patch("app.CRUD.quiz_result_crud.quiz_result_crud.add")
+@patch("app.services.answer_key_service.answer_key_service.get")
+@patch("app.CRUD.option_crud.option_crud.get_all_by_ids")
+@patch("app.services.quiz_result_service.QuizResultService.get_submitter")
 async def test_pass_quiz_errors(
-    mock_get_one_option,
-    mock_get_one_member,
-    mock_get_one_company,
-    mock_get_one_quiz,
-    mock_get_one_quiz_result,
+    mock_get_submitter,
+    mock_get_all_options_by_ids,
+    mock_get_answer_key,
+    mock_add_quiz_result,
     get_db_fixture,
     quiz_result_service,
 ):
     quiz_data = QuizResultCreateInSchema(id=1, quiz_id=1, options_ids=[1, 2])
     quiz_result_service = await quiz_result_service
 
-    async for db in get_db_fixture:
-        # Test case: Result with such an id already exists
-        mock_get_one_quiz_result.return_value = QuizResultModel(id=1)
+    async def assert_fails(status_code, detail):
         with pytest.raises(HTTPException) as exc_info:
             await quiz_result_service.pass_quiz(data=quiz_data, user_id=1, db=db)
-        assert exc_info.value.status_code == 403
-        assert exc_info.value.detail == "Result with such an id already exists"
+        assert exc_info.value.status_code == status_code
+        assert exc_info.value.detail == detail
 
-        # Reset mock
-        mock_get_one_quiz_result.return_value = None
+    async for db in get_db_fixture:
+        mock_get_answer_key.return_value = None
+        await assert_fails(404, "There is no such a quiz")
 
-        # Test case: No such quiz
-        mock_get_one_quiz.return_value = None
-        with pytest.raises(HTTPException) as exc_info:
-            await quiz_result_service.pass_quiz(data=quiz_data, user_id=1, db=db)
-        assert exc_info.value.status_code == 404
-        assert exc_info.value.detail == "There is no such a quiz"
+        mock_get_answer_key.return_value = build_answer_key([(1, [])])
+        mock_get_submitter.return_value = None
+        await assert_fails(404, "User was not found")
 
-        # Set up for the next test cases
-        mock_get_one_quiz.return_value = QuizModel(
-            id=1,
-            company_id=1,
-            name="Test Quiz",
-            description="Test Description",
-            questions=[
-                QuestionModel(id=1, text="Question 1", options=[]),
-            ],
-        )
-        mock_get_one_member.return_value = None
-        mock_get_one_company.return_value = CompanyModel(
-            id=1,
-            owner_id=2,
-            name="Test Company",  # Owner ID different from user_id
-        )
+        mock_get_submitter.return_value = submitter_row(company_id=None)
+        await assert_fails(404, "There is no such a company")
 
-        # Test case: User is not a member of the company
-        with pytest.raises(HTTPException) as exc_info:
-            await quiz_result_service.pass_quiz(data=quiz_data, user_id=1, db=db)
-        assert exc_info.value.status_code == 403
-        assert exc_info.value.detail == "You are not a member of that company"
+        mock_get_submitter.return_value = submitter_row(member_company_id=None)
+        await assert_fails(403, "You are not a member of that company")
 
-        # Update member mock
-        mock_get_one_member.return_value = MemberModel(
-            id=1, company_id=1, role="member"
-        )
+        mock_get_submitter.return_value = submitter_row(member_company_id=2)
+        await assert_fails(403, "You are not a member of that company")
 
-        # Test case: Invalid number of options provided
-        with pytest.raises(HTTPException) as exc_info:
-            await quiz_result_service.pass_quiz(data=quiz_data, user_id=1, db=db)
-        assert exc_info.value.status_code == 403
-        assert exc_info.value.detail == "Invalid number of options provided"
+        mock_get_submitter.return_value = submitter_row()
+        await assert_fails(403, "Invalid number of options provided")
 
-        # Set up for the next test cases
-        mock_get_one_quiz.return_value = QuizModel(
-            id=1,
-            company_id=1,
-            name="Test Quiz",
-            description="Test Description",
-            questions=[
-                QuestionModel(
-                    id=1,
-                    text="Question 1",
-                    options=[
-                        OptionModel(
-                            id=1, text="Option 1", is_correct=True, question_id=1
-                        ),
-                        OptionModel(
-                            id=3, text="Option 3", is_correct=True, question_id=1
-                        ),
-                    ],
-                ),
-                QuestionModel(
-                    id=2,
-                    text="Question 2",
-                    options=[
-                        OptionModel(
-                            id=4, text="Option 1", is_correct=True, question_id=2
-                        ),
-                        OptionModel(
-                            id=5, text="Option 3", is_correct=True, question_id=2
-                        ),
-                    ],
-                ),
-            ],
+        mock_get_answer_key.return_value = build_answer_key(
+            [(1, [(1, True), (3, True)]), (2, [(4, True), (5, True)])]
         )
+        mock_get_all_options_by_ids.return_value = []
+        await assert_fails(404, "There is no such an option with id 2")
 
-        # Test case: No such option
-        mock_get_one_option.side_effect = [
-            OptionModel(id=1, text="Option 1", is_correct=True, question_id=1),
-            None,
-        ]
-        with pytest.raises(HTTPException) as exc_info:
-            await quiz_result_service.pass_quiz(data=quiz_data, user_id=1, db=db)
-        assert exc_info.value.status_code == 404
-        assert exc_info.value.detail == "There is no such an option with id 2"
-
-        mock_get_one_option.side_effect = [
-            OptionModel(id=1, text="Option 1", is_correct=True, question_id=1),
+        mock_get_all_options_by_ids.return_value = [
             OptionModel(id=2, text="Option 2", is_correct=False, question_id=1),
         ]
-        with pytest.raises(HTTPException) as exc_info:
-            await quiz_result_service.pass_quiz(data=quiz_data, user_id=1, db=db)
-        assert exc_info.value.status_code == 403
-        assert (
-            exc_info.value.detail == "Option provided do not comply with the question"
-        )
+        await assert_fails(403, "Option provided do not comply with the question")
+
+        quiz_data = QuizResultCreateInSchema(id=1, quiz_id=1, options_ids=[1, 4])
+        mock_add_quiz_result.return_value = None
+        await assert_fails(403, "Result with such an id already exists")
+
+
+@pytest.mark.asyncio
+@patch("app.services.quiz_result_service.redis_service.cache_quiz_result")
+async def test_pass_quiz_as_company_owner(
+    mock_cache_quiz_result, get_db_fixture, quiz_result_service
+):
+    quiz_result_service = await quiz_result_service
+    quiz_data = QuizResultCreateInSchema(id=1, quiz_id=1, options_ids=[1])
+
+    async for db in get_db_fixture:
+        with patch(
+            "app.services.answer_key_service.answer_key_service.get",
+            return_value=build_answer_key([(1, [(1, True)])]),
+        ), patch(
+            "app.services.quiz_result_service.QuizResultService.get_submitter",
+            return_value=submitter_row(member_company_id=None, owner_id=1),
+        ), patch(
+            "app.CRUD.quiz_result_crud.quiz_result_crud.add",
+            return_value=QuizResultModel(id=1, score=1.0),
+        ):
+            result = await quiz_result_service.pass_quiz(
+                data=quiz_data, user_id=1, db=db
+            )
+
+        assert result.score == 1.0
+        mock_cache_quiz_result.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -566,3 +516,144 @@ async def test_get_average_score_for_company_not_found(
         assert exc_info.value.detail == "Such a company does not exist"
 
         mock_get_one.assert_awaited_once_with(id_=company_id, db=db_session)
+
+
+@pytest.mark.asyncio
+@patch("app.CRUD.company_crud.company_crud.get_one")
+@patch("app.CRUD.member_crud.member_crud.get_one")
+async def test_get_company_results_last_week_pages(
+    mock_get_one_member, mock_get_one_company, quiz_result_service, get_db_fixture
+):
+    quiz_result_service = await quiz_result_service
+    mock_get_one_company.return_value = CompanyModel(id=1, owner_id=1)
+    mock_get_one_member.return_value = MemberModel(id=1, company_id=1, role="admin")
+    now = datetime.datetime.utcnow()
+    rows = [
+        MagicMock(
+            id=i, registration_date=now, _asdict=MagicMock(return_value={"id": i})
+        )
+        for i in (1, 2, 3)
+    ]
+
+    async for db in get_db_fixture:
+        db.execute.return_value = MagicMock(fetchall=MagicMock(return_value=rows))
+        page = await quiz_result_service.get_company_results_last_week(
+            user_id=1, company_id=1, limit=2, db=db
+        )
+
+        assert page["items"] == [{"id": 1}, {"id": 2}]
+        assert decode_cursor_values(page["next_cursor"]) == {
+            "id": 2,
+            "registration_date": now.isoformat(),
+        }
+        assert "LIMIT" in str(db.execute.await_args.args[0])
+
+        db.execute.return_value = MagicMock(fetchall=MagicMock(return_value=[]))
+        page = await quiz_result_service.get_company_results_last_week(
+            user_id=1, company_id=1, limit=2, cursor=page["next_cursor"], db=db
+        )
+        assert page == {"items": [], "next_cursor": None}
+        assert "(quiz_result.registration_date, quiz_result.id) >" in str(
+            db.execute.await_args.args[0]
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await quiz_result_service.get_company_results_last_week(
+                user_id=1, company_id=1, db=db
+            )
+        assert exc_info.value.status_code == 404
+
+        with pytest.raises(HTTPException) as exc_info:
+            await quiz_result_service.get_company_results_last_week(
+                user_id=1, company_id=1, cursor=encode_cursor(1), db=db
+            )
+        assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+@patch("app.CRUD.company_crud.company_crud.get_one")
+@patch("app.CRUD.member_crud.member_crud.get_one")
+async def test_get_all_company_users_last_attempt_pages(
+    mock_get_one_member, mock_get_one_company, quiz_result_service, get_db_fixture
+):
+    quiz_result_service = await quiz_result_service
+    mock_get_one_company.return_value = CompanyModel(id=1, owner_id=1)
+    mock_get_one_member.return_value = MemberModel(id=1, company_id=1, role="admin")
+    rows = [
+        MagicMock(user_id=i, _asdict=MagicMock(return_value={"user_id": i}))
+        for i in (1, 2, 3)
+    ]
+
+    async for db in get_db_fixture:
+        db.execute.return_value = MagicMock(all=MagicMock(return_value=rows))
+        page = await quiz_result_service.get_all_company_users_last_attempt(
+            user_id=1, company_id=1, limit=2, db=db
+        )
+
+        assert page["items"] == [{"user_id": 1}, {"user_id": 2}]
+        assert decode_cursor_values(page["next_cursor"]) == {"id": 2}
+        assert "LIMIT" in str(db.execute.await_args.args[0])
+
+        db.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+        page = await quiz_result_service.get_all_company_users_last_attempt(
+            user_id=1, company_id=1, limit=2, cursor=page["next_cursor"], db=db
+        )
+        assert page == {"items": [], "next_cursor": None}
+        assert '"user".id >' in str(db.execute.await_args.args[0])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await quiz_result_service.get_all_company_users_last_attempt(
+                user_id=1, company_id=1, db=db
+            )
+        assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+@patch("app.CRUD.company_crud.company_crud.get_one")
+@patch("app.CRUD.member_crud.member_crud.get_one")
+async def test_get_company_analytics(
+    mock_get_one_member, mock_get_one_company, quiz_result_service, get_db_fixture
+):
+    quiz_result_service = await quiz_result_service
+    mock_get_one_company.return_value = CompanyModel(id=1, owner_id=1)
+    mock_get_one_member.return_value = MemberModel(id=1, company_id=1, role="admin")
+    bucket_row = MagicMock(
+        _asdict=MagicMock(
+            return_value={
+                "bucket_start": datetime.date(2024, 7, 1),
+                "attempts": 3,
+                "average_score": 0.5,
+            }
+        )
+    )
+
+    async for db in get_db_fixture:
+        db.execute.return_value = MagicMock(all=MagicMock(return_value=[bucket_row]))
+        result = await quiz_result_service.get_company_analytics(
+            user_id=1,
+            company_id=1,
+            from_=datetime.date(2024, 7, 1),
+            to=datetime.date(2024, 7, 31),
+            bucket="week",
+            quiz_id=2,
+            db=db,
+        )
+
+        assert result == [bucket_row._asdict()]
+        compiled = db.execute.await_args.args[0].compile()
+        stmt = str(compiled)
+        assert "date_trunc(:param_1, quiz_result_daily.day)" in stmt
+        assert compiled.params["param_1"] == "week"
+        assert "quiz_result_daily.quiz_id =" in stmt
+        assert "quiz_result_daily.user_id =" not in stmt
+
+        with pytest.raises(HTTPException) as exc_info:
+            await quiz_result_service.get_company_analytics(
+                user_id=1,
+                company_id=1,
+                from_=datetime.date(2024, 8, 1),
+                to=datetime.date(2024, 7, 1),
+                bucket="day",
+                db=db,
+            )
+        assert exc_info.value.status_code == 400
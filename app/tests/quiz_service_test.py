@@ -1,11 +1,14 @@
 from unittest.mock import patch, AsyncMock
 import pytest
 from fastapi import HTTPException
+from app.db.models.option_model import OptionModel
 from app.db.models.question_model import QuestionModel
 from app.db.models.quiz_model import QuizModel
 from app.db.models.member_model import MemberModel
 from app.db.models.company_model import CompanyModel
 from app.schemas.schemas import (
+    OptionPatchSchema,
+    QuizChangeSummarySchema,
     QuizCreateSchema,
     QuestionCreateSchema,
     OptionCreateSchema,
@@ -45,13 +48,19 @@ def valid_quiz_data():
 
 
 @pytest.mark.asyncio
+@patch("app.services.answer_key_service.answer_key_service.invalidate")
 @patch("app.CRUD.company_crud.company_crud.get_one")
 @patch("app.CRUD.member_crud.member_crud.get_one")
 @patch("app.CRUD.quiz_crud.quiz_crud.get_one")
+@patch("app.CRUD.option_crud.option_crud.insert_many")
+@patch("app.CRUD.question_crud.question_crud.insert_many")
 async def test_create_quiz_success(
+    mock_question_insert_many,
+    mock_option_insert_many,
     mock_quiz_get_one,
     mock_member_get_one,
     mock_company_get_one,
+    mock_invalidate_answer_key,
     quiz_service,
     get_db_fixture,
     valid_quiz_data,
@@ -62,6 +71,7 @@ async def test_create_quiz_success(
         None,
         AsyncMock(id=valid_quiz_data.id, description=valid_quiz_data.description),
     ]
+    mock_question_insert_many.return_value = [11, 12]
     quiz_service = await quiz_service
     async for db_session in get_db_fixture:
         db_session.add = AsyncMock()
@@ -80,31 +90,44 @@ async def test_create_quiz_success(
         assert result.name == valid_quiz_data.name
         assert result.description == valid_quiz_data.description
 
-        expected_add_calls = (
-            1
-            + len(valid_quiz_data.questions)
-            + sum(len(q.options) for q in valid_quiz_data.questions)
-        )
-
-        assert db_session.add.call_count == expected_add_calls
+        assert db_session.add.call_count == 1
         assert db_session.commit.call_count == 1
-        assert db_session.flush.call_count == 7
+        assert db_session.flush.call_count == 1
+        mock_question_insert_many.assert_awaited_once_with(
+            rows=[
+                {"text": "Sample Question 1", "quiz_id": valid_quiz_data.id},
+                {"text": "Sample Question 2", "quiz_id": valid_quiz_data.id},
+            ],
+            db=db_session,
+            return_ids=True,
+        )
+        option_rows = mock_option_insert_many.await_args.kwargs["rows"]
+        assert [(row["text"], row["question_id"]) for row in option_rows] == [
+            ("Option 1", 11),
+            ("Option 2", 11),
+            ("Option 3", 12),
+            ("Option 4", 12),
+        ]
+        db_session.execute.assert_awaited_once()
+        mock_invalidate_answer_key.assert_awaited_once_with(quiz_id=valid_quiz_data.id)
 
 
 @pytest.mark.asyncio
+@patch("app.services.answer_key_service.answer_key_service.invalidate")
 @patch("app.CRUD.quiz_crud.quiz_crud.get_one")
 @patch("app.CRUD.company_crud.company_crud.get_one")
 @patch("app.CRUD.member_crud.member_crud.get_one")
-@patch("app.CRUD.question_crud.question_crud.get_all_by_filter")
-@patch("app.CRUD.question_crud.question_crud.delete_all_by_filters")
-@patch("app.CRUD.option_crud.option_crud.delete_all_by_filters")
+@patch("app.CRUD.option_crud.option_crud.update_many")
+@patch("app.CRUD.option_crud.option_crud.delete_many")
+@patch("app.CRUD.question_crud.question_crud.insert_many")
 async def test_update_quiz_success(
-    mock_option_delete_all_by_filters,
-    mock_question_delete_all_by_filters,
-    mock_get_all_questions_by_filter,
+    mock_question_insert_many,
+    mock_option_delete_many,
+    mock_option_update_many,
     mock_get_one_member,
     mock_get_one_company,
     mock_get_one_quiz,
+    mock_invalidate_answer_key,
     get_db_fixture,
     quiz_service,
     valid_quiz_data,
@@ -112,37 +135,55 @@ async def test_update_quiz_success(
     quiz_service = await quiz_service
 
     mock_get_one_quiz.return_value = QuizModel(
-        id=1, name="Original Quiz", description="Original Description", company_id=1
+        id=1,
+        name="Original Quiz",
+        description="A sample quiz",
+        company_id=1,
+        questions=[
+            QuestionModel(
+                id=1,
+                text="Sample Question 1",
+                options=[
+                    OptionModel(id=1, text="Option 1", is_correct=True),
+                    OptionModel(id=2, text="Option 2", is_correct=False),
+                ],
+            ),
+            QuestionModel(
+                id=2,
+                text="Sample Question 2",
+                options=[
+                    OptionModel(id=3, text="Option 3", is_correct=True),
+                    OptionModel(id=4, text="Option 4", is_correct=True),
+                    OptionModel(id=5, text="Option 5", is_correct=False),
+                ],
+            ),
+        ],
     )
     mock_get_one_company.return_value = CompanyModel(
         id=1, owner_id=1, name="Test Company", description="Test Description"
     )
     mock_get_one_member.return_value = MemberModel(id=1, company_id=1, role="admin")
-    mock_get_all_questions_by_filter.return_value = [
-        QuestionModel(id=1, text="Original Question 1", quiz_id=1),
-        QuestionModel(id=2, text="Original Question 2", quiz_id=1),
-    ]
+    mock_question_insert_many.return_value = []
 
     async for db in get_db_fixture:
         result = await quiz_service.update(
             id_=1, db=db, data=valid_quiz_data, user_id=1
         )
 
-        assert result.id == valid_quiz_data.id
-        assert result.name == valid_quiz_data.name
-        assert result.description == valid_quiz_data.description
-
-        assert mock_get_one_quiz.call_count == 2
-        mock_get_one_company.assert_called_once_with(id_=1, db=db)
-        mock_get_one_member.assert_called_once_with(id_=1, db=db)
-        mock_get_all_questions_by_filter.assert_called_once_with(
-            filters={"quiz_id": 1}, db=db
+        assert result.quiz.id == valid_quiz_data.id
+        assert result.quiz.name == valid_quiz_data.name
+        assert [q.question_id for q in result.quiz.questions] == [1, 2]
+        assert result.changes == QuizChangeSummarySchema(
+            quiz_updated=True, options_updated=1, options_deleted=1
         )
-        mock_question_delete_all_by_filters.assert_called_once_with(
-            filters={"quiz_id": 1}, db=db
+        mock_option_delete_many.assert_awaited_once_with(ids=[5], db=db, commit=False)
+        mock_option_update_many.assert_awaited_once_with(
+            data=[OptionPatchSchema(id=3, text="Option 3", is_correct=False)],
+            db=db,
+            commit=False,
         )
-        assert mock_option_delete_all_by_filters.call_count == 2
-        assert db.add.call_count == 6
+        db.commit.assert_awaited_once()
+        mock_invalidate_answer_key.assert_awaited_once_with(quiz_id=1)
 
 
 @pytest.mark.asyncio
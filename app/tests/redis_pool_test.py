@@ -0,0 +1,25 @@
+from unittest.mock import AsyncMock, patch
+import pytest
+from app.db.base import redis_connect, redis_pool, redis_pool_stats
+from app.routers.db_check_router import redis_check
+
+
+def test_clients_share_pool():
+    first, second = redis_connect(), redis_connect()
+
+    assert first.connection_pool is redis_pool
+    assert second.connection_pool is redis_pool
+    stats = redis_pool_stats()
+    assert stats["max_connections"] == redis_pool.max_connections
+    assert stats["in_use"] == 0
+
+
+@pytest.mark.asyncio
+@patch("app.routers.db_check_router.redis_connect")
+async def test_redis_check(mock_redis_connect):
+    mock_redis_connect.return_value.ping = AsyncMock()
+
+    response = await redis_check()
+
+    assert response.status_code == 200
+    mock_redis_connect.return_value.ping.assert_awaited_once()
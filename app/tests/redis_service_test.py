@@ -1,10 +1,12 @@
 import json
+import time
 from unittest.mock import patch, MagicMock, AsyncMock, call
 import pytest
 from fastapi import HTTPException
 from app.db.models.member_model import MemberModel
 from app.db.models.company_model import CompanyModel
 from app.services.redis_service import RedisService
+from app.utils.pagination import DEFAULT_PAGE_SIZE
 
 
 @pytest.fixture
@@ -28,13 +30,26 @@ def test_data():
 @patch("app.services.redis_service.redis_connect")
 async def test_cache_quiz_result_success(mock_redis_connect, test_data):
     mock_redis = AsyncMock()
+    mock_pipe = MagicMock()
+    mock_pipe.execute = AsyncMock()
+    mock_redis.pipeline = MagicMock(return_value=mock_pipe)
     mock_redis_connect.return_value = mock_redis
     redis_service = RedisService()
     await redis_service.cache_quiz_result(test_data)
     expected_key = f"quiz_result:{test_data['quiz_id']}:{test_data['user_id']}:{test_data['company_id']}"
     expected_value = json.dumps(test_data)
 
-    mock_redis.set.assert_called_once_with(expected_key, expected_value, ex=172800)
+    mock_pipe.set.assert_called_once_with(expected_key, expected_value, ex=172800)
+    indexes = [zadd_call.args[0] for zadd_call in mock_pipe.zadd.call_args_list]
+    assert indexes == [
+        f"quiz_result_index:user:{test_data['user_id']}",
+        f"quiz_result_index:quiz:{test_data['quiz_id']}",
+        f"quiz_result_index:company:{test_data['company_id']}",
+    ]
+    for zadd_call in mock_pipe.zadd.call_args_list:
+        assert list(zadd_call.args[1]) == [expected_key]
+    assert mock_pipe.expire.call_args_list == [call(index, 172800) for index in indexes]
+    mock_pipe.execute.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -42,7 +57,9 @@ async def test_cache_quiz_result_success(mock_redis_connect, test_data):
 async def test_cache_quiz_result_redis_error(mock_redis_connect, test_data):
     mock_redis = MagicMock()
     mock_redis_connect.return_value = mock_redis
-    mock_redis.set.side_effect = Exception("Redis error")
+    mock_redis.pipeline.return_value.execute = AsyncMock(
+        side_effect=Exception("Redis error")
+    )
     redis_service = RedisService()
     with pytest.raises(Exception, match="Redis error"):
         await redis_service.cache_quiz_result(test_data)
@@ -57,7 +74,9 @@ async def test_get_from_cache_success(
 ):
     mock_redis = AsyncMock()
     mock_redis_connect.return_value = mock_redis
-    mock_redis.keys.return_value = ["key"]
+    mock_pipe = MagicMock()
+    mock_pipe.execute = AsyncMock(return_value=[0, [b"key"]])
+    mock_redis.pipeline = MagicMock(return_value=mock_pipe)
     mock_redis.mget.return_value = [json.dumps({"data": "value"})]
 
     mock_get_member.return_value = MemberModel(id=1, role="admin", company_id=1)
@@ -66,11 +85,15 @@ async def test_get_from_cache_success(
     redis_service = await redis_service
 
     async for session in get_db_fixture:
-        result = await redis_service.get_from_cache("key", 1, session, "Valid Company")
+        result = await redis_service.get_from_cache(
+            "quiz_result_index:user:1", 1, session, "Valid Company"
+        )
 
         assert result == [{"data": "value"}]
-        mock_redis.keys.assert_called_once_with("key")
-        mock_redis.mget.assert_called_once_with(["key"])
+        mock_pipe.zrangebyscore.assert_called_once()
+        assert mock_pipe.zrangebyscore.call_args.args[0] == "quiz_result_index:user:1"
+        mock_redis.keys.assert_not_called()
+        mock_redis.mget.assert_called_once_with([b"key"])
         mock_get_member.assert_called_once_with(id_=1, db=session)
         mock_get_company.assert_called_once_with(
             filters={"name": "Valid Company"}, db=session
@@ -86,6 +109,9 @@ async def test_get_from_cache_errors(
 ):
     mock_redis = AsyncMock()
     mock_redis_connect.return_value = mock_redis
+    mock_pipe = MagicMock()
+    mock_pipe.execute = AsyncMock(return_value=[0, []])
+    mock_redis.pipeline = MagicMock(return_value=mock_pipe)
 
     redis_service = await redis_service
 
@@ -109,7 +135,6 @@ async def test_get_from_cache_errors(
         # Test 4: Cache not found
         mock_get_member.return_value = AsyncMock(id=1, role="admin", company_id=1)
         mock_get_company.return_value = AsyncMock(id=1, owner_id=1)
-        mock_redis.mget.return_value = []
         with pytest.raises(HTTPException, match="Cache was not found"):
             await redis_service.get_from_cache("key", 1, session, "Valid Company")
 
@@ -135,7 +160,8 @@ async def test_admin_get_cache_for_user(
     quiz_id = test_data["quiz_id"]
     user_id = test_data["user_id"]
     company_name = "Valid Company"
-    expected_key = f"quiz_result:{quiz_id}:{id_}:*"
+    expected_index = f"quiz_result_index:user:{id_}"
+    expected_prefix = f"quiz_result:{quiz_id}:{id_}:"
 
     async for session in get_db_fixture:
         # Call the method under test
@@ -148,7 +174,11 @@ async def test_admin_get_cache_for_user(
         )
 
         mock_get_from_cache.assert_called_once_with(
-            key=expected_key, db=session, user_id=user_id, company_name=company_name
+            index=expected_index,
+            key_prefix=expected_prefix,
+            db=session,
+            user_id=user_id,
+            company_name=company_name,
         )
 
 
@@ -162,7 +192,8 @@ async def test_get_cached_result(
     quiz_id = test_data["quiz_id"]
     user_id = test_data["user_id"]
     company_name = "Valid Company"
-    expected_key = f"quiz_result:{quiz_id}:{user_id}:*"
+    expected_index = f"quiz_result_index:user:{user_id}"
+    expected_prefix = f"quiz_result:{quiz_id}:{user_id}:"
 
     async for session in get_db_fixture:
         await redis_service.get_cached_result(
@@ -170,7 +201,11 @@ async def test_get_cached_result(
         )
 
         mock_get_from_cache.assert_called_once_with(
-            key=expected_key, db=session, user_id=user_id, company_name=company_name
+            index=expected_index,
+            key_prefix=expected_prefix,
+            db=session,
+            user_id=user_id,
+            company_name=company_name,
         )
 
 
@@ -181,7 +216,7 @@ async def test_user_get_its_result_success(
 ):
     redis_service = await redis_service
     redis = mock_redis_connect.return_value
-    key = f"quiz_result:*:{test_data['user_id']}:*"
+    key = f"quiz_result:{test_data['quiz_id']}:{test_data['user_id']}:{test_data['company_id']}".encode()
 
     cache_data = [
         json.dumps(
@@ -192,15 +227,41 @@ async def test_user_get_its_result_success(
             }
         )
     ]
-    redis.keys = AsyncMock(return_value=[key])
+    redis.pipeline.return_value.execute = AsyncMock(return_value=[0, [key]])
     redis.mget = AsyncMock(return_value=cache_data)
 
     result = await redis_service.user_get_its_result(user_id=test_data["user_id"])
     assert result == [json.loads(data) for data in cache_data]
-    redis.keys.assert_awaited_once_with(key)
+    assert (
+        redis.pipeline.return_value.zrangebyscore.call_args.args[0]
+        == f"quiz_result_index:user:{test_data['user_id']}"
+    )
     redis.mget.assert_awaited_once_with([key])
 
 
+@pytest.mark.asyncio
+@patch("app.services.redis_service.redis_connect")
+async def test_get_indexed_limit_reads_latest_results(
+    mock_redis_connect, redis_service
+):
+    redis_service = await redis_service
+    redis = mock_redis_connect.return_value
+    pipe = redis.pipeline.return_value
+    pipe.execute = AsyncMock(return_value=[0, [b"newest", b"older"]])
+    redis.mget = AsyncMock(return_value=['{"n": 1}', '{"n": 2}'])
+
+    result = await redis_service.get_indexed(
+        index=redis_service.company_index(1), limit=2
+    )
+
+    assert result == [{"n": 1}, {"n": 2}]
+    pipe.zrangebyscore.assert_not_called()
+    args, kwargs = pipe.zrevrangebyscore.call_args
+    assert args[:2] == ("quiz_result_index:company:1", "+inf")
+    assert kwargs == {"start": 0, "num": 2}
+    redis.mget.assert_awaited_once_with([b"older", b"newest"])
+
+
 @pytest.mark.asyncio
 @patch("app.services.redis_service.company_crud.get_one_by_filter")
 @patch("app.services.redis_service.RedisService.get_from_cache")
@@ -217,7 +278,7 @@ async def test_admin_get_all_cache_by_company_id_success(
         id=test_data["company_id"], name=test_data["company_name"]
     )
 
-    expected_key = f"quiz_result:*:*:{test_data['company_id']}"
+    expected_index = f"quiz_result_index:company:{test_data['company_id']}"
 
     cache_data = [
         json.dumps(
@@ -239,7 +300,8 @@ async def test_admin_get_all_cache_by_company_id_success(
 
         assert result == [json.loads(data) for data in cache_data]
         mock_get_from_cache.assert_called_once_with(
-            key=expected_key,
+            index=expected_index,
+            limit=DEFAULT_PAGE_SIZE,
             db=session,
             user_id=test_data["user_id"],
             company_name=test_data["company_name"],
@@ -254,7 +316,7 @@ async def test_admin_get_all_results_by_quiz_id_success(
     redis_service = await redis_service
 
     # Define expected key based on test_data
-    expected_key = f"quiz_result:{test_data['quiz_id']}:*:*"
+    expected_index = f"quiz_result_index:quiz:{test_data['quiz_id']}"
 
     # Mock the cache data
     cache_data = [
@@ -280,47 +342,44 @@ async def test_admin_get_all_results_by_quiz_id_success(
         # Assertions
         assert result == [json.loads(data) for data in cache_data]
         mock_get_from_cache.assert_called_once_with(
-            key=expected_key,
+            index=expected_index,
+            limit=DEFAULT_PAGE_SIZE,
             db=session,
             user_id=test_data["user_id"],
             company_name=test_data["company_name"],
         )
 
 
+async def collect(rows) -> str:
+    return "".join([chunk async for chunk in rows])
+
+
 @pytest.mark.asyncio
-@patch("app.services.redis_service.RedisService.admin_get_cache_for_user")
-@patch("app.services.redis_service.csv.writer")
-@patch("app.services.redis_service.open")
+@patch("app.services.redis_service.RedisService.check_company_permissions")
+@patch("app.services.redis_service.redis_connect")
 async def test_export_cached_results_for_one_user_to_csv(
-    mock_open,
-    mock_csv_writer,
-    mock_admin_get_cache_for_user,
-    redis_service,
+    mock_redis_connect,
+    mock_check_company_permissions,
     test_data,
     get_db_fixture,
 ):
-    redis_service = await redis_service
-
-    # Mock data
-    cache_data = [
-        {
-            "quiz_id": test_data["quiz_id"],
-            "user_id": test_data["user_id"],
-            "score": test_data["score"],
-        }
+    mock_redis = AsyncMock()
+    mock_redis_connect.return_value = mock_redis
+    redis_service = RedisService()
+    key = f"quiz_result:{test_data['quiz_id']}:{test_data['id_']}:1"
+    mock_redis.zscan.return_value = (0, [(key.encode(), time.time() + 60)])
+    mock_redis.mget.return_value = [
+        json.dumps(
+            {
+                "quiz_id": test_data["quiz_id"],
+                "user_id": test_data["user_id"],
+                "score": test_data["score"],
+            }
+        )
     ]
-    mock_admin_get_cache_for_user.return_value = cache_data
-
-    # Mock the file operation
-    mock_file = MagicMock()
-    mock_open.return_value.__enter__.return_value = mock_file
-
-    # Mock CSV writer
-    mock_writer = MagicMock()
-    mock_csv_writer.return_value = mock_writer
 
     async for session in get_db_fixture:
-        result = await redis_service.export_cached_results_for_one_user_to_csv(
+        rows = await redis_service.export_cached_results_for_one_user_to_csv(
             user_id=test_data["user_id"],
             id_=test_data["id_"],
             quiz_id=test_data["quiz_id"],
@@ -328,23 +387,34 @@ async def test_export_cached_results_for_one_user_to_csv(
             db=session,
         )
 
-        assert result == cache_data
-
-        mock_open.assert_called_once_with("cache.csv", "w", newline="")
-        mock_writer.writerow.assert_any_call(["quiz_id", "user_id", "score"])
-        mock_writer.writerow.assert_any_call(
-            [test_data["quiz_id"], test_data["user_id"], test_data["score"]]
+        assert await collect(rows) == (
+            "quiz_id,user_id,score\r\n"
+            f"{test_data['quiz_id']},{test_data['user_id']},{test_data['score']}\r\n"
+        )
+        mock_check_company_permissions.assert_awaited_once_with(
+            user_id=test_data["user_id"],
+            company_name=test_data["company_name"],
+            db=session,
+        )
+        mock_redis.zscan.assert_awaited_once_with(
+            RedisService.user_index(test_data["id_"]),
+            0,
+            match=f"quiz_result:{test_data['quiz_id']}:{test_data['id_']}:*",
+            count=500,
         )
 
 
 @pytest.mark.asyncio
-@patch("app.services.redis_service.RedisService.admin_get_cache_for_user")
+@patch("app.services.redis_service.RedisService.check_company_permissions")
+@patch("app.services.redis_service.redis_connect")
 async def test_export_cached_results_for_one_user_to_csv_no_cache(
-    mock_admin_get_cache_for_user, redis_service, test_data, get_db_fixture
+    mock_redis_connect, mock_check_company_permissions, test_data, get_db_fixture
 ):
-    redis_service = await redis_service
-
-    mock_admin_get_cache_for_user.return_value = None
+    mock_redis = AsyncMock()
+    mock_redis_connect.return_value = mock_redis
+    redis_service = RedisService()
+    expired = (b"quiz_result:123:1:1", time.time() - 60)
+    mock_redis.zscan.return_value = (0, [expired])
 
     async for session in get_db_fixture:
         with pytest.raises(HTTPException, match="Cache was not found"):
@@ -355,63 +425,60 @@ async def test_export_cached_results_for_one_user_to_csv_no_cache(
                 company_name=test_data["company_name"],
                 db=session,
             )
+        mock_redis.mget.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-@patch("app.services.redis_service.RedisService.admin_get_all_results_by_quiz_id")
-@patch("app.services.redis_service.open")
-@patch("app.services.redis_service.csv.writer")
+@patch("app.services.redis_service.RedisService.check_company_permissions")
+@patch("app.services.redis_service.redis_connect")
 async def test_export_all_cached_results_to_csv(
-    mock_csv_writer,
-    mock_open,
-    mock_admin_get_all_results_by_quiz_id,
-    redis_service,
+    mock_redis_connect,
+    mock_check_company_permissions,
     test_data,
     get_db_fixture,
 ):
-    redis_service = await redis_service
-
-    cache_data = [
-        {
-            "quiz_id": test_data["quiz_id"],
-            "user_id": test_data["user_id"],
-            "score": test_data["score"],
-        }
+    mock_redis = AsyncMock()
+    mock_redis_connect.return_value = mock_redis
+    redis_service = RedisService()
+    expires_at = time.time() + 60
+    mock_redis.zscan.side_effect = [
+        (7, [(b"quiz_result:123:1:1", expires_at)]),
+        (0, [(b"quiz_result:123:2:1", expires_at)]),
+    ]
+    mock_redis.mget.side_effect = [
+        [json.dumps({"quiz_id": 123, "user_id": 1, "score": 0.5})],
+        [json.dumps({"quiz_id": 123, "user_id": 2, "score": 1.0})],
     ]
-
-    mock_admin_get_all_results_by_quiz_id.return_value = cache_data
-
-    mock_file = MagicMock()
-    mock_open.return_value.__enter__.return_value = mock_file
-
-    mock_writer = MagicMock()
-    mock_csv_writer.return_value = mock_writer
 
     async for session in get_db_fixture:
-        result = await redis_service.export_all_cached_results_to_csv(
+        rows = await redis_service.export_all_cached_results_to_csv(
             user_id=test_data["user_id"],
             quiz_id=test_data["quiz_id"],
             company_name=test_data["company_name"],
             db=session,
         )
-        assert result == cache_data
-        mock_open.assert_called_once_with("cache.csv", "w", newline="")
 
-        expected_header = ["quiz_id", "user_id", "score"]
-        expected_row = [test_data["quiz_id"], test_data["user_id"], test_data["score"]]
-
-        mock_writer.writerow.assert_any_call(expected_header)
-        mock_writer.writerow.assert_any_call(expected_row)
-        assert mock_writer.writerow.call_count == 2
+        chunks = [chunk async for chunk in rows]
+        assert chunks == [
+            "quiz_id,user_id,score\r\n123,1,0.5\r\n",
+            "123,2,1.0\r\n",
+        ]
+        assert mock_redis.zscan.await_args_list[1].args == (
+            RedisService.quiz_index(test_data["quiz_id"]),
+            7,
+        )
 
 
 @pytest.mark.asyncio
-@patch("app.services.redis_service.RedisService.admin_get_all_results_by_quiz_id")
+@patch("app.services.redis_service.RedisService.check_company_permissions")
+@patch("app.services.redis_service.redis_connect")
 async def test_export_all_cached_results_to_csv_no_cache(
-    mock_admin_get_all_results_by_quiz_id, redis_service, test_data, get_db_fixture
+    mock_redis_connect, mock_check_company_permissions, test_data, get_db_fixture
 ):
-    redis_service = await redis_service
-    mock_admin_get_all_results_by_quiz_id.return_value = None
+    mock_redis = AsyncMock()
+    mock_redis_connect.return_value = mock_redis
+    redis_service = RedisService()
+    mock_redis.zscan.return_value = (0, [])
 
     async for session in get_db_fixture:
         with pytest.raises(HTTPException, match="Cache was not found"):
@@ -5,6 +5,7 @@ from app.db.models.request_model import RequestModel
 from app.db.models.company_model import CompanyModel
 from app.schemas.schemas import RequestCreateInSchema, MemberCreateSchema
 from app.services.request_service import RequestService
+from app.utils.pagination import PageParams
 from app.tests.conftest import get_db_fixture
 
 
@@ -15,9 +16,9 @@ async def request_service():
 
 @pytest.mark.asyncio
 @patch("app.CRUD.company_crud.company_crud.get_one")
-@patch("app.CRUD.request_crud.request_crud.get_all_by_filter")
+@patch("app.CRUD.request_crud.request_crud.get_page")
 async def test_owner_get_all_requests_success(
-    mock_get_all_by_filter, mock_get_one_company, request_service, get_db_fixture
+    mock_get_page, mock_get_one_company, request_service, get_db_fixture
 ):
     user_id = 1
     company_id = 1
@@ -34,24 +35,30 @@ async def test_owner_get_all_requests_success(
     ]
 
     mock_get_one_company.return_value = mock_company
-    mock_get_all_by_filter.return_value = mock_requests
+    mock_get_page.return_value = (mock_requests, None)
     request_service = await request_service
     async for db_session in get_db_fixture:
         result = await request_service.owner_get_all_requests(
-            user_id=user_id, company_id=company_id, db=db_session
+            user_id=user_id,
+            company_id=company_id,
+            page=PageParams(),
+            db=db_session,
         )
-        assert result == mock_requests
+        assert result == {"items": mock_requests, "next_cursor": None}
         mock_get_one_company.assert_called_once_with(id_=company_id, db=db_session)
-        mock_get_all_by_filter.assert_called_once_with(
-            filters={"company_id": company_id}, db=db_session
+        mock_get_page.assert_called_once_with(
+            db=db_session,
+            limit=50,
+            after_id=None,
+            filters={"company_id": company_id},
         )
 
 
 @pytest.mark.asyncio
 @patch("app.CRUD.company_crud.company_crud.get_one")
-@patch("app.CRUD.request_crud.request_crud.get_all_by_filter")
+@patch("app.CRUD.request_crud.request_crud.get_page")
 async def test_owner_get_all_requests_errors(
-    mock_get_all_by_filter, mock_get_one_company, request_service, get_db_fixture
+    mock_get_page, mock_get_one_company, request_service, get_db_fixture
 ):
     user_id = 1
     company_id = 1
@@ -60,7 +67,10 @@ async def test_owner_get_all_requests_errors(
     async for db_session in get_db_fixture:
         with pytest.raises(HTTPException) as exc_info:
             await request_service.owner_get_all_requests(
-                user_id=user_id, company_id=company_id, db=db_session
+                user_id=user_id,
+                company_id=company_id,
+                page=PageParams(),
+                db=db_session,
             )
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == "Such a company does not exist"
@@ -77,13 +87,16 @@ async def test_owner_get_all_requests_errors(
     async for db_session in get_db_fixture:
         with pytest.raises(HTTPException) as exc_info:
             await request_service.owner_get_all_requests(
-                user_id=user_id, company_id=company_id, db=db_session
+                user_id=user_id,
+                company_id=company_id,
+                page=PageParams(),
+                db=db_session,
             )
         assert exc_info.value.status_code == 403
         assert exc_info.value.detail == "You do not own the company to get the requests"
         mock_get_one_company.assert_called_once_with(id_=company_id, db=db_session)
     mock_get_one_company.reset_mock()
-    mock_get_all_by_filter.reset_mock()
+    mock_get_page.reset_mock()
     mock_company = CompanyModel(
         id=company_id,
         owner_id=user_id,
@@ -96,16 +109,22 @@ async def test_owner_get_all_requests_errors(
         RequestModel(id=2, company_id=company_id, sender_id=3),
     ]
     mock_get_one_company.return_value = mock_company
-    mock_get_all_by_filter.return_value = mock_requests
+    mock_get_page.return_value = (mock_requests, None)
 
     async for db_session in get_db_fixture:
         result = await request_service.owner_get_all_requests(
-            user_id=user_id, company_id=company_id, db=db_session
+            user_id=user_id,
+            company_id=company_id,
+            page=PageParams(),
+            db=db_session,
         )
-        assert result == mock_requests
+        assert result == {"items": mock_requests, "next_cursor": None}
         mock_get_one_company.assert_called_once_with(id_=company_id, db=db_session)
-        mock_get_all_by_filter.assert_called_once_with(
-            filter={"company_id": company_id}
+        mock_get_page.assert_called_once_with(
+            db=db_session,
+            limit=50,
+            after_id=None,
+            filters={"company_id": company_id},
         )
 
 
@@ -0,0 +1,34 @@
+from unittest.mock import patch
+from app import server
+
+
+@patch("app.server.settings.web_concurrency", 4)
+@patch("app.server.settings.db_pool_size", 20)
+@patch("app.server.settings.db_max_overflow", 10)
+@patch("app.server.settings.redis_max_connections", 50)
+def test_per_worker_env():
+    assert server.worker_count() == 4
+    assert server.per_worker_env(4) == {
+        "DB_POOL_SIZE": "5",
+        "DB_MAX_OVERFLOW": "2",
+        "REDIS_MAX_CONNECTIONS": "12",
+    }
+    assert server.per_worker_env(64)["DB_POOL_SIZE"] == "1"
+
+
+@patch.dict("os.environ", {})
+@patch("app.server.uvicorn.run")
+@patch("app.server.settings.web_concurrency", 2)
+def test_main(mock_run):
+    server.main()
+
+    kwargs = mock_run.call_args.kwargs
+    assert mock_run.call_args.args == ("app.main:app",)
+    assert kwargs["workers"] == 2
+    assert (
+        kwargs["timeout_graceful_shutdown"] == server.settings.graceful_shutdown_timeout
+    )
+    assert int(server.os.environ["DB_POOL_SIZE"]) == max(
+        1, server.settings.db_pool_size // 2
+    )
+    assert server.os.environ["WEB_CONCURRENCY"] == "2"
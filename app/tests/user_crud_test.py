@@ -43,8 +43,7 @@ async def test_get_one_success(user_crud, get_db_fixture):
 
 
 @pytest.mark.asyncio
-@patch("app.CRUD.user_crud.UserCrud.get_one", new_callable=AsyncMock)
-async def test_delete_user_success(mock_get_one, user_crud, get_db_fixture):
+async def test_delete_user_success(user_crud, get_db_fixture):
     user_id = 1
     mock_user = UserModel(
         id=user_id,
@@ -52,19 +51,35 @@ async def test_delete_user_success(mock_get_one, user_crud, get_db_fixture):
         email="test@example.com",
         hashed_password="hashed_password",
     )
-    mock_get_one.return_value = mock_user
     async for db_session in get_db_fixture:
-        db_session.execute = AsyncMock()
+        db_session.scalar.return_value = mock_user
         db_session.commit = AsyncMock()
         result = await user_crud.delete(id_=user_id, db=db_session)
         assert result == mock_user
-        db_session.execute.assert_called_once()
+        stmt = db_session.scalar.await_args.args[0]
+        assert str(stmt).startswith('DELETE FROM "user" WHERE "user".id = ')
+        assert "RETURNING" in str(stmt)
         db_session.commit.assert_called_once()
 
 
 @pytest.mark.asyncio
-@patch("app.CRUD.user_crud.UserCrud.get_one", new_callable=AsyncMock)
-async def test_add_user_success(mock_get_one, user_crud, get_db_fixture):
+@patch("app.CRUD.user_crud.user_identity_cache.invalidate", new_callable=AsyncMock)
+async def test_delete_user_invalidates_identity_cache(
+    mock_invalidate, user_crud, get_db_fixture
+):
+    async for db_session in get_db_fixture:
+        db_session.scalar.return_value = UserModel(id=1, email="test@example.com")
+        await user_crud.delete(id_=1, db=db_session)
+        mock_invalidate.assert_awaited_once_with(user_id=1, email="test@example.com")
+
+        mock_invalidate.reset_mock()
+        db_session.scalar.return_value = None
+        await user_crud.delete(id_=1, db=db_session)
+        mock_invalidate.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_add_user_success(user_crud, get_db_fixture):
     user_data = {
         "id": 1,
         "username": "test_user",
@@ -73,23 +88,22 @@ async def test_add_user_success(mock_get_one, user_crud, get_db_fixture):
     }
     user_create_schema = UserCreateSchema(**user_data)
     async for db_session in get_db_fixture:
-        db_session.execute = AsyncMock()
         db_session.commit = AsyncMock()
         hashed_password = pwd_context.hash(user_data.pop("password"))
-        mock_get_one.return_value = UserModel(
+        db_session.scalar.return_value = UserModel(
             **user_data, hashed_password=hashed_password
         )
         result = await user_crud.add(data=user_create_schema, db=db_session)
         assert result.id == 1
         assert result.username == "test_user"
         assert result.hashed_password == hashed_password
-        db_session.execute.assert_called_once()
+        db_session.scalar.assert_called_once()
+        assert "RETURNING" in str(db_session.scalar.await_args.args[0])
         db_session.commit.assert_called_once()
 
 
 @pytest.mark.asyncio
-@patch("app.CRUD.user_crud.UserCrud.get_one", new_callable=AsyncMock)
-async def test_add_user_failure(mock_get_one, user_crud, get_db_fixture):
+async def test_add_user_failure(user_crud, get_db_fixture):
     user_data = {
         "id": 1,
         "username": "test_user",
@@ -97,10 +111,9 @@ async def test_add_user_failure(mock_get_one, user_crud, get_db_fixture):
         "email": "test@example.com",
     }
     user_create_schema = UserCreateSchema(**user_data)
-    mock_get_one.return_value = None
 
     async for db_session in get_db_fixture:
-        db_session.execute = AsyncMock()
+        db_session.scalar.return_value = None
         db_session.commit = AsyncMock()
         with pytest.raises(HTTPException) as exc_info:
             await user_crud.add(data=user_create_schema, db=db_session)
@@ -167,7 +180,7 @@ async def test_update_user_database_error(mock_logger, get_db_fixture, user_crud
         raise Exception("Database error")
 
     db_session = AsyncMock()
-    db_session.execute = AsyncMock(side_effect=mock_execute_raise_exception)
+    db_session.scalar = AsyncMock(side_effect=mock_execute_raise_exception)
 
     user_data = {
         "username": "updated_user",
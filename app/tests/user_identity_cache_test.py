@@ -0,0 +1,120 @@
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+import pytest
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from app.autho.autho import create_access_token
+from app.db.models.user_model import UserModel
+from app.services.user_identity_cache import UserIdentityCache
+from app.utils.deps import get_current_user
+
+
+@pytest.fixture
+def user():
+    return UserModel(
+        id=1,
+        username="user1",
+        hashed_password="hashed",
+        email="user1@example.com",
+        registration_date=datetime(2024, 1, 1),
+    )
+
+
+@pytest.mark.asyncio
+async def test_set_get_and_invalidate(user):
+    cache = UserIdentityCache()
+    assert cache.redis is None
+
+    assert await cache.get("id:1") is None
+    await cache.set("id:1", user)
+    await cache.set("email:user1@example.com", user)
+    cached = await cache.get("id:1")
+
+    assert cached is not user
+    assert cached.id == 1
+    assert cached.email == "user1@example.com"
+    assert cached.registration_date == datetime(2024, 1, 1)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert "hashed_password" not in cache.local.get("id:1")
+    assert cached.hashed_password is None
+
+    await cache.invalidate(user_id=1, email="user1@example.com")
+    assert await cache.get("id:1") is None
+    assert await cache.get("email:user1@example.com") is None
+
+
+@pytest.mark.asyncio
+@patch("app.services.user_identity_cache.redis_connect")
+@patch("app.services.user_identity_cache.settings.user_cache_redis", True)
+async def test_redis_backing(mock_redis_connect, user):
+    mock_redis = AsyncMock()
+    mock_redis_connect.return_value = mock_redis
+    cache = UserIdentityCache()
+
+    await cache.set("id:1", user)
+    key, payload = mock_redis.set.await_args.args
+    assert key == "user_identity:id:1"
+    assert "hashed_password" not in json.loads(payload)
+
+    cache.local.clear()
+    mock_redis.get.return_value = payload
+    cached = await cache.get("id:1")
+    assert cached.username == "user1"
+    assert cache.stats()["redis_hits"] == 1
+    assert len(cache.local) == 1
+
+    await cache.invalidate(user_id=1, email="user1@example.com")
+    mock_redis.delete.assert_awaited_once_with(
+        "user_identity:id:1", "user_identity:email:user1@example.com"
+    )
+
+
+@pytest.mark.asyncio
+@patch("app.utils.deps.user_identity_cache", new_callable=UserIdentityCache)
+async def test_get_current_user_skips_db_on_cached_id(mock_cache, user, get_db_fixture):
+    token = create_access_token({"id": 1, "email": "user1@example.com"})
+    async for db in get_db_fixture:
+        db.scalar.return_value = user
+
+        first = await get_current_user(token=token, db=db)
+        second = await get_current_user(token=token, db=db)
+
+        assert first is not user
+        assert second.id == 1
+        db.scalar.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("app.utils.deps.user_identity_cache", new_callable=UserIdentityCache)
+async def test_get_current_user_same_payload_on_hit_and_miss(
+    mock_cache, user, get_db_fixture
+):
+    token = create_access_token({"id": 1, "email": "user1@example.com"})
+    async for db in get_db_fixture:
+        db.scalar.return_value = user
+
+        miss = jsonable_encoder(await get_current_user(token=token, db=db))
+        hit = jsonable_encoder(await get_current_user(token=token, db=db))
+
+        assert miss == hit
+        assert miss["email"] == "user1@example.com"
+        assert "hashed_password" not in miss
+
+
+@pytest.mark.asyncio
+@patch("app.utils.deps.user_identity_cache", new_callable=UserIdentityCache)
+async def test_get_current_user_rechecks_changed_email(
+    mock_cache, user, get_db_fixture
+):
+    await mock_cache.set("id:1", user)
+    token = create_access_token({"id": 1, "email": "renamed@example.com"})
+    async for db in get_db_fixture:
+        db.scalar.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(token=token, db=db)
+
+        assert exc_info.value.status_code == 401
+        db.scalar.assert_awaited_once()
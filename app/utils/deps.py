@@ -9,6 +9,7 @@ from starlette import status
 from app.core.config import settings
 from app.db.base import session
 from app.db.models.user_model import UserModel
+from app.services.user_identity_cache import user_identity_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/token/login/")
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -40,9 +41,16 @@ async def get_current_user(
     except JWTError as e:
         raise HTTPException(status_code=404, detail=f"JWT Error: {str(e)}")
 
+    subject = user_identity_cache.subject(payload)
+    user = await user_identity_cache.get(subject)
+    if user is not None and user.email == email:
+        return user
+
     stmt = select(UserModel).where(UserModel.email == email)
     user = await db.scalar(stmt)
     if user is None:
         raise credentials_exception
 
-    return user
+    # Return the cached projection on a miss too, so the user serialises the
+    # same way, without the password hash, whatever the cache state.
+    return await user_identity_cache.set(subject, user)
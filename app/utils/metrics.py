@@ -0,0 +1,106 @@
+import os
+import time
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class HttpMetrics:
+    def __init__(self, registry: CollectorRegistry):
+        self.in_progress = Gauge(
+            "http_requests_in_progress",
+            "HTTP requests currently being served.",
+            ["method"],
+            registry=registry,
+            multiprocess_mode="livesum",
+        )
+        self.duration = Histogram(
+            "http_request_duration_seconds",
+            "Time spent serving HTTP requests, by route template.",
+            ["method", "route"],
+            registry=registry,
+            buckets=LATENCY_BUCKETS,
+        )
+        self.responses = Counter(
+            "http_responses_total",
+            "HTTP responses sent, by route template and status code.",
+            ["method", "route", "status"],
+            registry=registry,
+        )
+
+
+http_metrics = HttpMetrics(REGISTRY)
+
+
+class MetricsMiddleware:
+    """Records latency, in-flight count and status codes of every HTTP request.
+
+    Requests are labelled by the template of the route that handled them
+    (``/quiz_result_router/company/{company_id}``), never by the raw path, so
+    the number of series stays bounded. Requests no route matched share the
+    ``unmatched`` label.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: HttpMetrics = http_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = self.metrics.in_progress.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            route = scope.get("route")
+            route = getattr(route, "path", None) or "unmatched"
+            self.metrics.duration.labels(method, route).observe(elapsed)
+            self.metrics.responses.labels(method, route, str(status)).inc()
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Expose the default registry, or all workers' samples when uvicorn runs
+    with several workers and PROMETHEUS_MULTIPROC_DIR is set."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
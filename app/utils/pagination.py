@@ -0,0 +1,85 @@
+import base64
+import binascii
+import json
+from typing import Annotated, AsyncIterator, Optional
+from fastapi import HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.base import session
+from app.repositories.crud_repository import CrudRepository
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class PageParams:
+    """Query parameters shared by every list endpoint.
+
+    ``cursor`` is the opaque ``next_cursor`` of the previous page. With
+    ``stream=true`` the whole result set is sent as NDJSON instead.
+    """
+
+    def __init__(
+        self,
+        limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        stream: bool = False,
+    ):
+        self.limit = limit
+        self.cursor = cursor
+        self.stream = stream
+
+
+def encode_cursor(id_: int, **values) -> str:
+    """Pack the keyset position of the last row into an opaque cursor."""
+    payload = json.dumps({"id": id_, **values}, default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor_values(cursor: str) -> dict:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, dict) or "id" not in values:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        return int(decode_cursor_values(cursor)["id"])
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def stream_ndjson(
+    crud: CrudRepository, filters: Optional[dict] = None
+) -> AsyncIterator[str]:
+    # The request session is closed before a streamed body is sent,
+    # so the stream reads through a session of its own.
+    async with session() as db:
+        async for item in crud.stream_all(db=db, filters=filters):
+            yield json.dumps(jsonable_encoder(item)) + "\n"
+
+
+async def paginate(
+    crud: CrudRepository,
+    db: AsyncSession,
+    page: PageParams,
+    filters: Optional[dict] = None,
+):
+    if page.stream:
+        return StreamingResponse(
+            stream_ndjson(crud=crud, filters=filters),
+            media_type="application/x-ndjson",
+        )
+    after_id = decode_cursor(page.cursor) if page.cursor else None
+    items, last_id = await crud.get_page(
+        db=db, limit=page.limit, after_id=after_id, filters=filters
+    )
+    return {
+        "items": items,
+        "next_cursor": encode_cursor(last_id) if last_id is not None else None,
+    }
@@ -0,0 +1,96 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the statements executed, on any engine, inside the block.
+
+    The stats object is shared rather than copied, so statements run from a
+    greenlet or a worker thread started inside the block are counted too.
+    """
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = conn.info.get("query_started")
+    if stats is None or not started:
+        return
+    stats.count += 1
+    stats.duration += time.perf_counter() - started.pop()
+
+
+class QueryCountMiddleware:
+    """Reports the statements and database time of every HTTP request.
+
+    Both are sent as a ``Server-Timing`` header, which browsers' dev tools
+    display next to the request. Requests running more than
+    ``settings.query_budget`` statements are logged as warnings.
+    """
+
+    def __init__(self, app: ASGIApp, budget: Optional[int] = None):
+        self.app = app
+        self.budget = settings.query_budget if budget is None else budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"',
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                if stats.count > self.budget:
+                    route = getattr(scope.get("route"), "path", scope["path"])
+                    logger.warning(
+                        "%s %s ran %d queries (budget %d) in %.1f ms",
+                        scope["method"],
+                        route,
+                        stats.count,
+                        self.budget,
+                        stats.duration * 1000,
+                    )
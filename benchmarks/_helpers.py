@@ -0,0 +1,45 @@
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable
+
+
+class RoundTripCounter:
+    """Simulates the network latency of one database or Redis round-trip."""
+
+    def __init__(self, latency_ms: float):
+        self.latency = latency_ms / 1000
+        self.count = 0
+
+    async def round_trip(self) -> None:
+        self.count += 1
+        await asyncio.sleep(self.latency)
+
+
+def percentile(samples: list[float], pct: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+async def measure(
+    func: Callable[[], Awaitable], iterations: int, warmup: int = 3
+) -> list[float]:
+    for _ in range(warmup):
+        await func()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def print_table(headers: list[str], rows: list[list]) -> None:
+    widths = [
+        max(len(str(headers[i])), *(len(f"{row[i]}") for row in rows))
+        for i in range(len(headers))
+    ]
+    print("  ".join(str(h).rjust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(f"{value}".rjust(w) for value, w in zip(row, widths)))
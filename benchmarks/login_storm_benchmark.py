@@ -0,0 +1,97 @@
+"""Latency of a non-login request while a burst of logins is being verified.
+
+A probe coroutine stands in for any other endpoint: it repeatedly yields to
+the event loop and records how long it took to be scheduled again. Meanwhile
+--logins concurrent logins verify a bcrypt password, either inline on the
+event loop (as authenticate_user used to) or through the PasswordHasher pool.
+
+Usage (the usual application environment variables must be set):
+    python -m benchmarks.login_storm_benchmark --logins 50 --workers 4
+"""
+
+import argparse
+import asyncio
+import time
+from fastapi import HTTPException
+from app.services.password_hasher import PasswordHasher
+from app.utils.deps import pwd_context
+from benchmarks._helpers import percentile, print_table
+
+PROBE_INTERVAL_MS = 5
+
+
+async def probe(stop: asyncio.Event, samples: list[float]) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL_MS / 1000)
+        samples.append((time.perf_counter() - started) * 1000 - PROBE_INTERVAL_MS)
+
+
+async def storm(verify, logins: int, hashed: str) -> tuple[list[float], int, float]:
+    samples: list[float] = []
+    stop = asyncio.Event()
+    prober = asyncio.create_task(probe(stop, samples))
+    rejected = 0
+    started = time.perf_counter()
+
+    async def login():
+        nonlocal rejected
+        try:
+            await verify("password", hashed)
+        except HTTPException:
+            rejected += 1
+
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await prober
+    return samples, rejected, elapsed
+
+
+async def run(logins: int, workers: int, queue_limit: int) -> None:
+    hashed = pwd_context.hash("password")
+    hasher = PasswordHasher(workers=workers, queue_limit=queue_limit)
+
+    async def inline(password: str, hashed_password: str) -> bool:
+        return pwd_context.verify(password, hashed_password)
+
+    rows = []
+    for name, verify in (("inline", inline), ("pool", hasher.verify)):
+        samples, rejected, elapsed = await storm(verify, logins, hashed)
+        rows.append(
+            [
+                name,
+                logins,
+                rejected,
+                f"{elapsed:.2f}",
+                f"{percentile(samples, 50):.2f}" if samples else "-",
+                f"{percentile(samples, 99):.2f}" if samples else "-",
+                f"{max(samples):.2f}" if samples else "-",
+            ]
+        )
+    hasher.executor.shutdown()
+    print_table(
+        [
+            "verify",
+            "logins",
+            "rejected",
+            "storm s",
+            "probe p50 ms",
+            "probe p99 ms",
+            "probe max ms",
+        ],
+        rows,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue-limit", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(run(args.logins, args.workers, args.queue_limit))
+
+
+if __name__ == "__main__":
+    main()
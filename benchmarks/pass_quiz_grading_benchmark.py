@@ -0,0 +1,140 @@
+"""Compare the per-option lookup loop of pass_quiz with the grading engine.
+
+Each database round-trip is simulated with a fixed latency, so the benchmark
+runs without Postgres and shows how latency scales with the quiz size.
+
+Usage (the usual application environment variables must be set):
+    python -m benchmarks.pass_quiz_grading_benchmark --latency-ms 0.5
+"""
+
+import argparse
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+from fastapi import HTTPException
+from app.CRUD.option_crud import option_crud
+from app.db.models.option_model import OptionModel
+from app.db.models.question_model import QuestionModel
+from app.db.models.quiz_model import QuizModel
+from app.services.answer_key_service import AnswerKeyService
+from app.services.grading_service import grading_service
+from benchmarks._helpers import RoundTripCounter, measure, percentile, print_table
+
+OPTIONS_PER_QUESTION = 4
+
+
+def build_quiz(questions: int) -> QuizModel:
+    return QuizModel(
+        id=1,
+        company_id=1,
+        name="Benchmark quiz",
+        description="Benchmark quiz",
+        questions=[
+            QuestionModel(
+                id=q,
+                text=f"Question {q}",
+                options=[
+                    OptionModel(
+                        id=q * OPTIONS_PER_QUESTION + o,
+                        text=f"Option {o}",
+                        is_correct=o == 0,
+                        question_id=q,
+                    )
+                    for o in range(OPTIONS_PER_QUESTION)
+                ],
+            )
+            for q in range(1, questions + 1)
+        ],
+    )
+
+
+async def legacy_grade(quiz: QuizModel, options_ids: list[int], db=None) -> float:
+    right_answers = 0
+    user_answers = {}
+    for question, provided_option in zip(quiz.questions, options_ids):
+        option = await option_crud.get_one(id_=provided_option, db=db)
+        if option is None:
+            raise HTTPException(status_code=404, detail="No such option")
+        if option.question_id != question.id:
+            raise HTTPException(status_code=403, detail="Wrong question")
+        if option.is_correct is True:
+            right_answers += 1
+        user_answers[question.id] = {
+            f"provided_option_{question.id}": provided_option,
+            f"is_correct_{question.id}": option.is_correct,
+        }
+    return round(right_answers / len(quiz.questions), 2)
+
+
+async def engine_grade(quiz: QuizModel, options_ids: list[int], db=None) -> float:
+    rows = [
+        SimpleNamespace(
+            company_id=quiz.company_id,
+            name=quiz.name,
+            description=quiz.description,
+            question_id=question.id,
+            question_text=question.text,
+            option_id=option.id,
+            is_correct=option.is_correct,
+        )
+        for question in quiz.questions
+        for option in question.options
+    ]
+    answer_key = AnswerKeyService.from_rows(quiz_id=quiz.id, rows=rows)
+    score, _, _ = await grading_service.grade(
+        answer_key=answer_key, options_ids=options_ids, db=db
+    )
+    return score
+
+
+async def run(sizes: list[int], iterations: int, latency_ms: float) -> None:
+    counter = RoundTripCounter(latency_ms)
+    rows = []
+    for size in sizes:
+        quiz = build_quiz(size)
+        options = {
+            option.id: option
+            for question in quiz.questions
+            for option in question.options
+        }
+        options_ids = [question.options[0].id for question in quiz.questions]
+
+        async def get_one(id_, db):
+            await counter.round_trip()
+            return options.get(id_)
+
+        async def get_all_by_ids(ids, db):
+            await counter.round_trip()
+            return [options[id_] for id_ in ids if id_ in options]
+
+        with patch.object(option_crud, "get_one", get_one), patch.object(
+            option_crud, "get_all_by_ids", get_all_by_ids
+        ):
+            for name, grade in (("loop", legacy_grade), ("engine", engine_grade)):
+                counter.count = 0
+                samples = await measure(
+                    lambda: grade(quiz, options_ids), iterations=iterations, warmup=0
+                )
+                rows.append(
+                    [
+                        size,
+                        name,
+                        counter.count // iterations,
+                        f"{percentile(samples, 50):.2f}",
+                        f"{percentile(samples, 99):.2f}",
+                    ]
+                )
+    print_table(["questions", "path", "round-trips", "p50 ms", "p99 ms"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes, args.iterations, args.latency_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Insert latency of a quiz tree: per-row flushes against batched inserts.
+
+For every quiz size a quiz with that many questions (--options each) is
+written both the old way, with a flush after every question and option, and
+through QuizService.insert_questions. Each attempt runs in its own
+transaction, which is rolled back, so the database is left unchanged; the
+company given by --company-id must exist.
+
+Usage (the usual application environment variables must be set):
+    python -m benchmarks.quiz_create_benchmark --company-id 1
+"""
+
+import argparse
+import asyncio
+from app.db.base import engine, session
+from app.db.models.option_model import OptionModel
+from app.db.models.question_model import QuestionModel
+from app.db.models.quiz_model import QuizModel
+from app.schemas.schemas import OptionCreateSchema, QuestionCreateSchema
+from app.services.quiz_service import QuizService
+from app.utils.query_counter import track_queries
+from benchmarks._helpers import measure, percentile, print_table
+
+
+def build_questions(size: int, options: int) -> list[QuestionCreateSchema]:
+    return [
+        QuestionCreateSchema(
+            text=f"Question {q}",
+            options=[
+                OptionCreateSchema(text=f"Option {o}", is_correct=o == 0)
+                for o in range(options)
+            ],
+        )
+        for q in range(size)
+    ]
+
+
+async def legacy_insert(quiz_id: int, questions: list[QuestionCreateSchema], db):
+    for question_data in questions:
+        new_question = QuestionModel(text=question_data.text, quiz_id=quiz_id)
+        db.add(new_question)
+        await db.flush()
+        for option_data in question_data.options:
+            db.add(
+                OptionModel(
+                    text=option_data.text,
+                    is_correct=option_data.is_correct,
+                    question_id=new_question.id,
+                )
+            )
+            await db.flush()
+
+
+async def create_quiz(company_id: int, questions: list, insert) -> int:
+    async with session() as db:
+        try:
+            quiz = QuizModel(
+                company_id=company_id, name="Benchmark quiz", description=""
+            )
+            db.add(quiz)
+            await db.flush()
+            with track_queries() as stats:
+                await insert(quiz_id=quiz.id, questions=questions, db=db)
+            return stats.count
+        finally:
+            await db.rollback()
+
+
+async def run(company_id: int, sizes: list[int], options: int, iterations: int) -> None:
+    rows = []
+    try:
+        for size in sizes:
+            questions = build_questions(size, options)
+            for name, insert in (
+                ("flush", legacy_insert),
+                ("batched", QuizService.insert_questions),
+            ):
+                statements = await create_quiz(company_id, questions, insert)
+                samples = await measure(
+                    lambda: create_quiz(company_id, questions, insert),
+                    iterations=iterations,
+                    warmup=1,
+                )
+                rows.append(
+                    [
+                        size,
+                        size * options,
+                        name,
+                        statements,
+                        f"{percentile(samples, 50):.1f}",
+                        f"{percentile(samples, 99):.1f}",
+                    ]
+                )
+    finally:
+        await engine.dispose()
+    print_table(
+        ["questions", "options", "path", "statements", "p50 ms", "p99 ms"], rows
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--company-id", type=int, required=True)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 50, 100, 500, 1000]
+    )
+    parser.add_argument("--options", type=int, default=4)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.company_id, args.sizes, args.options, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
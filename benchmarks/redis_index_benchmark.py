@@ -0,0 +1,122 @@
+"""Lookup latency of cached quiz results as the Redis keyspace grows.
+
+Populates a dedicated Redis database with up to --results cached results
+(written with the same commands as RedisService.cache_quiz_result) and, at
+every checkpoint, measures RedisService.user_get_its_result, which reads the
+per-user index, against the old KEYS scan.
+
+The selected database is flushed before and after the run.
+
+Usage (the usual application environment variables must be set):
+    python -m benchmarks.redis_index_benchmark --results 1000000 --db 15
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import redis.asyncio as redis
+from app.core.config import settings
+from app.services.redis_service import RedisService
+from benchmarks._helpers import measure, percentile, print_table
+
+RESULTS_PER_USER = 10
+BATCH_SIZE = 5000
+
+
+async def legacy_user_lookup(client: redis.Redis, user_id: int) -> list:
+    keys = await client.keys(f"quiz_result:*:{user_id}:*")
+    cache = await client.mget(keys)
+    return [json.loads(value) for value in cache]
+
+
+async def populate(service: RedisService, start: int, stop: int) -> None:
+    for batch_start in range(start, stop, BATCH_SIZE):
+        pipe = service.redis.pipeline(transaction=False)
+        now = time.time()
+        for n in range(batch_start, min(batch_start + BATCH_SIZE, stop)):
+            service.queue_quiz_result(
+                pipe=pipe,
+                data={
+                    "quiz_id": n % RESULTS_PER_USER,
+                    "user_id": n // RESULTS_PER_USER,
+                    "company_id": n // (RESULTS_PER_USER * 100),
+                    "score": 1.0,
+                },
+                now=now,
+            )
+        await pipe.execute()
+
+
+async def run(
+    results: int, checkpoints: list[int], iterations: int, db: int, keys_limit: int
+) -> None:
+    client = redis.Redis(host=settings.redis_host, port=settings.redis_port, db=db)
+    service = RedisService()
+    service.redis = client
+    await client.flushdb()
+    rows = []
+    populated = 0
+    try:
+        for checkpoint in [c for c in checkpoints if c <= results]:
+            await populate(service, populated, checkpoint)
+            populated = checkpoint
+            users = populated // RESULTS_PER_USER
+
+            async def indexed():
+                await service.user_get_its_result(user_id=users // 2)
+
+            samples = await measure(indexed, iterations=iterations)
+            rows.append(
+                [
+                    populated,
+                    "index",
+                    f"{percentile(samples, 50):.3f}",
+                    f"{percentile(samples, 99):.3f}",
+                ]
+            )
+            if populated <= keys_limit:
+
+                async def scanned():
+                    await legacy_user_lookup(client, users // 2)
+
+                samples = await measure(scanned, iterations=min(iterations, 20))
+                rows.append(
+                    [
+                        populated,
+                        "KEYS",
+                        f"{percentile(samples, 50):.3f}",
+                        f"{percentile(samples, 99):.3f}",
+                    ]
+                )
+    finally:
+        await client.flushdb()
+        await client.aclose()
+    print_table(["cached results", "lookup", "p50 ms", "p99 ms"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--results", type=int, default=1_000_000)
+    parser.add_argument(
+        "--checkpoints",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+    )
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--db", type=int, default=15)
+    parser.add_argument(
+        "--keys-limit",
+        type=int,
+        default=1_000_000,
+        help="skip the KEYS comparison above this many cached results",
+    )
+    args = parser.parse_args()
+    asyncio.run(
+        run(args.results, args.checkpoints, args.iterations, args.db, args.keys_limit)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,131 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import random
+from typing import Optional
+from app.core.config import Settings, settings
 
-LOGGING_CONFIG = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "standard": {"format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s"},
-    },
-    "handlers": {
-        "console": {
-            "level": "DEBUG",
-            "class": "logging.StreamHandler",
-            "formatter": "standard",
-        },
-        "file": {
-            "level": "DEBUG",
-            "class": "logging.FileHandler",
-            "formatter": "standard",
-            "filename": "app.log",
-        },
-    },
-    "loggers": {
-        "": {"handlers": ["console", "file"], "level": "DEBUG", "propagate": True},
-        "uvicorn.error": {
-            "level": "INFO",
-            "handlers": ["console", "file"],
-            "propagate": True,
-        },
-        "uvicorn.access": {
-            "level": "INFO",
-            "handlers": ["console", "file"],
-            "propagate": False,
-        },
-    },
-}
-
-logging.config.dictConfig(LOGGING_CONFIG)
+STANDARD_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps only a fraction of the records below WARNING of noisy loggers.
+
+    Rates are looked up by the longest matching logger-name prefix, so
+    ``{"sqlalchemy": 0.1}`` also samples ``sqlalchemy.engine.Engine``.
+    """
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = rates
+
+    def rate(self, name: str) -> float:
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rate(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Puts records on the queue as they are.
+
+    The stock ``prepare`` formats the record on the calling thread and drops
+    ``exc_info``; here message interpolation and traceback rendering are left
+    to the listener's formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
+
+def log_file_handler(config: Settings) -> logging.Handler:
+    """Rotating handlers rename the file they write to, which is only safe
+    while a single process writes it. With several uvicorn workers each
+    process writes its own ``app.<pid>.log`` instead and rotation is left to
+    an external tool such as logrotate; WatchedFileHandler reopens the file
+    once it has been moved away."""
+    if config.web_concurrency > 1:
+        root, ext = os.path.splitext(config.log_file)
+        return logging.handlers.WatchedFileHandler(f"{root}.{os.getpid()}{ext}")
+    if config.log_rotation == "time":
+        return logging.handlers.TimedRotatingFileHandler(
+            config.log_file,
+            when=config.log_rotation_when,
+            backupCount=config.log_backup_count,
+        )
+    return logging.handlers.RotatingFileHandler(
+        config.log_file,
+        maxBytes=config.log_max_bytes,
+        backupCount=config.log_backup_count,
+    )
+
+
+def build_pipeline(
+    config: Settings,
+) -> tuple[DeferredQueueHandler, logging.handlers.QueueListener]:
+    """Loggers only put records on a queue; formatting and I/O happen on the
+    listener thread, off the event loop."""
+    formatter = (
+        JsonFormatter() if config.log_json else logging.Formatter(STANDARD_FORMAT)
+    )
+    handlers: list[logging.Handler] = [logging.StreamHandler()]
+    if config.log_file:
+        handlers.append(log_file_handler(config))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(config.log_sample_rates))
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    return queue_handler, listener
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(config: Settings = settings) -> logging.handlers.QueueListener:
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    queue_handler, _listener = build_pipeline(config)
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(config.log_level)
+    # uvicorn installs its own handlers; route its records through the queue.
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        logger = logging.getLogger(name)
+        logger.handlers.clear()
+        logger.propagate = True
+    for name, level in config.log_levels.items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
@@ -9,6 +9,12 @@ function start_celery_worker() {
     WORKER_PID=$!
 }
 
+function start_quiz_import_worker() {
+    echo "Starting quiz import worker..."
+    exec celery -A app.celery_app:app --broker "$REDIS_URL" --result-backend "$REDIS_URL" worker -Q quiz_imports --concurrency="${QUIZ_IMPORT_CONCURRENCY:-2}" -n quiz_imports@%h --loglevel=info -E &
+    IMPORT_WORKER_PID=$!
+}
+
 function start_celery_beat() {
     echo "Starting Celery beat..."
     exec celery -A app.celery_app:app --broker "$REDIS_URL" --result-backend "$REDIS_URL" beat --loglevel=info &
@@ -17,18 +23,19 @@ function start_celery_beat() {
 
 function start_uvicorn() {
     echo "Starting Uvicorn server..."
-    exec uvicorn app.main:app --host 0.0.0.0 --port 8002 &
+    UVICORN_HOST=0.0.0.0 UVICORN_PORT=8002 exec python -m app.server &
     UVICORN_PID=$!
 }
 
 function stop_services() {
     echo "Stopping services..."
-    kill $UVICORN_PID $BEAT_PID $WORKER_PID
+    kill $UVICORN_PID $BEAT_PID $WORKER_PID $IMPORT_WORKER_PID
 }
 
 trap stop_services SIGTERM SIGINT
 
 start_celery_worker
+start_quiz_import_worker
 start_celery_beat
 start_uvicorn
 